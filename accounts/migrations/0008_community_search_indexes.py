@@ -0,0 +1,62 @@
+# Generated by Django 6.0 on 2026-10-18 12:05
+
+from django.db import DatabaseError, migrations, transaction
+
+SEARCH_FIELDS = ("username", "first_name", "last_name")
+
+PREFIX_INDEXES = [
+    f"CREATE INDEX IF NOT EXISTS users_{field}_lower_prefix "
+    f"ON users (lower({field}) text_pattern_ops)"
+    for field in SEARCH_FIELDS
+]
+
+TRIGRAM_INDEXES = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+    f"CREATE INDEX IF NOT EXISTS users_{field}_lower_trgm "
+    f"ON users USING GIN (lower({field}) gin_trgm_ops)"
+    for field in SEARCH_FIELDS
+]
+
+DROP_INDEXES = [
+    f"DROP INDEX IF EXISTS users_{field}_lower_{kind}"
+    for field in SEARCH_FIELDS
+    for kind in ("prefix", "trgm")
+]
+
+
+def install_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for sql in PREFIX_INDEXES:
+        schema_editor.execute(sql, params=None)
+
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            for sql in TRIGRAM_INDEXES:
+                schema_editor.execute(sql, params=None)
+    except DatabaseError:
+        # pg_trgm not available (e.g. no privilege to create the
+        # extension): substring searches run without an index
+        pass
+
+
+def uninstall_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for sql in DROP_INDEXES:
+        schema_editor.execute(sql, params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_alter_user_default_currency_alter_user_job"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            install_search_indexes,
+            uninstall_search_indexes,
+        ),
+    ]
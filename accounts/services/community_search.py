@@ -0,0 +1,95 @@
+import base64
+import binascii
+import json
+
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models.functions import Lower
+
+from accounts.models import UserConnection
+from finances.services.keyset_pagination import KeysetPaginator
+
+User = get_user_model()
+
+
+class CommunitySearchService:
+    """
+    People the user is not connected to yet, searched by username and
+    first/last name. Connections are excluded with NOT EXISTS probes on
+    the (from_user, to_user) unique index instead of an id list built
+    in Python.
+
+    Terms are matched against lower() of each field: short terms as a
+    prefix, longer ones as a substring. On PostgreSQL both are backed by
+    expression indexes (text_pattern_ops for prefixes, pg_trgm GIN for
+    substrings) created by migration accounts 0008; other backends run
+    the same queries without them.
+    """
+
+    SEARCH_FIELDS = ("username", "first_name", "last_name")
+    MIN_SUBSTRING_LENGTH = 3
+
+    @classmethod
+    def search(cls, queryset: QuerySet, term: str) -> QuerySet:
+        term = term.strip().lower()
+        if not term:
+            return queryset
+
+        lookup = (
+            "contains" if len(term) >= cls.MIN_SUBSTRING_LENGTH
+            else "startswith"
+        )
+        matches = Q()
+        for field in cls.SEARCH_FIELDS:
+            matches |= Q(**{f"{field}_lower__{lookup}": term})
+
+        return queryset.alias(**{
+            f"{field}_lower": Lower(field) for field in cls.SEARCH_FIELDS
+        }).filter(matches)
+
+    @classmethod
+    def candidates(cls, user: User, term: str = "") -> QuerySet:
+        """Other users with no connection to `user` in either direction."""
+        queryset = (
+            User.objects
+            .exclude(pk=user.pk)
+            .filter(
+                ~Exists(UserConnection.objects.filter(
+                    from_user=user,
+                    to_user=OuterRef("pk"),
+                )),
+                ~Exists(UserConnection.objects.filter(
+                    from_user=OuterRef("pk"),
+                    to_user=user,
+                )),
+            )
+            .only("id", "username", "first_name", "last_name")
+        )
+        return cls.search(queryset, term)
+
+
+class UsernamePaginator(KeysetPaginator):
+    """
+    KeysetPaginator over users ordered by their unique username, so
+    each page is a range read on the username index.
+    """
+
+    ordering = ("username",)
+
+    @staticmethod
+    def encode_cursor(obj) -> str:
+        payload = json.dumps([obj.username])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> str:
+        try:
+            (username,) = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError("Invalid pagination cursor")
+        if not isinstance(username, str):
+            raise ValueError("Invalid pagination cursor")
+        return username
+
+    def after(self, queryset: QuerySet, cursor: str) -> QuerySet:
+        return queryset.filter(username__gt=self.decode_cursor(cursor))
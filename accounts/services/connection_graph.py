@@ -0,0 +1,102 @@
+from collections import defaultdict
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+
+from accounts.models import UserConnection
+
+
+class ConnectionGraph:
+    """
+    Cached adjacency sets of the connection graph: for every user, the
+    ids of the other users they share a connection with, per status.
+    Entries are filled in bulk from one query for all cache misses
+    (outside transactions only) and dropped for both ends whenever a
+    UserConnection is saved or deleted (see accounts.signals). Both go
+    through the default cache, which is shared by all worker processes
+    (enforced by dashboard.checks), so an invalidation is seen by every
+    worker.
+    """
+
+    KEY = "accounts:connections:{user_id}"
+
+    @classmethod
+    def timeout(cls) -> int:
+        return getattr(settings, "CONNECTION_GRAPH_TIMEOUT", 60 * 60)
+
+    @classmethod
+    def adjacency(
+            cls,
+            user_ids: Iterable[int],
+    ) -> dict[int, dict[str, set[int]]]:
+        """Map each user id to {status: ids of the connected users}."""
+        user_ids = set(user_ids)
+        keys = {cls.KEY.format(user_id=user_id): user_id
+                for user_id in user_ids}
+        cached = cache.get_many(keys)
+        result = {keys[key]: value for key, value in cached.items()}
+
+        missing = user_ids - result.keys()
+        if missing:
+            loaded = {user_id: defaultdict(set) for user_id in missing}
+            rows = UserConnection.objects.filter(
+                Q(from_user_id__in=missing) | Q(to_user_id__in=missing)
+            ).values_list("from_user_id", "to_user_id", "status")
+
+            for from_id, to_id, status in rows:
+                if from_id in loaded:
+                    loaded[from_id][status].add(to_id)
+                if to_id in loaded:
+                    loaded[to_id][status].add(from_id)
+
+            loaded = {
+                user_id: dict(statuses)
+                for user_id, statuses in loaded.items()
+            }
+            # rows read inside a transaction may still be rolled back
+            if not connection.in_atomic_block:
+                cache.set_many(
+                    {
+                        cls.KEY.format(user_id=user_id): statuses
+                        for user_id, statuses in loaded.items()
+                    },
+                    cls.timeout(),
+                )
+            result.update(loaded)
+
+        return result
+
+    @classmethod
+    def connected_ids(
+            cls,
+            user_ids: Iterable[int],
+            status: str | None = UserConnection.Status.ACCEPTED,
+    ) -> dict[int, set[int]]:
+        """
+        Connected user ids for each of `user_ids`, limited to one
+        status (accepted by default) or of any status for None.
+        """
+        return {
+            user_id: (
+                set().union(*statuses.values()) if status is None
+                else set(statuses.get(status, ()))
+            )
+            for user_id, statuses in cls.adjacency(user_ids).items()
+        }
+
+    @classmethod
+    def neighbours(
+            cls,
+            user_id: int,
+            status: str | None = UserConnection.Status.ACCEPTED,
+    ) -> set[int]:
+        return cls.connected_ids([user_id], status)[user_id]
+
+    @classmethod
+    def invalidate(cls, *user_ids: int) -> None:
+        cache.delete_many([
+            cls.KEY.format(user_id=user_id) for user_id in user_ids
+        ])
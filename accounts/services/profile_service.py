@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import (
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from accounts.models import UserConnection
+from events.models import Event, EventMembership
+from finances.models import Budget, Transaction
+from finances.services.budget_loader import BudgetLoader
+from groups.models import Group, GroupMembership
+
+User = get_user_model()
+
+
+class SubqueryCount(Subquery):
+    """
+    Row count of a correlated queryset as a scalar subquery, without
+    the GROUP BY that .annotate(Count()) would add to the outer query.
+    """
+
+    template = "(SELECT COUNT(*) FROM (%(subquery)s) _count)"
+    output_field = IntegerField()
+
+    def __init__(self, queryset: QuerySet, **extra):
+        super().__init__(queryset.order_by().values("id"), **extra)
+
+
+class ProfileService:
+    """
+    Data for the profile page. The page itself only renders the
+    summary annotated onto the user row (counts and balances); every
+    list is a separate section loaded over HTMX, limited to what the
+    section shows.
+    """
+
+    BALANCE_FIELDS = ("current_amount", "total_income", "total_expenses")
+    SECTION_LIMIT = 4
+    TRANSACTIONS_LIMIT = 10
+
+    @classmethod
+    def _member_of(cls, memberships: QuerySet, field: str, user_ref) -> Q:
+        """Created by the user or with a membership of any status."""
+        return Q(creator_id=user_ref) | Q(
+            pk__in=memberships.filter(user_id=user_ref).values(field)
+        )
+
+    @classmethod
+    def with_summary(cls, queryset: QuerySet) -> QuerySet:
+        """Annotate each user with the profile counters and balances."""
+        user = OuterRef("pk")
+        budget = Budget.objects.filter(
+            content_type=ContentType.objects.get_for_model(User),
+            object_id=user,
+        )
+        balances = {
+            field: Coalesce(
+                Subquery(budget.values(field)[:1]),
+                0,
+                output_field=Budget._meta.get_field(field),
+            )
+            for field in cls.BALANCE_FIELDS
+        }
+
+        connections = UserConnection.objects.filter(
+            Q(from_user_id=user) | Q(to_user_id=user),
+            status=UserConnection.Status.ACCEPTED,
+        )
+        pending = UserConnection.objects.filter(
+            status=UserConnection.Status.PENDING,
+        )
+
+        return queryset.annotate(
+            events_count=SubqueryCount(Event.objects.filter(
+                cls._member_of(EventMembership.objects, "event_id", user)
+            )),
+            groups_count=SubqueryCount(Group.objects.filter(
+                cls._member_of(GroupMembership.objects, "group_id", user)
+            )),
+            connections_count=SubqueryCount(connections),
+            sent_count=SubqueryCount(pending.filter(from_user_id=user)),
+            received_count=SubqueryCount(pending.filter(to_user_id=user)),
+            **balances,
+        )
+
+    @classmethod
+    def events(cls, user: User) -> QuerySet[Event]:
+        return Event.objects.filter(
+            cls._member_of(EventMembership.objects, "event_id", user.id)
+        ).order_by("-timestamp_create")[:cls.SECTION_LIMIT + 1]
+
+    @classmethod
+    def groups(cls, user: User) -> list[Group]:
+        return BudgetLoader.prefetch_budgets(
+            Group.objects.filter(
+                cls._member_of(GroupMembership.objects, "group_id", user.id)
+            ).order_by("-timestamp_created")[:cls.SECTION_LIMIT + 1]
+        )
+
+    @classmethod
+    def connections(cls, user: User) -> QuerySet[UserConnection]:
+        return (
+            UserConnection.objects
+            .filter(
+                Q(from_user=user) | Q(to_user=user),
+                status=UserConnection.Status.ACCEPTED,
+            )
+            .select_related("from_user", "to_user")
+            .order_by("-created_at")[:cls.SECTION_LIMIT + 1]
+        )
+
+    @classmethod
+    def invitations(cls, user: User) -> dict[str, QuerySet]:
+        pending = UserConnection.objects.filter(
+            status=UserConnection.Status.PENDING,
+        ).order_by("-created_at")
+        return {
+            "take_to_connect": (
+                pending.filter(from_user=user).select_related("to_user")[:3]
+            ),
+            "invite_to_connect": (
+                pending.filter(to_user=user).select_related("from_user")[:4]
+            ),
+        }
+
+    @classmethod
+    def transactions(cls, user: User) -> QuerySet[Transaction]:
+        return (
+            Transaction.objects
+            .filter(
+                target__content_type=ContentType.objects.get_for_model(User),
+                target__object_id=user.id,
+            )
+            .select_related("category", "payer")
+            .order_by("-date", "-timestamp_create")
+            [:cls.TRANSACTIONS_LIMIT + 1]
+        )
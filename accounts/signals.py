@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import UserConnection
+from accounts.services.connection_graph import ConnectionGraph
+
+
+@receiver(post_save, sender=UserConnection)
+@receiver(post_delete, sender=UserConnection)
+def invalidate_connection_graph(
+        sender,
+        instance: UserConnection,
+        **kwargs
+) -> None:
+    user_ids = (instance.from_user_id, instance.to_user_id)
+    ConnectionGraph.invalidate(*user_ids)
+    # drop adjacency read before the write became visible
+    transaction.on_commit(lambda: ConnectionGraph.invalidate(*user_ids))
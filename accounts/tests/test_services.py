@@ -1,9 +1,17 @@
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.http import Http404
 from django.core.exceptions import ValidationError
 from accounts.models import UserConnection
+from accounts.services.community_search import (
+    CommunitySearchService,
+    UsernamePaginator,
+)
+from accounts.services.connection_graph import ConnectionGraph
 from accounts.services.receive_connection import UserConnectionsService
 from accounts.services.user_budget_service import UserBudgetService
 from accounts.services.user_connection_control import UserInvitationService
@@ -130,3 +138,127 @@ class UserBudgetServiceTest(TestCase):
     def test_delete_user_budget(self):
         UserBudgetService.delete_user_budget(self.user)
         self.assertFalse(Budget.objects.filter(id=self.budget.id).exists())
+
+
+class CommunitySearchServiceTest(TestCase):
+    def setUp(self):
+        self.me = User.objects.create_user(username="me")
+        self.friend = User.objects.create_user(username="friend")
+        self.fan = User.objects.create_user(username="fan")
+        self.anna = User.objects.create_user(
+            username="anna", first_name="Anna", last_name="Smith"
+        )
+        self.bob = User.objects.create_user(
+            username="bob", first_name="Robert", last_name="Annan"
+        )
+        UserConnection.objects.create(
+            from_user=self.me, to_user=self.friend,
+            status=UserConnection.Status.ACCEPTED
+        )
+        UserConnection.objects.create(from_user=self.fan, to_user=self.me)
+
+    def usernames(self, queryset):
+        return sorted(queryset.values_list("username", flat=True))
+
+    def test_candidates_exclude_self_and_connections(self):
+        self.assertEqual(
+            self.usernames(CommunitySearchService.candidates(self.me)),
+            ["anna", "bob"]
+        )
+
+    def test_short_terms_match_prefix_long_terms_substring(self):
+        self.assertEqual(
+            self.usernames(CommunitySearchService.candidates(self.me, "a")),
+            ["anna", "bob"]
+        )
+        self.assertEqual(
+            self.usernames(CommunitySearchService.candidates(self.me, "n")),
+            []
+        )
+        self.assertEqual(
+            self.usernames(
+                CommunitySearchService.candidates(self.me, " ANN ")
+            ),
+            ["anna", "bob"]
+        )
+        self.assertEqual(
+            self.usernames(CommunitySearchService.candidates(self.me, "ith")),
+            ["anna"]
+        )
+
+    def test_username_paginator(self):
+        paginator = UsernamePaginator(
+            CommunitySearchService.candidates(self.me),
+            per_page=1,
+        )
+
+        first = paginator.get_page()
+        second = paginator.get_page(first.next_cursor)
+
+        self.assertEqual(first.object_list, [self.anna])
+        self.assertEqual(second.object_list, [self.bob])
+        self.assertFalse(second.has_next)
+        with self.assertRaises(ValueError):
+            paginator.get_page("bm90LWpzb24")
+
+
+class ConnectionGraphTest(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.u1 = User.objects.create_user(username="u1")
+        self.u2 = User.objects.create_user(username="u2")
+        self.u3 = User.objects.create_user(username="u3")
+        self.accepted = UserConnection.objects.create(
+            from_user=self.u1, to_user=self.u2,
+            status=UserConnection.Status.ACCEPTED
+        )
+        UserConnection.objects.create(
+            from_user=self.u3, to_user=self.u1,
+            status=UserConnection.Status.PENDING
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_connected_ids_in_bulk(self):
+        with CaptureQueriesContext(connection) as queries:
+            accepted = ConnectionGraph.connected_ids(
+                [self.u1.id, self.u2.id, self.u3.id]
+            )
+        self.assertEqual(
+            sum("accounts_userconnection" in query["sql"]
+                for query in queries),
+            1
+        )
+        self.assertEqual(accepted, {
+            self.u1.id: {self.u2.id},
+            self.u2.id: {self.u1.id},
+            self.u3.id: set(),
+        })
+
+        # a single read of the shared cache
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                ConnectionGraph.neighbours(self.u1.id, status=None),
+                {self.u2.id, self.u3.id}
+            )
+
+    def test_save_and_delete_invalidate_both_ends(self):
+        ConnectionGraph.connected_ids([self.u1.id, self.u2.id])
+
+        self.accepted.status = UserConnection.Status.BLOCKED
+        self.accepted.save()
+        self.assertEqual(ConnectionGraph.neighbours(self.u2.id), set())
+        self.assertEqual(
+            ConnectionGraph.neighbours(
+                self.u1.id,
+                UserConnection.Status.BLOCKED,
+            ),
+            {self.u2.id}
+        )
+
+        self.accepted.delete()
+        self.assertEqual(
+            ConnectionGraph.neighbours(self.u2.id, status=None),
+            set()
+        )
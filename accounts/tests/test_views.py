@@ -1,8 +1,13 @@
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase, Client
 from django.urls import reverse
 
 from accounts.models import UserConnection
+from accounts.services.profile_service import ProfileService
+from accounts.views import CommunityListView
+from events.models import Event
 
 User = get_user_model()
 
@@ -41,8 +46,55 @@ class AccountsViewTest(TestCase):
                 kwargs={"pk": self.user.pk}
             ))
         self.assertEqual(response.status_code, 200)
-        self.assertIn("connections", response.context)
-        self.assertIn("invite_to_connect", response.context)
+        self.assertIn("current_budget", response.context)
+        self.assertNotIn("connections", response.context)
+        self.assertContains(
+            response,
+            reverse(
+                "profile-section",
+                kwargs={"pk": self.user.pk, "section": "connections"}
+            )
+        )
+
+    def test_profile_summary_is_one_query(self):
+        UserConnection.objects.create(
+            from_user=self.user,
+            to_user=self.other_user,
+            status="Accepted"
+        )
+        Event.objects.create(name="Trip", creator=self.user)
+        self.user.budget.start_amount = 50
+        self.user.budget.save()
+
+        user = ProfileService.with_summary(User.objects.all())
+        with self.assertNumQueries(1):
+            user = user.get(pk=self.user.pk)
+
+        self.assertEqual(user.events_count, 1)
+        self.assertEqual(user.groups_count, 0)
+        self.assertEqual(user.connections_count, 1)
+        self.assertEqual(user.sent_count, 0)
+
+    def test_profile_sections(self):
+        UserConnection.objects.create(
+            from_user=self.other_user,
+            to_user=self.user,
+        )
+        Event.objects.create(name="Trip", creator=self.user)
+
+        def section(name):
+            return self.client.get(
+                reverse(
+                    "profile-section",
+                    kwargs={"pk": self.user.pk, "section": name}
+                ))
+
+        self.assertContains(section("events"), "Trip")
+        self.assertEqual(
+            list(section("invitations").context["invite_to_connect"]),
+            list(UserConnection.objects.filter(to_user=self.user))
+        )
+        self.assertEqual(section("unknown").status_code, 404)
 
     def test_community_list_excludes_friends(self):
         UserConnection.objects.create(
@@ -53,6 +105,34 @@ class AccountsViewTest(TestCase):
         response = self.client.get(reverse("community-list"))
         users_in_list = response.context["user_connections"]
         self.assertNotIn(self.other_user, users_in_list)
+        self.assertNotIn(self.other_user, response.context["other_users"])
+
+    def test_community_list_pages_with_cursor(self):
+        for index in range(3):
+            User.objects.create_user(username=f"member{index}")
+        url = reverse("community-list")
+
+        with patch.object(CommunityListView, "paginate_by", 2):
+            response = self.client.get(url, {"q": "member"})
+            self.assertEqual(
+                [u.username for u in response.context["other_users"]],
+                ["member0", "member1"]
+            )
+            next_query = response.context["next_page_query"]
+
+            response = self.client.get(
+                f"{url}?{next_query}",
+                HTTP_HX_REQUEST="true",
+            )
+        self.assertTemplateUsed(response, "partials/community_user_rows.html")
+        self.assertEqual(
+            [u.username for u in response.context["other_users"]],
+            ["member2"]
+        )
+        self.assertNotIn("user_connections", response.context)
+
+        response = self.client.get(url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, 404)
 
 
 class ConnectionActionsTest(TestCase):
@@ -3,6 +3,7 @@ from django.urls import path
 from accounts.views import (
     RegisterView,
     ProfileView,
+    ProfileSectionView,
     UpdateProfileView,
     CommunityListView,
     UserConnectView,
@@ -23,6 +24,11 @@ urlpatterns = [
         "profile_page/<int:pk>/",
         ProfileView.as_view(),
         name="profile-page"),
+    path(
+        "profile_page/<int:pk>/section/<str:section>/",
+        ProfileSectionView.as_view(),
+        name="profile-section",
+    ),
     path(
         "profile_page/<int:pk>/update/",
         UpdateProfileView.as_view(),
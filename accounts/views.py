@@ -5,7 +5,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
 from django.db.models import Q, QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
 from django.views import View
@@ -23,14 +23,18 @@ from accounts.forms import (
     UserKeyConnectForm
 )
 from accounts.models import UserConnection
+from accounts.services.community_search import (
+    CommunitySearchService,
+    UsernamePaginator,
+)
+from accounts.services.profile_service import ProfileService
 from accounts.services.receive_connection import UserConnectionsService
 from accounts.services.user_budget_service import UserBudgetService
 from accounts.services.user_connection_control import UserInvitationService
-from events.models import Event
 from events.services.event_invitation import EventInvitationService
 from finances.forms import TopUpBudgetForm
+from finances.services.category_registry import CategoryRegistry
 from finances.models import Budget, Category
-from groups.models import Group
 from groups.services.group_invitation import GroupInvitationService
 
 
@@ -50,75 +54,73 @@ class RegisterView(CreateView):
 
 
 class ProfileView(LoginRequiredMixin, DetailView):
+    """
+    Renders from the one summary row; the lists are profile sections
+    fetched by the page over HTMX (see ProfileSectionView).
+    """
+
     model = get_user_model()
     template_name = "profile/profile_detail.html"
 
+    def get_queryset(self) -> QuerySet:
+        return ProfileService.with_summary(super().get_queryset())
+
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         user = self.object
 
-        user_budget = user.budget
-
-        context["transaction_history"] = (
-            user_budget.transactions
-            .select_related("category", "payer")
-            .order_by("-date", "-timestamp_create")[:15]
-        )
-
-        context["current_budget"] = user_budget.get_budget_data()
-
-        context["events"] = (
-            Event.objects.filter(
-                Q(creator=user) | Q(memberships__user=user)
-            )
-            .select_related("creator")
-            .prefetch_related("memberships__user")
-            .distinct()
-        )
+        context["current_budget"] = {
+            field: getattr(user, field)
+            for field in ProfileService.BALANCE_FIELDS
+        }
 
-        context["groups"] = (
-            Group.objects.filter(
-                Q(creator=user) | Q(memberships__user=user)
-            )
-            .select_related("creator")
-            .prefetch_related("memberships__user")
-            .distinct()
+        context["categories_income"] = CategoryRegistry.by_type(
+            Category.Types.INCOME,
+            active_only=True
         )
-
-        context["take_to_connect"] = (
-            UserConnection.objects.filter(
-                from_user=user,
-                status=UserConnection.Status.PENDING
-            )
-            .select_related("to_user")
+        context["categories_expense"] = CategoryRegistry.by_type(
+            Category.Types.EXPENSE,
+            active_only=True
         )
 
-        context["invite_to_connect"] = (
-            UserConnection.objects.filter(
-                to_user=user,
-                status=UserConnection.Status.PENDING
-            )
-            .select_related("from_user")
-        )
+        context["top_up_form"] = TopUpBudgetForm()
 
-        context["connections"] = UserConnectionsService.get_user_connections(
-            user.id,
-            "accepted"
-        )
+        return context
 
-        categories = list(
-            Category.objects.filter(is_active=True)
-            .order_by("order_index", "name")
-        )
 
-        context["categories_income"] = [
-            c for c in categories if c.category_type == Category.Types.INCOME
-        ]
-        context["categories_expense"] = [
-            c for c in categories if c.category_type == Category.Types.EXPENSE
-        ]
+class ProfileSectionView(LoginRequiredMixin, DetailView):
+    model = get_user_model()
+    sections = {
+        "events": "profile/components/events_list.html",
+        "groups": "profile/components/group_list.html",
+        "connections": "profile/components/list_of_conecctions.html",
+        "invitations": "profile/components/list_of_invitations.html",
+        "transactions": "profile/components/transaction_history.html",
+    }
+
+    def get_template_names(self) -> list[str]:
+        section = self.kwargs["section"]
+        if section not in self.sections:
+            raise Http404("Unknown profile section.")
+        return [self.sections[section]]
 
-        context["top_up_form"] = TopUpBudgetForm()
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        user = self.object
+        section = self.kwargs["section"]
+
+        if section == "events":
+            context["events"] = ProfileService.events(user)
+        elif section == "groups":
+            context["groups"] = ProfileService.groups(user)
+        elif section == "connections":
+            context["connections"] = ProfileService.connections(user)
+        elif section == "invitations":
+            context.update(ProfileService.invitations(user))
+        else:
+            context["transaction_history"] = ProfileService.transactions(
+                user
+            )
 
         return context
 
@@ -153,37 +155,43 @@ class CommunityListView(LoginRequiredMixin, ListView):
     template_name = "community/community_list.html"
     context_object_name = "other_users"
 
-    def get_template_names(self) -> str:
+    paginate_by = 25
+
+    def get_template_names(self) -> list[str]:
         if self.request.headers.get("HX-Request"):
-            return "partials/user_table_rows.html"
-        return self.template_name
+            if "cursor" in self.request.GET:
+                return ["partials/community_user_rows.html"]
+            return ["partials/user_table_rows.html"]
+        return [self.template_name]
+
+    def get_queryset(self) -> QuerySet:
+        return CommunitySearchService.candidates(
+            self.request.user,
+            self.request.GET.get("q", ""),
+        )
 
-    def get_queryset(self) -> QuerySet[UserConnection]:
-        query = self.request.GET.get("q", "")
-        self.request.GET.get("status", "")
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> tuple:
+        paginator = UsernamePaginator(queryset, page_size)
+        try:
+            page = paginator.get_page(self.request.GET.get("cursor"))
+        except ValueError:
+            raise Http404("Invalid pagination cursor")
 
-        connections = UserConnectionsService.get_user_connections(
-            self.request.user.id)
-        connected_ids = [
-            c.from_user_id
-            if c.to_user_id == self.request.user.id else c.to_user_id
-            for c in connections
-        ]
-        connected_ids.append(self.request.user.id)
-
-        queryset = get_user_model().objects.exclude(id__in=connected_ids)
-
-        if query:
-            queryset = queryset.filter(
-                Q(username__icontains=query)
-                | Q(first_name__icontains=query)
-                | Q(last_name__icontains=query)
-            )
-        return queryset
+        return paginator, page, page.object_list, page.has_next
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
+        page = context["page_obj"]
+        if page.has_next:
+            params = self.request.GET.copy()
+            params["cursor"] = page.next_cursor
+            context["next_page_query"] = params.urlencode()
+
+        if "cursor" in self.request.GET:
+            # a further page of candidates, the connections are above it
+            return context
+
         query = self.request.GET.get("q", "")
         status_filter = self.request.GET.get("status", "")
 
@@ -106,3 +106,40 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 
 CRISPY_TEMPLATE_PACK = "bootstrap5"
+
+# Budget version tokens, cached analytics and the connection graph are
+# shared by every worker process, so the cache must be too (never the
+# per-process LocMemCache, see dashboard.checks). Production uses Redis
+# when REDIS_URL is set; otherwise create the table with
+# `manage.py createcachetable`. Every cache read is then a database
+# query, e.g. the category registry's version token in each request
+# that looks up a category, so prefer Redis under load.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+        "OPTIONS": {
+            "MAX_ENTRIES": 100_000,
+        },
+    }
+}
+
+# "incremental" applies per-transaction deltas to budget totals,
+# "recalc" re-aggregates the whole budget history on every write.
+BUDGET_LEDGER_MODE = "incremental"
+
+# Seconds a cached analytics result is kept. Entries are keyed on the
+# budget version, so writes invalidate them long before that.
+ANALYTICS_CACHE_TIMEOUT = 60 * 60
+
+# Seconds a user's cached connection adjacency is kept. Entries are
+# dropped on every UserConnection save/delete.
+CONNECTION_GRAPH_TIMEOUT = 60 * 60
+
+# Upper bound on points per chart series. Longer series are downsampled
+# (LTTB for one series, min/max per bucket for several) before rendering.
+CHART_MAX_POINTS = 120
+
+# Threads used to evaluate independent dashboard widgets concurrently.
+# 1 evaluates them one after another on the request's connection.
+DASHBOARD_WIDGET_WORKERS = 4
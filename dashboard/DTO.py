@@ -9,6 +9,7 @@ class AnalyticsContext:
     target_budget_id: int
     date_from: date
     date_to: date
+    granularity: str = "day"
 
 
 @dataclass
@@ -56,3 +57,34 @@ class BarChartData:
     labels: list[str]
     incomes: list[float]
     expenses: list[float]
+    granularity: str = "day"
+
+
+@dataclass
+class BudgetBreakdown:
+    owner_type: str
+    owner_id: int
+    name: str
+    total_income: Decimal
+    total_expenses: Decimal
+    current_amount: Decimal
+    planned_amount: Decimal
+
+
+@dataclass
+class ConsolidatedBudget:
+    total_income: Decimal
+    total_expenses: Decimal
+    current_amount: Decimal
+    planned_amount: Decimal
+    breakdown: list[BudgetBreakdown]
+
+
+@dataclass
+class DashboardBundle:
+    kpi: DashboardKPI
+    cashflow: CashflowTrend
+    pie_income: PieDiagramData
+    pie_expense: PieDiagramData
+    category_income: PieDiagramSegment
+    category_expense: PieDiagramSegment
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs) -> list[Error]:
+    """
+    Budget version tokens are bumped by whichever worker handled the
+    write. With a per-process cache every other worker would keep
+    serving (and ETag-validating) results of the old version.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Error(
+            f"The default cache ({backend}) is not shared between "
+            "processes.",
+            hint=(
+                "Use a shared backend such as DatabaseCache or RedisCache "
+                "for CACHES['default']."
+            ),
+            id="dashboard.E001",
+        )
+    ]
@@ -3,12 +3,12 @@ from datetime import datetime, time, timedelta
 from decimal import Decimal
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 
 from finances.models import Transaction, Budget, Category
+from finances.services.ledger_service import deferred_recalc
 from groups.models import Group
 from events.models import Event
 
@@ -78,71 +78,73 @@ class Command(BaseCommand):
                 ))
 
             # Bulk create для користувача
-            with transaction.atomic():
+            with deferred_recalc() as touched:
                 Transaction.objects.bulk_create(transactions_to_create)
-                budget.recalc()
+                touched.add(budget.id)
 
             self.stdout.write(f"  Created {len(transactions_to_create)} transactions for {user.username}")
 
-        # Генерація внесків до груп
-        self.stdout.write("Generating contributions to groups...")
-        for group in Group.objects.all():
-            target_budget = group.budget
-            if not target_budget:
-                continue
-            memberships = group.memberships.filter(status="Accepted")[:5]
-            for ms in memberships:
-                payer_budget = user_budgets.get(ms.user.id)
-                if not payer_budget:
+        # Один перерахунок на бюджет для всіх внесків
+        with deferred_recalc() as touched:
+            # Генерація внесків до груп
+            self.stdout.write("Generating contributions to groups...")
+            for group in Group.objects.all():
+                target_budget = group.budget
+                if not target_budget:
                     continue
-                transactions_to_create = []
-                for _ in range(random.randint(3, 5)):
-                    category = random.choice(income_cats + expense_cats)
-                    transactions_to_create.append(Transaction(
-                        amount=Decimal(random.randint(1000, 4000)),
-                        transaction_type=Transaction.Types.EXPENSE,
-                        date=random_date(random.randint(0, days_range)),
-                        target=target_budget,
-                        payer=ms.user,
-                        category=category,
-                        note=f"Membership fee for {group.name}"
-                    ))
-                Transaction.objects.bulk_create(transactions_to_create)
-                target_budget.recalc()
-
-        #Генерація внесків до подій
-        self.stdout.write("Generating contributions to events...")
-        for event in Event.objects.all():
-            target_budget = event_budgets.get(event.id)
-            if not target_budget:
-                continue
-            memberships = event.memberships.filter(status="Accepted")[:5]
-            for ms in memberships:
-                payer_budget = user_budgets.get(ms.user.id)
-                if not payer_budget:
-                    continue
-                transactions_to_create = []
-                for _ in range(random.randint(3, 5)):
-                    if event.event_type == Event.EventType.ACCUMULATIVE:
-                        category = random.choice(income_cats)
-                        t_type = Transaction.Types.INCOME
-                    elif event.event_type == Event.EventType.EXPENSES:
-                        category = random.choice(expense_cats)
-                        t_type = Transaction.Types.EXPENSE
-                    else:
+                memberships = group.memberships.filter(status="Accepted")[:5]
+                for ms in memberships:
+                    payer_budget = user_budgets.get(ms.user.id)
+                    if not payer_budget:
+                        continue
+                    transactions_to_create = []
+                    for _ in range(random.randint(3, 5)):
                         category = random.choice(income_cats + expense_cats)
-                        t_type = random.choice([Transaction.Types.INCOME, Transaction.Types.EXPENSE])
-
-                    transactions_to_create.append(Transaction(
-                        amount=Decimal(random.randint(500, 2000)),
-                        transaction_type=t_type,
-                        date=random_date(random.randint(0, days_range)),
-                        target=target_budget,
-                        payer=ms.user,
-                        category=category,
-                        note=f"Support for event: {event.name}"
-                    ))
-                Transaction.objects.bulk_create(transactions_to_create)
-                target_budget.recalc()
+                        transactions_to_create.append(Transaction(
+                            amount=Decimal(random.randint(1000, 4000)),
+                            transaction_type=Transaction.Types.EXPENSE,
+                            date=random_date(random.randint(0, days_range)),
+                            target=target_budget,
+                            payer=ms.user,
+                            category=category,
+                            note=f"Membership fee for {group.name}"
+                        ))
+                    Transaction.objects.bulk_create(transactions_to_create)
+                    touched.add(target_budget.id)
+
+            #Генерація внесків до подій
+            self.stdout.write("Generating contributions to events...")
+            for event in Event.objects.all():
+                target_budget = event_budgets.get(event.id)
+                if not target_budget:
+                    continue
+                memberships = event.memberships.filter(status="Accepted")[:5]
+                for ms in memberships:
+                    payer_budget = user_budgets.get(ms.user.id)
+                    if not payer_budget:
+                        continue
+                    transactions_to_create = []
+                    for _ in range(random.randint(3, 5)):
+                        if event.event_type == Event.EventType.ACCUMULATIVE:
+                            category = random.choice(income_cats)
+                            t_type = Transaction.Types.INCOME
+                        elif event.event_type == Event.EventType.EXPENSES:
+                            category = random.choice(expense_cats)
+                            t_type = Transaction.Types.EXPENSE
+                        else:
+                            category = random.choice(income_cats + expense_cats)
+                            t_type = random.choice([Transaction.Types.INCOME, Transaction.Types.EXPENSE])
+
+                        transactions_to_create.append(Transaction(
+                            amount=Decimal(random.randint(500, 2000)),
+                            transaction_type=t_type,
+                            date=random_date(random.randint(0, days_range)),
+                            target=target_budget,
+                            payer=ms.user,
+                            category=category,
+                            note=f"Support for event: {event.name}"
+                        ))
+                    Transaction.objects.bulk_create(transactions_to_create)
+                    touched.add(target_budget.id)
 
         self.stdout.write(self.style.SUCCESS("Done! All transactions generated successfully."))
@@ -0,0 +1,129 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from django.utils import timezone
+
+from dashboard.checks import PROCESS_LOCAL_CACHES
+from dashboard.services.warmup_service import DashboardWarmupService
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker() -> None:
+    # needed when workers are spawned rather than forked
+    django.setup()
+
+
+def warm_user(user_id: int) -> int:
+    """Best effort: a failing user is logged and skipped."""
+    try:
+        return DashboardWarmupService.warm_user(user_id)
+    except Exception:
+        logger.exception("Dashboard warm-up failed for %s", user_id)
+        return 0
+
+
+class Command(BaseCommand):
+    # the attribute name is Django's management command API
+    help = (  # noqa: VNE003
+        "Precomputes cached dashboard analytics for recently active "
+        "users, e.g. after a deploy or a cache flush; with --loop keeps "
+        "warming users as they log in"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Warm users who logged in within this many days",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Warm the given user id instead (can be repeated)",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes to use",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help=(
+                "Keep running; every --interval seconds warm the users "
+                "who logged in since the previous pass"
+            ),
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=60,
+            help="Seconds between passes with --loop",
+        )
+
+    def handle(self, *args, **options):
+        backend = settings.CACHES["default"]["BACKEND"]
+        if backend in PROCESS_LOCAL_CACHES:
+            raise CommandError(
+                f"{backend} is local to this process, the warmed results "
+                f"would not be visible to the web workers"
+            )
+
+        if options["user_ids"]:
+            self.warm(options["user_ids"], options["processes"])
+            return
+
+        since = timezone.now() - timedelta(days=options["days"])
+        try:
+            while True:
+                started = timezone.now()
+                self.warm(
+                    list(DashboardWarmupService.logged_in_since(since)),
+                    options["processes"],
+                )
+                if not options["loop"]:
+                    return
+
+                since = started
+                close_old_connections()
+                time.sleep(max(1, options["interval"]))
+        except KeyboardInterrupt:
+            self.stdout.write("Stopped")
+
+    def warm(self, user_ids: list[int], processes: int) -> None:
+        if not user_ids:
+            self.stdout.write("No users to warm")
+            return
+
+        processes = max(1, min(processes, len(user_ids)))
+        if processes == 1:
+            warmed = sum(warm_user(user_id) for user_id in user_ids)
+        else:
+            # forked workers must not share the parent's connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                    max_workers=processes,
+                    initializer=init_worker,
+            ) as pool:
+                warmed = sum(pool.map(
+                    warm_user,
+                    user_ids,
+                    chunksize=max(1, len(user_ids) // (processes * 4)),
+                ))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {warmed} budgets for {len(user_ids)} users "
+            f"using {processes} process(es)"
+        ))
@@ -0,0 +1,151 @@
+import functools
+import hashlib
+import inspect
+from datetime import date
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+from django.utils import timezone
+
+from dashboard.DTO import AnalyticsContext
+from finances.models import Budget
+from finances.services.budget_version import BudgetVersionService
+
+
+class AnalyticsCache:
+    """
+    Result cache for budget analytics.
+    Keys carry the budget version from BudgetVersionService, so a
+    transaction write makes every cached result of its budget
+    unreachable and unchanged budgets are served straight from cache.
+    Hit/miss counters are kept per process, see stats().
+    """
+
+    KEY = "analytics:{name}:{budget_id}:{version}:{digest}"
+
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def timeout(cls) -> int:
+        return getattr(settings, "ANALYTICS_CACHE_TIMEOUT", 60 * 60)
+
+    @classmethod
+    def _key_part(cls, value: Any) -> str:
+        if isinstance(value, AnalyticsContext):
+            return (f"{value.date_from.isoformat()}:"
+                    f"{value.date_to.isoformat()}:{value.granularity}")
+        if isinstance(value, Budget):
+            return f"budget:{value.pk}"
+        if isinstance(value, Model):
+            updated = getattr(value, "timestamp_update", None)
+            return (f"{value._meta.label_lower}:{value.pk}:"
+                    f"{updated.isoformat() if updated else ''}")
+        if isinstance(value, date):
+            return value.isoformat()
+        return repr(value)
+
+    @classmethod
+    def find_budget_id(cls, values: list[Any]) -> int | None:
+        for value in values:
+            if isinstance(value, AnalyticsContext):
+                return value.target_budget_id
+            if isinstance(value, Budget):
+                return value.pk
+        for value in values:
+            budget = getattr(value, "budget", None)
+            if isinstance(value, Model) and isinstance(budget, Budget):
+                return budget.pk
+        return None
+
+    @classmethod
+    def make_key(cls, name: str, budget_id: int, values: list[Any]) -> str:
+        # results may depend on "today" (open-ended ranges)
+        parts = [timezone.localdate().isoformat()]
+        parts += [cls._key_part(value) for value in values]
+        digest = hashlib.md5(
+            "|".join(parts).encode(),
+            usedforsecurity=False
+        ).hexdigest()
+
+        return cls.KEY.format(
+            name=name,
+            budget_id=budget_id,
+            version=BudgetVersionService.get(budget_id),
+            digest=digest,
+        )
+
+    @classmethod
+    def etag(cls, name: str, budget_id: int, values: list[Any]) -> str:
+        """Strong ETag of a result; only reads the budget version."""
+        digest = hashlib.md5(
+            cls.make_key(name, budget_id, values).encode(),
+            usedforsecurity=False
+        ).hexdigest()
+        return f'"{digest}"'
+
+    @classmethod
+    def get_or_set(
+            cls,
+            name: str,
+            budget_id: int,
+            values: list[Any],
+            compute: Callable[[], Any],
+    ) -> Any:
+        key = cls.make_key(name, budget_id, values)
+        result = cache.get(key)
+        if result is not None:
+            cls.hits += 1
+            return result
+
+        cls.misses += 1
+        result = compute()
+        cache.set(key, result, cls.timeout())
+        return result
+
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        total = cls.hits + cls.misses
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_ratio": cls.hits / total if total else 0.0,
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls.hits = cls.misses = 0
+
+
+def cached_analytics(func: Callable) -> Callable:
+    """
+    Cache an analytics method through AnalyticsCache. The budget is
+    taken from an AnalyticsContext, Budget or budget owner argument;
+    calls without one are computed uncached. Put it below
+    @classmethod / @staticmethod.
+    """
+    signature = inspect.signature(func)
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        values = [
+            value for arg, value in bound.arguments.items() if arg != "cls"
+        ]
+
+        budget_id = AnalyticsCache.find_budget_id(values)
+        if budget_id is None:
+            return func(*args, **kwargs)
+
+        return AnalyticsCache.get_or_set(
+            name,
+            budget_id,
+            values,
+            lambda: func(*args, **kwargs),
+        )
+
+    return wrapper
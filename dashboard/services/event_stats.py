@@ -2,18 +2,22 @@ from datetime import timedelta, date
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 from django.contrib.auth import get_user_model
-from django.db.models import Sum, Count, Case, When
+from django.db.models import Sum, Count, Case, F, When
 from django.db.models.fields import DecimalField
-from django.db.models.functions import TruncDate, TruncDay
 from django.utils import timezone
 
-from finances.models import Transaction, Budget
+from dashboard.services.analytics_cache import cached_analytics
+from dashboard.services.series_engine import SeriesEngine
+from finances.models import Budget, DailyBudgetRollup, Transaction
+from finances.services.contribution_service import ContributionService
 
 User = get_user_model()
 
 class EventAnalyticsService:
     @staticmethod
+    @cached_analytics
     def get_event_accumulative_stats(
             event: User,
             budget: Budget
@@ -25,27 +29,14 @@ class EventAnalyticsService:
         end_date = event.end_date or timezone.now().date()
         start_date = end_date - timedelta(days=30)
 
-        transactions = (
-            Transaction.objects
-            .filter(target=budget)
-            .annotate(day=TruncDate("date"))
-            .values("day")
-            .annotate(total_amount=Sum("amount"))
-            .order_by("day")
+        axis = SeriesEngine.date_axis(start_date, end_date)
+        daily = SeriesEngine.daily_values(
+            axis,
+            EventAnalyticsService._daily_totals(budget, start_date, end_date),
         )
 
-        daily_map = {
-            t["day"]: float(t["total_amount"])
-            for t in transactions
-        }
-
-        labels = []
-        data_points = []
-
-        for i in range(31):
-            day = start_date + timedelta(days=i)
-            labels.append(day.strftime("%d %b"))
-            data_points.append(daily_map.get(day, 0.0))
+        labels = SeriesEngine.labels(axis, "%d %b")
+        data_points = daily.tolist()
 
         return {
             "percent": min(percent, 100),
@@ -58,13 +49,7 @@ class EventAnalyticsService:
     def get_social_stats(event: User, budget: Budget) -> dict[str, Any]:
         leaderboard = []
         if budget:
-            leaderboard = (
-                budget.transactions.filter(transaction_type="Income")
-                .values("payer__username", "payer__first_name",
-                        "payer__last_name")
-                .annotate(total_contributed=Sum("amount"))
-                .order_by("-total_contributed")[:5]
-            )
+            leaderboard = ContributionService.leaderboard(budget, limit=5)
 
         status_counts = (
             event.memberships.values("role")
@@ -81,49 +66,75 @@ class EventAnalyticsService:
         }
 
     @classmethod
+    @cached_analytics
     def get_event_savings_stats(cls, budget: Budget) -> dict[str, Any]:
-        stats = (
-            Transaction.objects
-            .filter(target=budget)
-            .annotate(day=TruncDay('date'))
-            .values('day')
+        """
+        Net balance (income minus expenses) at the end of every day from
+        the budget's first transaction day to its last, days without
+        transactions included.
+        """
+        rows = list(
+            DailyBudgetRollup.objects
+            .filter(budget=budget)
+            .values_list("day")
             .annotate(
-                income=Sum(
-                    Case(
-                        When(transaction_type=Transaction.Types.INCOME,
-                             then='amount'),
-                        default=0,
-                        output_field=DecimalField()
-                    )
-                ),
-                expense=Sum(
+                amount=Sum(
                     Case(
                         When(transaction_type=Transaction.Types.EXPENSE,
-                             then='amount'),
-                        default=0,
+                             then=-F("total")),
+                        default=F("total"),
                         output_field=DecimalField()
                     )
                 )
             )
-            .order_by('day')
+            .order_by("day")
         )
+        if not rows:
+            return {"labels": [], "data_points": []}
 
-        labels = []
-        data_points = []
+        axis = SeriesEngine.date_axis(rows[0][0], rows[-1][0])
+        balance = SeriesEngine.running_total(
+            SeriesEngine.daily_values(axis, rows)
+        )
 
-        for entry in stats:
-            labels.append(entry['day'].strftime('%d.%m.%Y'))
-            income = entry['income'] or 0
-            expense = entry['expense'] or 0
-            net_amount = float(income - expense)
-            data_points.append(net_amount)
+        return cls._downsample({
+            "labels": SeriesEngine.labels(axis, "%d.%m.%Y"),
+            "data_points": balance.tolist(),
+        })
 
+    @staticmethod
+    def _downsample(series: dict[str, list]) -> dict[str, list]:
+        """Thin aligned chart series down to CHART_MAX_POINTS."""
+        indices = SeriesEngine.downsample_indices(*(
+            values for key, values in series.items() if key != "labels"
+        ))
         return {
-            "labels": labels,
-            "data_points": data_points
+            key: SeriesEngine.take(values, indices)
+            for key, values in series.items()
         }
 
+    @staticmethod
+    def _daily_totals(
+            budget: Budget,
+            start: date,
+            end: date,
+            transaction_type: str | None = None
+    ) -> list[tuple[date, Decimal]]:
+        rollups = DailyBudgetRollup.objects.filter(
+            budget=budget,
+            day__range=(start, end),
+        )
+        if transaction_type:
+            rollups = rollups.filter(transaction_type=transaction_type)
+        return list(
+            rollups
+            .values_list("day")
+            .annotate(amount=Sum("total"))
+            .order_by("day")
+        )
+
     @classmethod
+    @cached_analytics
     def get_event_expense_stats(
             cls,
             start: date,
@@ -131,58 +142,29 @@ class EventAnalyticsService:
             budget: Budget,
             total_expense: Decimal) -> dict[str, Any]:
 
-        stats_query = (
-            Transaction.objects
-            .filter(target=budget, date__range=(start, end))
-            .annotate(day=TruncDay('date'))
-            .values('day')
-            .annotate(
-                expense=Sum(
-                    Case(
-                        When(transaction_type=Transaction.Types.EXPENSE,
-                             then='amount'),
-                        default=0,
-                        output_field=DecimalField()
-                    )
-                )
-            )
+        axis = SeriesEngine.date_axis(start, end)
+        expenses = SeriesEngine.daily_values(
+            axis,
+            cls._daily_totals(budget, start, end, Transaction.Types.EXPENSE),
         )
-        actual_expenses = {
-            entry['day'].date(): float(entry['expense'])
-            for entry in stats_query
-        }
-
-        delta = end - start
-        total_days = delta.days + 1
-
-        daily_plan_reduction = float(
-            total_expense) / total_days if total_days > 0 else 0
-
-        labels = []
-        real_points = []
-        project_points = []
 
-        current_real_balance = float(total_expense)
-        current_project_balance = float(total_expense)
+        total = float(total_expense)
+        daily_plan_reduction = total / len(axis) if len(axis) else 0
 
-        for i in range(total_days):
-            current_date = start + timedelta(days=i)
-            labels.append(current_date.strftime('%d.%m.%Y'))
-
-            current_project_balance -= daily_plan_reduction
-            project_points.append(max(0, current_project_balance))
+        real_points = SeriesEngine.running_total(expenses, total, sign=-1)
+        project_points = np.maximum(
+            SeriesEngine.projection(len(axis), total, -daily_plan_reduction),
+            0,
+        )
 
-            day_expense = actual_expenses.get(current_date, 0)
-            current_real_balance -= day_expense
-            real_points.append(current_real_balance)
-
-        return {
-            "labels": labels,
-            "real_points": real_points,
-            "project_points": project_points,
-        }
+        return cls._downsample({
+            "labels": SeriesEngine.labels(axis, "%d.%m.%Y"),
+            "real_points": real_points.tolist(),
+            "project_points": project_points.tolist(),
+        })
 
     @classmethod
+    @cached_analytics
     def accumulate_stats(
             cls,
             start: date,
@@ -191,53 +173,23 @@ class EventAnalyticsService:
             planed_goal: Decimal
     ) -> dict[str, Any]:
 
-        stats_query = (
-            Transaction.objects
-            .filter(target=budget, date__range=(start, end))
-            .annotate(day=TruncDay('date'))
-            .values('day')
-            .annotate(
-                expense=Sum(
-                    Case(
-                        When(transaction_type=Transaction.Types.INCOME,
-                             then='amount'),
-                        default=0,
-                        output_field=DecimalField()
-                    )
-                )
-            )
+        axis = SeriesEngine.date_axis(start, end)
+        incomes = SeriesEngine.daily_values(
+            axis,
+            cls._daily_totals(budget, start, end, Transaction.Types.INCOME),
         )
-        actual_incomes = {
-            entry['day'].date(): float(entry['expense'])
-            for entry in stats_query
-        }
-
-        delta = end - start
-        total_days = delta.days + 1
-
-        daily_plan_receives = float(
-            planed_goal) / total_days if total_days > 0 else 0
-
-        labels = []
-        real_points = []
-        project_points = []
 
-        current_real_balance = float(0)
-        current_project_balance = float(0)
-
-        for i in range(total_days):
-            current_date = start + timedelta(days=i)
-            labels.append(current_date.strftime('%d.%m.%Y'))
-
-            current_project_balance += daily_plan_receives
-            project_points.append(current_project_balance)
+        daily_plan_receives = (
+            float(planed_goal) / len(axis) if len(axis) else 0
+        )
 
-            day_incomes = actual_incomes.get(current_date, 0)
-            current_real_balance += day_incomes
-            real_points.append(current_real_balance)
+        real_points = SeriesEngine.running_total(incomes)
+        project_points = SeriesEngine.projection(
+            len(axis), 0.0, daily_plan_receives
+        )
 
-        return {
-            "labels": labels,
-            "real_points": real_points,
-            "project_points": project_points,
-        }
\ No newline at end of file
+        return cls._downsample({
+            "labels": SeriesEngine.labels(axis, "%d.%m.%Y"),
+            "real_points": real_points.tolist(),
+            "project_points": project_points.tolist(),
+        })
@@ -1,37 +1,214 @@
-from collections import defaultdict
+from datetime import date
 from decimal import Decimal
 
-from dashboard.DTO import BarChartData
-from finances.models import Transaction
-from groups.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import (
+    DateField,
+    F,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Window,
+)
+from django.db.models.functions import Trunc
+
+from dashboard.DTO import BarChartData, BudgetBreakdown, ConsolidatedBudget
+from dashboard.services.series_engine import SeriesEngine
+from events.models import Event
+from finances.models import Budget, DailyBudgetRollup, Transaction
+from groups.models import Group, GroupEventConnection
 
 
 class GroupStatsService:
+    """
+    Group budget charts, aggregated in the database from the daily
+    rollups into day, week, month or year buckets.
+    """
+
+    GRANULARITIES = ("day", "week", "month", "year")
+    MAX_POINTS = 60
+    LABEL_FORMATS = {
+        "day": "%Y-%m-%d",
+        "week": "%Y-%m-%d",
+        "month": "%Y-%m",
+        "year": "%Y",
+    }
+
+    @classmethod
+    def bucket_count(
+            cls,
+            date_from: date,
+            date_to: date,
+            granularity: str
+    ) -> int:
+        if granularity == "day":
+            return (date_to - date_from).days + 1
+        if granularity == "week":
+            return (date_to - date_from).days // 7 + 2
+        if granularity == "month":
+            return (
+                (date_to.year - date_from.year) * 12
+                + date_to.month - date_from.month + 1
+            )
+        return date_to.year - date_from.year + 1
+
+    @classmethod
+    def choose_granularity(
+            cls,
+            date_from: date,
+            date_to: date,
+            max_points: int = MAX_POINTS
+    ) -> str:
+        """Finest granularity that keeps the chart within max_points."""
+        for granularity in cls.GRANULARITIES:
+            if cls.bucket_count(date_from, date_to, granularity) <= max_points:
+                return granularity
+        return cls.GRANULARITIES[-1]
+
+    @classmethod
+    def _rollups(cls, pk: int) -> QuerySet[DailyBudgetRollup]:
+        return DailyBudgetRollup.objects.filter(
+            budget__content_type=ContentType.objects.get_for_model(Group),
+            budget__object_id=pk,
+        )
+
     @classmethod
-    def get_bar_chart_data(cls, pk: int) -> BarChartData:
-        group = Group.objects.get(pk=pk)
+    def get_bar_chart_data(
+            cls,
+            pk: int,
+            date_from: date | None = None,
+            date_to: date | None = None,
+            granularity: str | None = None,
+            max_points: int = MAX_POINTS,
+    ) -> BarChartData:
+        rollups = cls._rollups(pk)
+        if date_from:
+            rollups = rollups.filter(day__gte=date_from)
+        if date_to:
+            rollups = rollups.filter(day__lte=date_to)
 
-        transactions = (
-            Transaction.objects
-            .filter(target=group.budget)
-            .order_by("date")
+        if granularity not in cls.GRANULARITIES:
+            if not (date_from and date_to):
+                bounds = rollups.aggregate(first=Min("day"), last=Max("day"))
+                date_from = date_from or bounds["first"]
+                date_to = date_to or bounds["last"]
+            granularity = (
+                cls.choose_granularity(date_from, date_to, max_points)
+                if date_from and date_to
+                else "day"
+            )
+
+        bucket = (
+            F("day") if granularity == "day"
+            else Trunc("day", granularity, output_field=DateField())
+        )
+        rows = (
+            rollups
+            .annotate(bucket=bucket)
+            .values("bucket", "transaction_type")
+            .annotate(amount=Sum("total"))
+            .order_by("bucket")
         )
 
-        income_map = defaultdict(Decimal)
-        expense_map = defaultdict(Decimal)
+        label_format = cls.LABEL_FORMATS[granularity]
+        income_map = {}
+        expense_map = {}
 
-        for tx in transactions:
-            label = tx.date.strftime("%Y-%m-%d")
+        for row in rows:
+            label = row["bucket"].strftime(label_format)
 
-            if tx.transaction_type == Transaction.Types.INCOME:
-                income_map[label] += tx.amount
-            elif tx.transaction_type == Transaction.Types.EXPENSE:
-                expense_map[label] += tx.amount
+            if row["transaction_type"] == Transaction.Types.INCOME:
+                income_map[label] = row["amount"]
+            elif row["transaction_type"] == Transaction.Types.EXPENSE:
+                expense_map[label] = row["amount"]
 
         labels = sorted(set(income_map.keys()) | set(expense_map.keys()))
+        incomes = [
+            float(income_map.get(label, Decimal("0")))
+            for label in labels
+        ]
+        expenses = [
+            -float(expense_map.get(label, Decimal("0")))
+            for label in labels
+        ]
+
+        indices = SeriesEngine.downsample_indices(incomes, expenses)
 
         return BarChartData(
-            labels=labels,
-            incomes=[float(income_map[label]) for label in labels],
-            expenses=[-float(expense_map[label]) for label in labels],
+            labels=SeriesEngine.take(labels, indices),
+            incomes=SeriesEngine.take(incomes, indices),
+            expenses=SeriesEngine.take(expenses, indices),
+            granularity=granularity,
+        )
+
+    CONSOLIDATED_FIELDS = (
+        "total_income",
+        "total_expenses",
+        "current_amount",
+        "planned_amount",
+    )
+
+    @classmethod
+    def get_consolidated(cls, group: Group) -> ConsolidatedBudget:
+        """
+        The group's budget together with the budgets of its linked
+        events, read in one query: owners are matched on content_type /
+        object_id, event names come from a subquery and the group-wide
+        totals from window sums over the same rows.
+        """
+        group_type = ContentType.objects.get_for_model(Group)
+        event_type = ContentType.objects.get_for_model(Event)
+
+        rows = (
+            Budget.objects
+            .filter(
+                Q(content_type=group_type, object_id=group.pk)
+                | Q(
+                    content_type=event_type,
+                    object_id__in=GroupEventConnection.objects
+                    .filter(group=group)
+                    .values("event_id"),
+                )
+            )
+            .annotate(
+                event_name=Subquery(
+                    Event.objects
+                    .filter(pk=OuterRef("object_id"))
+                    .values("name")[:1]
+                ),
+                **{
+                    f"sum_{field}": Window(expression=Sum(field))
+                    for field in cls.CONSOLIDATED_FIELDS
+                },
+            )
+            .order_by("content_type_id", "object_id")
+            .values(
+                "content_type_id",
+                "object_id",
+                "event_name",
+                *cls.CONSOLIDATED_FIELDS,
+                *(f"sum_{field}" for field in cls.CONSOLIDATED_FIELDS),
+            )
         )
+
+        breakdown = []
+        totals = dict.fromkeys(cls.CONSOLIDATED_FIELDS, Decimal("0"))
+        for row in rows:
+            is_group = row["content_type_id"] == group_type.id
+            breakdown.append(BudgetBreakdown(
+                owner_type="group" if is_group else "event",
+                owner_id=row["object_id"],
+                name=group.name if is_group else row["event_name"],
+                **{field: row[field] for field in cls.CONSOLIDATED_FIELDS},
+            ))
+            totals = {
+                field: row[f"sum_{field}"]
+                for field in cls.CONSOLIDATED_FIELDS
+            }
+
+        breakdown.sort(key=lambda item: item.owner_type != "group")
+        return ConsolidatedBudget(breakdown=breakdown, **totals)
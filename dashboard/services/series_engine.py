@@ -0,0 +1,181 @@
+import re
+from datetime import date
+from decimal import Decimal
+from typing import Iterable
+
+import numpy as np
+from django.conf import settings
+
+
+class SeriesEngine:
+    """
+    Daily chart series as NumPy arrays: a datetime64 date axis,
+    gap-filled values, running balances, linear projections, labels
+    formatted for the whole axis at once and downsampling of long
+    series to CHART_MAX_POINTS.
+    """
+
+    MONTH_ABBR = np.array([
+        "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+    ])
+    LABEL_TOKEN = re.compile(r"(%[dmYb])")
+
+    @classmethod
+    def date_axis(cls, start: date, end: date) -> np.ndarray:
+        """Every day from start to end inclusive (empty if end < start)."""
+        return np.arange(
+            np.datetime64(start, "D"),
+            np.datetime64(end, "D") + 1,
+            dtype="datetime64[D]",
+        )
+
+    @classmethod
+    def daily_values(
+            cls,
+            axis: np.ndarray,
+            rows: Iterable[tuple[date, Decimal]]
+    ) -> np.ndarray:
+        """Sum (day, amount) rows onto the axis, zero for missing days."""
+        values = np.zeros(len(axis), dtype=np.float64)
+        rows = list(rows)
+        if not rows or not len(axis):
+            return values
+
+        days = np.array([day for day, _ in rows], dtype="datetime64[D]")
+        amounts = np.array([amount for _, amount in rows], dtype=np.float64)
+        index = (days - axis[0]).astype(np.int64)
+        inside = (index >= 0) & (index < len(axis))
+        np.add.at(values, index[inside], amounts[inside])
+        return values
+
+    @classmethod
+    def running_total(
+            cls,
+            values: np.ndarray,
+            initial: float = 0.0,
+            sign: int = 1
+    ) -> np.ndarray:
+        return initial + sign * np.cumsum(values)
+
+    @classmethod
+    def projection(
+            cls,
+            length: int,
+            initial: float,
+            step: float
+    ) -> np.ndarray:
+        """Straight line moving by `step` per day, first point included."""
+        return initial + step * np.arange(1, length + 1, dtype=np.float64)
+
+    @classmethod
+    def labels(cls, axis: np.ndarray, pattern: str) -> list[str]:
+        """strftime-like formatting of the whole axis (%d %m %Y %b)."""
+        if not len(axis):
+            return []
+
+        months = axis.astype("datetime64[M]")
+        month_index = months.astype(np.int64) % 12
+        fields = {
+            "%Y": (axis.astype("datetime64[Y]").astype(np.int64) + 1970)
+            .astype(str),
+            "%m": np.char.zfill((month_index + 1).astype(str), 2),
+            "%d": np.char.zfill(
+                ((axis - months).astype(np.int64) + 1).astype(str), 2
+            ),
+            "%b": cls.MONTH_ABBR[month_index],
+        }
+
+        result = np.full(len(axis), "", dtype=object)
+        for part in cls.LABEL_TOKEN.split(pattern):
+            if part in fields:
+                result = result + fields[part].astype(object)
+            elif part:
+                result = result + part
+        return result.tolist()
+
+    @classmethod
+    def max_points(cls) -> int:
+        return getattr(settings, "CHART_MAX_POINTS", 120)
+
+    @classmethod
+    def _bucket_edges(cls, length: int, buckets: int) -> np.ndarray:
+        """Edges splitting the points between the first and last one."""
+        return np.linspace(1, length - 1, buckets + 1).astype(np.int64)
+
+    @classmethod
+    def lttb_indices(cls, values, threshold: int) -> np.ndarray:
+        """
+        Largest-Triangle-Three-Buckets: per bucket keep the point that
+        forms the largest triangle with the previously kept point and
+        the average of the next bucket.
+        """
+        ys = np.asarray(values, dtype=np.float64)
+        length = len(ys)
+        if threshold >= length or threshold < 3:
+            return np.arange(length)
+
+        xs = np.arange(length, dtype=np.float64)
+        edges = cls._bucket_edges(length, threshold - 2)
+        selected = np.empty(threshold, dtype=np.int64)
+        selected[0], selected[-1] = 0, length - 1
+
+        anchor = 0
+        for i in range(threshold - 2):
+            low, high = edges[i], edges[i + 1]
+            if i + 2 < len(edges):
+                avg_x = xs[high:edges[i + 2]].mean()
+                avg_y = ys[high:edges[i + 2]].mean()
+            else:
+                avg_x, avg_y = xs[-1], ys[-1]
+
+            area = np.abs(
+                (xs[anchor] - avg_x) * (ys[low:high] - ys[anchor])
+                - (xs[anchor] - xs[low:high]) * (avg_y - ys[anchor])
+            )
+            anchor = low + int(np.argmax(area))
+            selected[i + 1] = anchor
+        return selected
+
+    @classmethod
+    def minmax_indices(cls, series: list, threshold: int) -> np.ndarray:
+        """Keep the minimum and maximum of every series in each bucket."""
+        arrays = [np.asarray(values, dtype=np.float64) for values in series]
+        length = len(arrays[0])
+        if threshold >= length:
+            return np.arange(length)
+
+        buckets = max(1, (threshold - 2) // (2 * len(arrays)))
+
+        edges = cls._bucket_edges(length, buckets)
+        selected = [0, length - 1]
+        for low, high in zip(edges[:-1], edges[1:]):
+            for values in arrays:
+                chunk = values[low:high]
+                selected.append(low + int(np.argmin(chunk)))
+                selected.append(low + int(np.argmax(chunk)))
+        return np.unique(selected)
+
+    @classmethod
+    def downsample_indices(
+            cls,
+            *series,
+            max_points: int | None = None
+    ) -> np.ndarray:
+        """
+        Indices to keep so that aligned series fit in max_points,
+        LTTB for a single series and min/max per bucket for several.
+        """
+        max_points = max_points or cls.max_points()
+        length = len(series[0]) if series else 0
+        if length <= max_points:
+            return np.arange(length)
+        if len(series) == 1:
+            return cls.lttb_indices(series[0], max_points)
+        return cls.minmax_indices(list(series), max_points)
+
+    @classmethod
+    def take(cls, values: list, indices: np.ndarray) -> list:
+        if len(indices) == len(values):
+            return list(values)
+        return [values[i] for i in indices.tolist()]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 
 from django.db.models import (
@@ -6,12 +7,17 @@ from django.db.models import (
     When,
     Value,
     DecimalField,
+    QuerySet,
     Count,
-    Avg, QuerySet
+    DateField,
+    F,
 )
-from django.db.models.functions import TruncDay
+from django.db.models.functions import Trunc
+from django.utils import timezone
 
-from finances.models import Transaction
+from dashboard.services.analytics_cache import cached_analytics
+from dashboard.services.series_engine import SeriesEngine
+from finances.models import DailyBudgetRollup, Transaction
 from dashboard.DTO import (
     DashboardKPI,
     CashflowPoint,
@@ -19,11 +25,70 @@ from dashboard.DTO import (
     PieDiagramData,
     TagPieDiagram,
     PieDiagramSegment,
-    AnalyticsContext
+    AnalyticsContext,
+    DashboardBundle,
 )
 
 
 class TransactionStatsService:
+    """
+    Budget analytics. Whole-day ranges with day or coarser granularity
+    are served from DailyBudgetRollup; ranges bounded by datetimes
+    still scan transactions, since a rollup row cannot be split. Series
+    are bucketed by the context's granularity.
+    """
+
+    ROLLUP_GRANULARITIES = ("day", "week", "month", "year")
+    OTHER_TAG = "Other"
+    PIE_TOP_N = 6
+
+    @classmethod
+    def current_month_context(cls, budget_id: int) -> AnalyticsContext:
+        """The dashboards' default range: this month up to today."""
+        today = timezone.localdate()
+        return AnalyticsContext(
+            target_budget_id=budget_id,
+            date_from=today.replace(day=1),
+            date_to=today,
+        )
+
+    @classmethod
+    def uses_rollups(cls, ctx: AnalyticsContext) -> bool:
+        return (
+            ctx.granularity in cls.ROLLUP_GRANULARITIES
+            and not isinstance(ctx.date_from, datetime)
+            and not isinstance(ctx.date_to, datetime)
+        )
+
+    @classmethod
+    def get_rollup_queryset(
+            cls,
+            ctx: AnalyticsContext
+    ) -> QuerySet[DailyBudgetRollup]:
+        return DailyBudgetRollup.objects.filter(
+            budget_id=ctx.target_budget_id,
+            day__range=(ctx.date_from, ctx.date_to),
+        )
+
+    @classmethod
+    def _bucket(cls, ctx: AnalyticsContext):
+        """Start of the granularity bucket each row falls into."""
+        if cls.uses_rollups(ctx):
+            if ctx.granularity == "day":
+                return F("day")
+            return Trunc("day", ctx.granularity, output_field=DateField())
+        return Trunc("date", ctx.granularity)
+
+    @classmethod
+    def _sum_by_type(cls, transaction_type: str, field: str) -> Sum:
+        return Sum(
+            Case(
+                When(transaction_type=transaction_type, then=field),
+                default=Value(0),
+                output_field=DecimalField(),
+            )
+        )
+
     @classmethod
     def _base_queryset(cls, ctx: AnalyticsContext) -> QuerySet[Transaction]:
         return Transaction.objects.filter(
@@ -39,30 +104,16 @@ class TransactionStatsService:
             date__range=(ctx.date_from, ctx.date_to), )
 
     @classmethod
+    @cached_analytics
     def get_kpi(cls, ctx: AnalyticsContext) -> DashboardKPI:
-        qs = cls.get_range_queryset(ctx)
+        if cls.uses_rollups(ctx):
+            qs, field = cls.get_rollup_queryset(ctx), "total"
+        else:
+            qs, field = cls.get_range_queryset(ctx), "amount"
 
         aggregates = qs.aggregate(
-            total_income=Sum(
-                Case(
-                    When(
-                        transaction_type=Transaction.Types.INCOME,
-                        then="amount"
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField(),
-                )
-            ),
-            total_expense=Sum(
-                Case(
-                    When(
-                        transaction_type=Transaction.Types.EXPENSE,
-                        then="amount"
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField(),
-                )
-            ),
+            total_income=cls._sum_by_type(Transaction.Types.INCOME, field),
+            total_expense=cls._sum_by_type(Transaction.Types.EXPENSE, field),
         )
 
         income = aggregates["total_income"] or Decimal("0")
@@ -75,102 +126,268 @@ class TransactionStatsService:
         )
 
     @classmethod
+    @cached_analytics
     def get_cashflow(cls, ctx: AnalyticsContext) -> CashflowTrend:
+        if cls.uses_rollups(ctx):
+            qs, field = cls.get_rollup_queryset(ctx), "total"
+        else:
+            qs, field = cls.get_range_queryset(ctx), "amount"
+
         qs = (
-            cls.get_range_queryset(ctx)
-            .annotate(day=TruncDay("date"))
-            .values("day")
+            qs.annotate(bucket=cls._bucket(ctx))
+            .values("bucket")
             .annotate(
-                income=Sum(
-                    Case(
-                        When(transaction_type=Transaction.Types.INCOME,
-                             then="amount"),
-                        default=Value(0),
-                        output_field=DecimalField(),
-                    )
-                ),
-                expense=Sum(
-                    Case(
-                        When(transaction_type=Transaction.Types.EXPENSE,
-                             then="amount"),
-                        default=Value(0),
-                        output_field=DecimalField(),
-                    )
-                ),
+                income=cls._sum_by_type(Transaction.Types.INCOME, field),
+                expense=cls._sum_by_type(Transaction.Types.EXPENSE, field),
             )
-            .order_by("day")
+            .order_by("bucket")
         )
 
-        return CashflowTrend(
-            points=[
-                CashflowPoint(
-                    date=row["day"],
-                    income=row["income"] or Decimal("0"),
-                    expense=row["expense"] or Decimal("0"),
-                )
-                for row in qs
-            ]
+        return cls._build_cashflow([
+            CashflowPoint(
+                date=row["bucket"],
+                income=row["income"] or Decimal("0"),
+                expense=row["expense"] or Decimal("0"),
+            )
+            for row in qs
+        ])
+
+    @classmethod
+    def _build_cashflow(cls, points: list[CashflowPoint]) -> CashflowTrend:
+        """Cap the trend at CHART_MAX_POINTS, keeping its peaks."""
+        indices = SeriesEngine.downsample_indices(
+            [point.income for point in points],
+            [point.expense for point in points],
         )
+        return CashflowTrend(points=SeriesEngine.take(points, indices))
 
     @classmethod
+    @cached_analytics
     def get_pie_diagram(
             cls,
-            target,
-            transaction_type,
+            ctx: AnalyticsContext,
+            transaction_type: str,
+            top_n: int | None = None,
     ) -> PieDiagramData:
-        qs = (
-            Transaction.objects.filter(
-                target=target.budget,
-                transaction_type=transaction_type
+        """
+        Transaction count per category within the context range,
+        optionally keeping the `top_n` largest categories and folding
+        the rest into "Other".
+        """
+        if cls.uses_rollups(ctx):
+            qs = (
+                cls.get_rollup_queryset(ctx)
+                .filter(transaction_type=transaction_type)
+                .values("category__name")
+                .annotate(total=Sum("count"))
+            )
+        else:
+            qs = (
+                cls.get_range_queryset(ctx)
+                .filter(transaction_type=transaction_type)
+                .values("category__name")
+                .annotate(total=Count("id"))
             )
-            .values("category__name")
-            .annotate(total=Count("id"))
-        )
 
-        tags = {}
+        counts = {}
         for row in qs:
-            name = row["category__name"] or "Other"
-            tags[name] = row["total"]
+            name = row["category__name"] or cls.OTHER_TAG
+            counts[name] = counts.get(name, 0) + row["total"]
+
+        return cls._build_pie(counts, top_n)
+
+    @classmethod
+    def _build_pie(
+            cls,
+            counts: dict[str, int],
+            top_n: int | None = None
+    ) -> PieDiagramData:
+        ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
 
-        total_count = sum(tags.values())
+        tags = {}
+        other = 0
+        for name, count in ranked:
+            if name == cls.OTHER_TAG or (top_n and len(tags) >= top_n):
+                other += count
+            else:
+                tags[name] = count
+        if other:
+            tags[cls.OTHER_TAG] = other
 
         return PieDiagramData(
-            count=total_count,
+            count=sum(tags.values()),
             tags=tags
         )
 
     @classmethod
+    @cached_analytics
     def get_category_stats(
             cls,
             ctx: AnalyticsContext,
             transaction_type: str
     ) -> PieDiagramSegment:
-        qs = (
-            cls._base_queryset(ctx)
-            .filter(transaction_type=transaction_type)
-            .values("category__name", "category__category_type")
-            .annotate(
-                total_count=Count("id"),
-                total_amount=Sum("amount"),
-                avg_amount=Avg("amount"),
+        """Count and amount per category within the context range."""
+        if cls.uses_rollups(ctx):
+            qs = (
+                cls.get_rollup_queryset(ctx)
+                .filter(transaction_type=transaction_type)
+                .values("category__name", "category__category_type")
+                .annotate(
+                    total_count=Sum("count"),
+                    total_amount=Sum("total"),
+                )
             )
-            .order_by("-total_amount")
+        else:
+            qs = (
+                cls.get_range_queryset(ctx)
+                .filter(transaction_type=transaction_type)
+                .values("category__name", "category__category_type")
+                .annotate(
+                    total_count=Count("id"),
+                    total_amount=Sum("amount"),
+                )
+            )
+
+        return cls._build_category_stats(
+            list(qs.order_by("-total_amount")),
+            transaction_type,
         )
 
+    @classmethod
+    def _build_category_stats(
+            cls,
+            rows: list[dict],
+            transaction_type: str
+    ) -> PieDiagramSegment:
         grand_total = sum(
-            (row["total_amount"] or 0) for row in qs
+            (row["total_amount"] or 0) for row in rows
         ) or Decimal("1")
 
         tags = []
-        for row in qs:
+        for row in rows:
             amount = row["total_amount"] or Decimal("0")
             tags.append(TagPieDiagram(
-                tag_name=row["category__name"] or "Other",
+                tag_name=row["category__name"] or cls.OTHER_TAG,
                 tag_type=row["category__category_type"] or transaction_type,
                 total_count=row["total_count"],
                 total_amount=int(amount),
-                avg_amount=float(row["avg_amount"] or 0),
+                avg_amount=float(amount / row["total_count"]),
                 percentage=round((amount / grand_total) * 100, 2),
             ))
 
         return PieDiagramSegment(points=tags)
+
+    @classmethod
+    def _get_bundle_rows(cls, ctx: AnalyticsContext) -> QuerySet:
+        """
+        (bucket, type, category name, category type, count, total) within
+        the context range, from rollups where the context allows it.
+        """
+        if cls.uses_rollups(ctx):
+            qs, rows, amount = (
+                cls.get_rollup_queryset(ctx), Sum("count"), Sum("total")
+            )
+        else:
+            qs, rows, amount = (
+                cls.get_range_queryset(ctx), Count("id"), Sum("amount")
+            )
+
+        return (
+            qs.annotate(bucket=cls._bucket(ctx))
+            .values(
+                "bucket",
+                "transaction_type",
+                "category__name",
+                "category__category_type",
+            )
+            .annotate(rows=rows, amount=amount)
+            .values_list(
+                "bucket",
+                "transaction_type",
+                "category__name",
+                "category__category_type",
+                "rows",
+                "amount",
+            )
+            .order_by("bucket")
+        )
+
+    @classmethod
+    @cached_analytics
+    def get_dashboard_bundle(
+            cls,
+            ctx: AnalyticsContext,
+            pie_top_n: int | None = None,
+    ) -> DashboardBundle:
+        """
+        Everything the personal dashboard shows for one range, derived
+        in memory from a single grouped query (rollups, or transactions
+        for datetime-bounded ranges).
+        """
+        income = expense = Decimal("0")
+        buckets = {}
+        pies = {t_type: {} for t_type in Transaction.Types.values}
+        categories = {t_type: {} for t_type in Transaction.Types.values}
+
+        for bucket, t_type, name, category_type, count, total in (
+                cls._get_bundle_rows(ctx)
+        ):
+            point = buckets.setdefault(
+                bucket,
+                CashflowPoint(
+                    date=bucket,
+                    income=Decimal("0"),
+                    expense=Decimal("0"),
+                )
+            )
+            if t_type == Transaction.Types.INCOME:
+                point.income += total
+                income += total
+            elif t_type == Transaction.Types.EXPENSE:
+                point.expense += total
+                expense += total
+
+            tags = pies[t_type]
+            tag = name or cls.OTHER_TAG
+            tags[tag] = tags.get(tag, 0) + count
+
+            row = categories[t_type].setdefault(
+                (name, category_type),
+                {
+                    "category__name": name,
+                    "category__category_type": category_type,
+                    "total_count": 0,
+                    "total_amount": Decimal("0"),
+                }
+            )
+            row["total_count"] += count
+            row["total_amount"] += total
+
+        def category_stats(t_type: str) -> PieDiagramSegment:
+            return cls._build_category_stats(
+                sorted(
+                    categories[t_type].values(),
+                    key=lambda row: row["total_amount"],
+                    reverse=True,
+                ),
+                t_type,
+            )
+
+        return DashboardBundle(
+            kpi=DashboardKPI(
+                total_income=income,
+                total_expense=expense,
+                balance=income - expense,
+            ),
+            cashflow=cls._build_cashflow(list(buckets.values())),
+            pie_income=cls._build_pie(
+                pies[Transaction.Types.INCOME],
+                pie_top_n,
+            ),
+            pie_expense=cls._build_pie(
+                pies[Transaction.Types.EXPENSE],
+                pie_top_n,
+            ),
+            category_income=category_stats(Transaction.Types.INCOME),
+            category_expense=category_stats(Transaction.Types.EXPENSE),
+        )
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Iterable
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from addition_info.choise_models import Status
+from dashboard.services.event_stats import EventAnalyticsService
+from dashboard.services.transactions_stats import TransactionStatsService
+from events.models import Event
+from finances.models import Budget
+from finances.services.budget_loader import BudgetLoader
+from groups.models import Group
+
+User = get_user_model()
+
+
+class DashboardWarmupService:
+    """
+    Precomputes the cached analytics a user is about to open: the
+    current-month personal dashboard and the charts of their active
+    events and groups. Runs outside the web workers, from the
+    warm_dashboards command, and only pays off with a cache shared by
+    all processes.
+    """
+
+    @classmethod
+    def active_events(cls, user: User) -> QuerySet[Event]:
+        return Event.objects.filter(
+            Q(creator=user)
+            | Q(memberships__user=user,
+                memberships__status=Status.ACCEPTED),
+            status__in=(
+                Event.EventStatus.PLANNED,
+                Event.EventStatus.ONGOING,
+            ),
+        ).distinct()
+
+    @classmethod
+    def active_groups(cls, user: User) -> QuerySet[Group]:
+        return Group.objects.filter(
+            Q(creator=user)
+            | Q(memberships__user=user,
+                memberships__status=Status.ACCEPTED),
+            Q(end_date__isnull=True) | Q(end_date__gte=timezone.localdate()),
+        ).distinct()
+
+    @classmethod
+    def warm_budget(cls, budget: Budget, personal: bool = False) -> None:
+        ctx = TransactionStatsService.current_month_context(budget.id)
+        if personal:
+            # the personal page and all of its charts read the bundle
+            TransactionStatsService.get_dashboard_bundle(
+                ctx,
+                pie_top_n=TransactionStatsService.PIE_TOP_N,
+            )
+            return
+
+        TransactionStatsService.get_kpi(ctx)
+        TransactionStatsService.get_cashflow(ctx)
+
+    @classmethod
+    def warm_event(cls, event: Event) -> None:
+        budget = event.budget
+
+        EventAnalyticsService.get_event_accumulative_stats(event, budget)
+        if event.event_type == Event.EventType.SAVINGS:
+            EventAnalyticsService.get_event_savings_stats(budget=budget)
+        elif event.start_date and event.end_date:
+            if event.event_type == Event.EventType.EXPENSES:
+                EventAnalyticsService.get_event_expense_stats(
+                    start=event.start_date,
+                    end=event.end_date,
+                    budget=budget,
+                    total_expense=event.planned_amount,
+                )
+            else:
+                EventAnalyticsService.accumulate_stats(
+                    start=event.start_date,
+                    end=event.end_date,
+                    budget=budget,
+                    planed_goal=event.planned_amount,
+                )
+        cls.warm_budget(budget)
+
+    @classmethod
+    def warm_user(cls, user_id: int) -> int:
+        """Warm everything for one user; returns the budgets warmed."""
+        user = User.objects.filter(pk=user_id).first()
+        if user is None:
+            return 0
+
+        warmed = 0
+        budget = user.budget
+        if budget is not None:
+            cls.warm_budget(budget, personal=True)
+            warmed += 1
+
+        for event in BudgetLoader.prefetch_budgets(cls.active_events(user)):
+            if event.budget is not None:
+                cls.warm_event(event)
+                warmed += 1
+
+        for group in BudgetLoader.prefetch_budgets(cls.active_groups(user)):
+            if group.budget is not None:
+                cls.warm_budget(group.budget)
+                warmed += 1
+
+        return warmed
+
+    @classmethod
+    def logged_in_since(cls, since: datetime) -> Iterable[int]:
+        return (
+            User.objects
+            .filter(is_active=True, last_login__gte=since)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
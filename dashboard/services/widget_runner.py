@@ -0,0 +1,67 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+Widget = Callable[[], Any]
+
+
+class WidgetRunner:
+    """
+    Evaluates independent dashboard widgets (analytics service calls)
+    on a bounded thread pool, so a page waits for its slowest widget
+    instead of the sum of all of them. Only worth it for pages with
+    several widgets; a single one runs on the caller's thread.
+
+    Every pool thread keeps its own database connection, reused across
+    widgets for CONN_MAX_AGE like request connections are. Inside an
+    open transaction the widgets run one after another on the caller's
+    connection, since other connections cannot see its uncommitted rows.
+    """
+
+    _executor = None
+    _executor_size = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def workers(cls) -> int:
+        return getattr(settings, "DASHBOARD_WIDGET_WORKERS", 4)
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        workers = cls.workers()
+        with cls._lock:
+            if cls._executor is None or cls._executor_size != workers:
+                if cls._executor is not None:
+                    cls._executor.shutdown(wait=False)
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="dashboard-widget",
+                )
+                cls._executor_size = workers
+            return cls._executor
+
+    @staticmethod
+    def _evaluate(widget: Widget) -> Any:
+        close_old_connections()
+        try:
+            return widget()
+        finally:
+            close_old_connections()
+
+    @classmethod
+    def _sequential(cls) -> bool:
+        return cls.workers() <= 1 or connection.in_atomic_block
+
+    @classmethod
+    def run(cls, widgets: dict[str, Widget]) -> dict[str, Any]:
+        if cls._sequential() or len(widgets) < 2:
+            return {name: widget() for name, widget in widgets.items()}
+
+        futures = {
+            name: cls.executor().submit(cls._evaluate, widget)
+            for name, widget in widgets.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
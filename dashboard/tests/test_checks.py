@@ -0,0 +1,19 @@
+from django.core import checks
+from django.test import SimpleTestCase, override_settings
+
+from dashboard.checks import check_shared_cache
+
+
+class SharedCacheCheckTest(SimpleTestCase):
+    def test_configured_cache_is_shared(self):
+        self.assertEqual(check_shared_cache(None), [])
+
+    @override_settings(CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    })
+    def test_refuses_per_process_cache(self):
+        errors = checks.run_checks(tags=[checks.Tags.caches])
+
+        self.assertIn("dashboard.E001", [error.id for error in errors])
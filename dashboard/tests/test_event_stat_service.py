@@ -116,3 +116,56 @@ class EventAnalyticsServiceTest(TestCase):
         self.assertIn("Owner", data["status_labels"])
         self.assertIn("Member", data["status_labels"])
         self.assertIn(1, data["status_data"])
+
+    def test_expense_and_accumulate_series(self):
+        today = timezone.localdate()
+        start = today - timedelta(days=3)
+        self.create_transaction(amount="40", days_ago=2, payer=self.user1)
+        Transaction.objects.create(
+            target=self.budget,
+            transaction_type=Transaction.Types.EXPENSE,
+            amount=Decimal("25"),
+            payer=self.user1,
+            date=timezone.now() - timedelta(days=1),
+        )
+
+        expense = EventAnalyticsService.get_event_expense_stats(
+            start, today, self.budget, Decimal("100")
+        )
+        income = EventAnalyticsService.accumulate_stats(
+            start, today, self.budget, Decimal("100")
+        )
+
+        self.assertEqual(
+            expense["labels"][0], start.strftime("%d.%m.%Y")
+        )
+        self.assertEqual(expense["real_points"], [100.0, 100.0, 75.0, 75.0])
+        self.assertEqual(
+            expense["project_points"], [75.0, 50.0, 25.0, 0.0]
+        )
+        self.assertEqual(income["real_points"], [0.0, 40.0, 40.0, 40.0])
+        self.assertEqual(
+            income["project_points"], [25.0, 50.0, 75.0, 100.0]
+        )
+
+    def test_savings_series_fills_days_without_transactions(self):
+        today = timezone.localdate()
+        self.create_transaction(amount="50", days_ago=4, payer=self.user1)
+        Transaction.objects.create(
+            target=self.budget,
+            transaction_type=Transaction.Types.EXPENSE,
+            amount=Decimal("20"),
+            payer=self.user1,
+            date=timezone.now() - timedelta(days=1),
+        )
+
+        data = EventAnalyticsService.get_event_savings_stats(self.budget)
+
+        self.assertEqual(
+            data["labels"],
+            [
+                (today - timedelta(days=days)).strftime("%d.%m.%Y")
+                for days in (4, 3, 2, 1)
+            ],
+        )
+        self.assertEqual(data["data_points"], [50.0, 50.0, 50.0, 30.0])
@@ -1,15 +1,35 @@
-from datetime import timedelta
+import threading
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from io import StringIO
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 
 from dashboard.DTO import AnalyticsContext
+from dashboard.services.analytics_cache import AnalyticsCache
+from dashboard.services.group_stats import GroupStatsService
+from dashboard.services.series_engine import SeriesEngine
 from dashboard.services.transactions_stats import TransactionStatsService
+from dashboard.services.warmup_service import DashboardWarmupService
+from dashboard.services.widget_runner import WidgetRunner
+from events.models import Event
 from finances.models import Transaction, Category
+from groups.models import Group, GroupEventConnection
 
+# query counts below are those of the analytics themselves, so the
+# results are cached in process memory rather than the cache table
+LOCAL_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
 
+
+@override_settings(CACHES=LOCAL_CACHES)
 class TransactionStatsServiceTest(TestCase):
     def setUp(self):
         self.user = get_user_model().objects.create_user(
@@ -40,11 +60,12 @@ class TransactionStatsServiceTest(TestCase):
             payer=self.user,
         )
 
-    def ctx(self, *, date_from=None, date_to=None):
+    def ctx(self, *, date_from=None, date_to=None, granularity="day"):
         return AnalyticsContext(
             target_budget_id=self.budget.id,
             date_from=date_from or self.now - timedelta(days=1),
             date_to=date_to or self.now + timedelta(days=1),
+            granularity=granularity,
         )
 
     def test_get_kpi(self):
@@ -126,7 +147,7 @@ class TransactionStatsServiceTest(TestCase):
         )
 
         data = TransactionStatsService.get_pie_diagram(
-            target=self.user,
+            ctx=self.ctx(),
             transaction_type=Transaction.Types.EXPENSE,
         )
 
@@ -134,6 +155,36 @@ class TransactionStatsServiceTest(TestCase):
         self.assertEqual(data.tags["Food"], 2)
         self.assertEqual(data.tags["Transport"], 1)
 
+    def test_get_pie_diagram_range_and_top_n(self):
+        today = timezone.localdate()
+        for name, count in (("Food", 3), ("Rent", 2), ("Taxi", 1)):
+            category = self.create_category(
+                name,
+                Transaction.Types.EXPENSE
+            )
+            for _ in range(count):
+                self.create_transaction(
+                    amount="10",
+                    type_=Transaction.Types.EXPENSE,
+                    category=category,
+                )
+        self.create_transaction(
+            amount="10",
+            type_=Transaction.Types.EXPENSE,
+            category=None,
+            date=self.now - timedelta(days=30),
+        )
+
+        ctx = self.ctx(date_from=today - timedelta(days=7), date_to=today)
+        data = TransactionStatsService.get_pie_diagram(
+            ctx,
+            Transaction.Types.EXPENSE,
+            top_n=1,
+        )
+
+        self.assertEqual(data.count, 6)
+        self.assertEqual(data.tags, {"Food": 3, "Other": 3})
+
     def test_get_category_stats(self):
         food = self.create_category("Food", Transaction.Types.EXPENSE)
 
@@ -147,6 +198,12 @@ class TransactionStatsServiceTest(TestCase):
             type_=Transaction.Types.EXPENSE,
             category=food
         )
+        self.create_transaction(
+            amount="500",
+            type_=Transaction.Types.EXPENSE,
+            category=food,
+            date=self.now - timedelta(days=40)
+        )
 
         result = TransactionStatsService.get_category_stats(
             self.ctx(),
@@ -159,3 +216,391 @@ class TransactionStatsServiceTest(TestCase):
         self.assertEqual(point.total_amount, 40)
         self.assertEqual(point.avg_amount, 20.0)
         self.assertEqual(point.percentage, 100.0)
+
+    def test_date_ranges_read_rollups(self):
+        food = self.create_category("Food", Transaction.Types.EXPENSE)
+        today = timezone.localdate()
+
+        self.create_transaction(
+            amount="50",
+            type_=Transaction.Types.EXPENSE,
+            category=food,
+            date=self.now - timedelta(days=1)
+        )
+        self.create_transaction(
+            amount="70",
+            type_=Transaction.Types.EXPENSE,
+            category=food,
+        )
+
+        ctx = self.ctx(date_from=today - timedelta(days=1), date_to=today)
+        self.assertTrue(TransactionStatsService.uses_rollups(ctx))
+
+        with self.assertNumQueries(1):
+            trend = TransactionStatsService.get_cashflow(ctx)
+
+        self.assertEqual(
+            [point.expense for point in trend.points],
+            [Decimal("50"), Decimal("70")]
+        )
+        self.assertEqual(
+            TransactionStatsService.get_kpi(ctx).total_expense,
+            Decimal("120")
+        )
+
+    def test_series_are_bucketed_by_granularity(self):
+        food = self.create_category("Food", Transaction.Types.EXPENSE)
+        for day, amount in ((2, "50"), (20, "70")):
+            self.create_transaction(
+                amount=amount,
+                type_=Transaction.Types.EXPENSE,
+                category=food,
+                date=timezone.make_aware(datetime(2025, 3, day, 12)),
+            )
+
+        rollup_ctx = self.ctx(
+            date_from=date(2025, 3, 1),
+            date_to=date(2025, 3, 31),
+            granularity="month",
+        )
+        scan_ctx = self.ctx(
+            date_from=timezone.make_aware(datetime(2025, 3, 1)),
+            date_to=timezone.make_aware(datetime(2025, 4, 1)),
+            granularity="month",
+        )
+        for ctx in (rollup_ctx, scan_ctx):
+            with self.subTest(rollups=TransactionStatsService.uses_rollups(
+                    ctx)):
+                for trend in (
+                        TransactionStatsService.get_cashflow(ctx),
+                        TransactionStatsService.get_dashboard_bundle(
+                            ctx
+                        ).cashflow,
+                ):
+                    self.assertEqual(len(trend.points), 1)
+                    self.assertEqual(
+                        trend.points[0].expense, Decimal("120")
+                    )
+
+        self.assertEqual(
+            TransactionStatsService.get_cashflow(rollup_ctx).points[0].date,
+            date(2025, 3, 1),
+        )
+
+    def test_get_dashboard_bundle(self):
+        salary = self.create_category("Salary", Transaction.Types.INCOME)
+        food = self.create_category("Food", Transaction.Types.EXPENSE)
+        today = timezone.localdate()
+
+        self.create_transaction(
+            amount="1000",
+            type_=Transaction.Types.INCOME,
+            category=salary
+        )
+        self.create_transaction(
+            amount="30",
+            type_=Transaction.Types.EXPENSE,
+            category=food,
+            date=self.now - timedelta(days=40)
+        )
+        self.create_transaction(
+            amount="20",
+            type_=Transaction.Types.EXPENSE,
+            category=None,
+        )
+
+        # whole days from rollups, datetime bounds from transactions
+        contexts = [
+            self.ctx(date_from=today - timedelta(days=7), date_to=today),
+            self.ctx(),
+        ]
+        for ctx in contexts:
+            with self.subTest(ctx=ctx):
+                with self.assertNumQueries(1):
+                    bundle = TransactionStatsService.get_dashboard_bundle(
+                        ctx
+                    )
+
+                self.assertEqual(
+                    bundle.kpi,
+                    TransactionStatsService.get_kpi(ctx)
+                )
+                self.assertEqual(
+                    bundle.cashflow,
+                    TransactionStatsService.get_cashflow(ctx)
+                )
+                self.assertEqual(
+                    bundle.pie_expense,
+                    TransactionStatsService.get_pie_diagram(
+                        ctx=ctx,
+                        transaction_type=Transaction.Types.EXPENSE,
+                    )
+                )
+                self.assertEqual(
+                    bundle.category_expense,
+                    TransactionStatsService.get_category_stats(
+                        ctx,
+                        Transaction.Types.EXPENSE,
+                    )
+                )
+                self.assertEqual(bundle.pie_income.tags, {"Salary": 1})
+                self.assertEqual(
+                    [p.tag_name for p in bundle.category_expense.points],
+                    ["Other"]
+                )
+                self.assertEqual(bundle.pie_expense.tags, {"Other": 1})
+
+
+class AnalyticsCacheTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="cacheuser",
+            password="1Qazcde3",
+        )
+        self.budget = self.user.budget
+        today = timezone.localdate()
+        self.ctx = AnalyticsContext(
+            target_budget_id=self.budget.id,
+            date_from=today - timedelta(days=7),
+            date_to=today,
+        )
+        AnalyticsCache.reset_stats()
+
+    def add_income(self, amount):
+        Transaction.objects.create(
+            target=self.budget,
+            transaction_type=Transaction.Types.INCOME,
+            amount=Decimal(amount),
+            payer=self.user,
+        )
+
+    def test_unchanged_budget_is_served_from_cache(self):
+        self.add_income("100")
+
+        first = TransactionStatsService.get_kpi(self.ctx)
+        # the budget version and the result, both from the cache table
+        with self.assertNumQueries(2):
+            second = TransactionStatsService.get_kpi(self.ctx)
+
+        self.assertEqual(first, second)
+        self.assertEqual(AnalyticsCache.stats()["hits"], 1)
+        self.assertEqual(AnalyticsCache.stats()["misses"], 1)
+
+    def test_transaction_write_invalidates(self):
+        self.add_income("100")
+        TransactionStatsService.get_kpi(self.ctx)
+
+        self.add_income("50")
+        kpi = TransactionStatsService.get_kpi(self.ctx)
+
+        self.assertEqual(kpi.total_income, Decimal("150"))
+        self.assertEqual(AnalyticsCache.stats()["misses"], 2)
+
+
+class GroupStatsServiceTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="groupstats",
+            password="1Qazcde3",
+        )
+        self.group = Group.objects.create(name="Flat", creator=self.user)
+        self.today = timezone.localdate()
+        for days_ago in range(0, 200, 10):
+            Transaction.objects.create(
+                target=self.group.budget,
+                transaction_type=Transaction.Types.INCOME,
+                amount=Decimal("10"),
+                payer=self.user,
+                date=timezone.now() - timedelta(days=days_ago),
+            )
+
+    def test_granularity_is_bounded_by_max_points(self):
+        data = GroupStatsService.get_bar_chart_data(pk=self.group.id)
+
+        self.assertEqual(data.granularity, "week")
+        self.assertLessEqual(len(data.labels), GroupStatsService.MAX_POINTS)
+        self.assertEqual(sum(data.incomes), 200.0)
+
+    def test_explicit_granularity_and_range(self):
+        data = GroupStatsService.get_bar_chart_data(
+            pk=self.group.id,
+            date_from=self.today - timedelta(days=29),
+            date_to=self.today,
+            granularity="year",
+        )
+        self.assertEqual(data.granularity, "year")
+        self.assertEqual(sum(data.incomes), 30.0)
+
+        data = GroupStatsService.get_bar_chart_data(
+            pk=self.group.id,
+            date_from=self.today - timedelta(days=29),
+            date_to=self.today,
+        )
+        self.assertEqual(data.granularity, "day")
+        self.assertEqual(len(data.labels), 3)
+
+    def test_get_consolidated(self):
+        trip = Event.objects.create(name="Trip", planned_amount=500)
+        party = Event.objects.create(name="Party")
+        Event.objects.create(name="Unlinked")
+        for event in (trip, party):
+            GroupEventConnection.objects.create(group=self.group, event=event)
+        Transaction.objects.create(
+            target=trip.budget,
+            transaction_type=Transaction.Types.EXPENSE,
+            amount=Decimal("40"),
+            payer=self.user,
+        )
+        ContentType.objects.get_for_models(Group, Event)
+
+        with self.assertNumQueries(1):
+            data = GroupStatsService.get_consolidated(self.group)
+
+        self.assertEqual(
+            [row.name for row in data.breakdown],
+            ["Flat", "Trip", "Party"]
+        )
+        self.assertEqual(data.total_income, Decimal("200"))
+        self.assertEqual(data.total_expenses, Decimal("40"))
+        self.assertEqual(data.planned_amount, Decimal("500"))
+        self.assertEqual(data.breakdown[1].total_expenses, Decimal("40"))
+
+
+class SeriesEngineTest(TestCase):
+    def test_gap_filled_axis_and_labels(self):
+        start = date(2024, 12, 30)
+        axis = SeriesEngine.date_axis(start, date(2025, 1, 2))
+        values = SeriesEngine.daily_values(
+            axis,
+            [
+                (date(2025, 1, 1), Decimal("2.5")),
+                (date(2025, 1, 1), Decimal("1")),
+                (date(2025, 2, 1), Decimal("9")),
+            ],
+        )
+
+        self.assertEqual(values.tolist(), [0.0, 0.0, 3.5, 0.0])
+        self.assertEqual(
+            SeriesEngine.labels(axis, "%d %b"),
+            [day.strftime("%d %b") for day in (
+                start + timedelta(days=i) for i in range(4)
+            )],
+        )
+        self.assertEqual(
+            SeriesEngine.labels(axis, "%d.%m.%Y")[-1], "02.01.2025"
+        )
+        self.assertEqual(
+            SeriesEngine.running_total(values, 10, sign=-1).tolist(),
+            [10.0, 10.0, 6.5, 6.5],
+        )
+
+    def test_empty_axis(self):
+        axis = SeriesEngine.date_axis(date(2025, 1, 2), date(2025, 1, 1))
+
+        self.assertEqual(SeriesEngine.labels(axis, "%d"), [])
+        self.assertEqual(SeriesEngine.daily_values(axis, []).size, 0)
+
+    def test_downsampling_keeps_peaks(self):
+        values = [float(i % 7) for i in range(500)]
+        values[321] = 100.0
+
+        lttb = SeriesEngine.downsample_indices(values, max_points=50)
+        self.assertEqual(len(lttb), 50)
+        self.assertIn(321, lttb.tolist())
+        self.assertEqual((lttb[0], lttb[-1]), (0, 499))
+
+        expenses = [0.0] * 500
+        expenses[42] = -80.0
+        minmax = SeriesEngine.downsample_indices(
+            values, expenses, max_points=50
+        )
+        self.assertLessEqual(len(minmax), 50)
+        self.assertIn(321, minmax.tolist())
+        self.assertIn(42, minmax.tolist())
+
+    @override_settings(CHART_MAX_POINTS=10)
+    def test_cashflow_is_capped(self):
+        user = get_user_model().objects.create_user(
+            username="longseries",
+            password="1Qazcde3",
+        )
+        today = timezone.localdate()
+        for days_ago in range(40):
+            Transaction.objects.create(
+                target=user.budget,
+                transaction_type=Transaction.Types.INCOME,
+                amount=Decimal("500" if days_ago == 17 else "10"),
+                payer=user,
+                date=timezone.now() - timedelta(days=days_ago),
+            )
+
+        trend = TransactionStatsService.get_cashflow(AnalyticsContext(
+            target_budget_id=user.budget.id,
+            date_from=today - timedelta(days=60),
+            date_to=today,
+        ))
+
+        self.assertLessEqual(len(trend.points), 10)
+        self.assertIn(Decimal("500"), [p.income for p in trend.points])
+
+
+class WidgetRunnerTest(SimpleTestCase):
+    @override_settings(DASHBOARD_WIDGET_WORKERS=2)
+    def test_widgets_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def widget(value):
+            barrier.wait()
+            return value
+
+        results = WidgetRunner.run({
+            "first": lambda: widget(1),
+            "second": lambda: widget(2),
+        })
+
+        self.assertEqual(results, {"first": 1, "second": 2})
+
+
+class DashboardWarmupServiceTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="warmup",
+            password="1Qazcde3",
+        )
+        self.event = Event.objects.create(
+            name="Trip",
+            creator=self.user,
+            event_type=Event.EventType.ACCUMULATIVE,
+            start_date=timezone.localdate(),
+            end_date=timezone.localdate(),
+        )
+        AnalyticsCache.reset_stats()
+
+    def test_command_warms_users_who_logged_in(self):
+        self.client.login(username="warmup", password="1Qazcde3")
+        self.assertEqual(AnalyticsCache.stats()["misses"], 0)
+
+        call_command("warm_dashboards", processes=1, stdout=StringIO())
+
+        self.assertGreater(AnalyticsCache.stats()["misses"], 0)
+        ctx = TransactionStatsService.current_month_context(
+            self.user.budget.id
+        )
+        # the budget version and the bundle, both from the cache table
+        with self.assertNumQueries(2):
+            TransactionStatsService.get_dashboard_bundle(
+                ctx=ctx,
+                pie_top_n=TransactionStatsService.PIE_TOP_N,
+            )
+
+    @override_settings(CACHES=LOCAL_CACHES)
+    def test_command_refuses_process_local_cache(self):
+        with self.assertRaises(CommandError):
+            call_command("warm_dashboards", processes=1, stdout=StringIO())
+
+    def test_warm_user_covers_active_events(self):
+        self.assertEqual(DashboardWarmupService.warm_user(self.user.pk), 2)
+
+        self.event.status = Event.EventStatus.COMPLETED
+        self.event.save()
+        self.assertEqual(DashboardWarmupService.warm_user(self.user.pk), 1)
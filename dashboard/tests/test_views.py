@@ -0,0 +1,176 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from events.models import Event
+from finances.models import Transaction
+from groups.models import Group
+
+
+class ChartDataViewTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="charts",
+            password="1Qazcde3",
+        )
+        self.client.force_login(self.user)
+        self.url = reverse("dashboard:personal-chart", args=["cashflow"])
+
+    def add_income(self, target, amount="100"):
+        Transaction.objects.create(
+            target=target,
+            transaction_type=Transaction.Types.INCOME,
+            amount=Decimal(amount),
+            payer=self.user,
+        )
+
+    def test_cashflow_json_with_etag(self):
+        self.add_income(self.user.budget)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("no-cache", response["Cache-Control"])
+        points = response.json()["points"]
+        self.assertEqual(len(points), 1)
+        self.assertEqual(Decimal(points[0]["income"]), Decimal("100"))
+
+    def test_if_none_match_skips_analytics(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        for query in queries:
+            self.assertNotIn("transactions", query["sql"])
+            self.assertNotIn("budget_daily_rollups", query["sql"])
+
+    def test_write_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.add_income(self.user.budget)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_personal_charts_share_the_dashboard_bundle(self):
+        self.add_income(self.user.budget)
+        self.client.get(self.url)
+
+        for chart in ("pie-income", "category-income", "category-expense"):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    reverse("dashboard:personal-chart", args=[chart])
+                )
+            self.assertEqual(response.status_code, 200)
+            for query in queries:
+                self.assertNotIn("budget_daily_rollups", query["sql"])
+
+        points = self.client.get(
+            reverse("dashboard:personal-chart", args=["category-income"])
+        ).json()["points"]
+        self.assertEqual([p["total_count"] for p in points], [1])
+
+    def test_event_and_group_charts(self):
+        today = timezone.localdate()
+        event = Event.objects.create(
+            name="Trip",
+            creator=self.user,
+            start_date=today - timedelta(days=2),
+            end_date=today,
+            planned_amount=Decimal("300"),
+            event_type=Event.EventType.ACCUMULATIVE,
+        )
+        self.add_income(event.budget)
+        group = Group.objects.create(name="Flat", creator=self.user)
+
+        series = self.client.get(
+            reverse("dashboard:event-chart", args=[event.pk, "accumulate"])
+        ).json()
+        self.assertEqual(len(series["labels"]), 3)
+        self.assertEqual(series["real_points"][-1], 100.0)
+
+        response = self.client.get(
+            reverse("dashboard:group-chart", args=[group.pk, "bar"])
+        )
+        self.assertEqual(response.json()["labels"], [])
+
+        response = self.client.get(
+            reverse("dashboard:group-chart", args=[group.pk, "pie"])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_event_chart_must_match_event_type(self):
+        event = Event.objects.create(
+            name="Fund",
+            creator=self.user,
+            event_type=Event.EventType.SAVINGS,
+        )
+
+        for chart in ("expense", "accumulate"):
+            with self.subTest(chart=chart):
+                response = self.client.get(
+                    reverse("dashboard:event-chart", args=[event.pk, chart])
+                )
+                self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(
+            reverse("dashboard:event-chart", args=[event.pk, "savings"])
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_dated_event_chart_without_dates_is_404(self):
+        event = Event.objects.create(
+            name="Repairs",
+            creator=self.user,
+            event_type=Event.EventType.EXPENSES,
+            start_date=timezone.localdate(),
+        )
+
+        response = self.client.get(
+            reverse("dashboard:event-chart", args=[event.pk, "expense"])
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class PersonalDashViewTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="asyncdash",
+            password="1Qazcde3",
+        )
+        Transaction.objects.create(
+            target=self.user.budget,
+            transaction_type=Transaction.Types.INCOME,
+            amount=Decimal("250"),
+            payer=self.user,
+        )
+
+    async def test_async_views_render_kpi(self):
+        await self.async_client.aforce_login(self.user)
+        today = timezone.localdate()
+
+        response = await self.async_client.get(
+            reverse("dashboard:personal-dash")
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["kpi"].total_income,
+            Decimal("250")
+        )
+
+        response = await self.async_client.get(
+            reverse("dashboard:personal-dash-stats"),
+            {"from": today.replace(day=1).isoformat(), "to": today},
+        )
+        self.assertContains(response, "250")
@@ -3,7 +3,10 @@ from django.urls import path
 from dashboard.views import (
     HomeDashboard,
     PersonalDashView,
-    PersonalDashStatsView
+    PersonalDashStatsView,
+    PersonalChartView,
+    EventChartView,
+    GroupChartView,
 )
 
 urlpatterns = [
@@ -18,6 +21,21 @@ urlpatterns = [
         "personal/dash/stats/", PersonalDashStatsView.as_view(),
         name="personal-dash-stats"
     ),
+    path(
+        "charts/personal/<str:chart>/",
+        PersonalChartView.as_view(),
+        name="personal-chart"
+    ),
+    path(
+        "charts/event/<int:pk>/<str:chart>/",
+        EventChartView.as_view(),
+        name="event-chart"
+    ),
+    path(
+        "charts/group/<int:pk>/<str:chart>/",
+        GroupChartView.as_view(),
+        name="group-chart"
+    ),
 
 ]
 
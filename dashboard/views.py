@@ -1,12 +1,39 @@
-from _datetime import datetime
+from dataclasses import asdict, is_dataclass
+from datetime import date
 from typing import Any
 
-from django.utils import timezone
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date
+from django.views import View
 from django.views.generic import TemplateView
 
 from dashboard.DTO import AnalyticsContext
+from dashboard.services.analytics_cache import AnalyticsCache
+from dashboard.services.event_stats import EventAnalyticsService
+from dashboard.services.group_stats import GroupStatsService
 from dashboard.services.transactions_stats import TransactionStatsService
-from finances.models import Transaction
+from events.models import Event
+from finances.models import Budget
+from groups.models import Group
+
+
+def parse_range(
+        request: HttpRequest,
+        from_param: str = "from",
+        to_param: str = "to"
+) -> tuple[date | None, date | None]:
+    """Read an ISO date range from GET, ignoring malformed values."""
+    bounds = []
+    for name in (from_param, to_param):
+        try:
+            bounds.append(parse_date(request.GET.get(name, "")))
+        except ValueError:
+            bounds.append(None)
+    return bounds[0], bounds[1]
 
 
 class HomeDashboard(TemplateView):
@@ -14,80 +41,230 @@ class HomeDashboard(TemplateView):
 
 
 class PersonalDashView(TemplateView):
+    """
+    Async under ASGI: the page is one cached bundle, computed off the
+    event loop on the request's own connection.
+    """
+
     template_name = "dashboard/personal-dash.html"
+    pie_top_n = TransactionStatsService.PIE_TOP_N
 
-    def get_context_data(self, **kwargs) -> dict[str, Any]:
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        context = await self.get_context_data_async(**kwargs)
+        return self.render_to_response(context)
+
+    async def get_context_data_async(self, **kwargs) -> dict[str, Any]:
         context = super(PersonalDashView, self).get_context_data(**kwargs)
 
-        user = self.request.user
+        user = await self.request.auser()
+        budget = await sync_to_async(lambda: user.budget)()
+
+        context_obj = TransactionStatsService.current_month_context(
+            budget.id
+        )
+        context["default_from"] = context_obj.date_from.strftime("%Y-%m-%d")
+        context["default_to"] = context_obj.date_to.strftime("%Y-%m-%d")
+
+        bundle = await sync_to_async(
+            TransactionStatsService.get_dashboard_bundle
+        )(ctx=context_obj, pie_top_n=self.pie_top_n)
+
+        context.update({
+            "kpi": bundle.kpi,
+            "pie_income": bundle.pie_income,
+            "pie_expense": bundle.pie_expense,
+            "date_from": context["default_from"],
+            "date_to": context["default_to"],
+        })
+
+        return context
+
+
+class PersonalDashStatsView(TemplateView):
+    template_name = "dashboard/components/stats_block.html"
+
+    async def get(self, request: HttpRequest, *args, **kwargs):
+        context = await self.get_context_data_async(**kwargs)
+        return self.render_to_response(context)
+
+    async def get_context_data_async(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
 
-        today = timezone.now().date()
-        date_from = today.replace(day=1)
-        context["default_from"] = date_from.strftime("%Y-%m-%d")
-        context["default_to"] = today.strftime("%Y-%m-%d")
+        user = await self.request.auser()
+        budget = await sync_to_async(lambda: user.budget)()
+        date_from, date_to = parse_range(self.request)
+        if not (date_from and date_to):
+            raise Http404("A valid date range is required.")
 
         context_obj = AnalyticsContext(
-            target_budget_id=user.budget.id,
+            target_budget_id=budget.id,
             date_from=date_from,
-            date_to=today,
+            date_to=date_to,
         )
 
-        kpi = TransactionStatsService.get_kpi(ctx=context_obj)
-        cashflow = TransactionStatsService.get_cashflow(ctx=context_obj)
+        # the bundle also serves this range's cashflow chart
+        bundle = await sync_to_async(
+            TransactionStatsService.get_dashboard_bundle
+        )(ctx=context_obj, pie_top_n=TransactionStatsService.PIE_TOP_N)
+        context["kpi"] = bundle.kpi
+        context["date_from"] = date_from.isoformat()
+        context["date_to"] = date_to.isoformat()
 
-        pie_income = TransactionStatsService.get_pie_diagram(
-            target=user,
-            transaction_type=Transaction.Types.INCOME,
-        )
+        return context
+
+
+class ChartDataView(LoginRequiredMixin, View):
+    """
+    Chart data as JSON with a strong ETag derived from the budget
+    version. A matching If-None-Match is answered with 304 before any
+    analytics query runs; otherwise the data comes from the (cached)
+    analytics services. Subclasses name their charts and provide the
+    budget, the values the data depends on and the data itself.
+    """
+
+    charts: tuple[str, ...] = ()
 
-        pie_expense = TransactionStatsService.get_pie_diagram(
-            target=user,
-            transaction_type=Transaction.Types.EXPENSE,
+    def get_budget(self) -> Budget | None:
+        raise NotImplementedError
+
+    def get_etag_values(self) -> list[Any]:
+        return [sorted(self.request.GET.items())]
+
+    def get_chart_data(self, chart: str, budget: Budget) -> Any:
+        raise NotImplementedError
+
+    def get(self, request: HttpRequest, chart: str, **kwargs) -> HttpResponse:
+        if chart not in self.charts:
+            raise Http404("Unknown chart.")
+
+        budget = self.get_budget()
+        if budget is None:
+            raise Http404("No budget.")
+
+        etag = AnalyticsCache.etag(
+            f"chart:{type(self).__name__}:{chart}",
+            budget.pk,
+            self.get_etag_values(),
         )
 
-        pie_tag_incomes = TransactionStatsService.get_category_stats(
-            ctx=context_obj,
-            transaction_type=Transaction.Types.INCOME,
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = self.get_chart_data(chart, budget)
+            response = JsonResponse(asdict(data) if is_dataclass(data)
+                                    else data)
+
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class PersonalChartView(ChartDataView):
+    """
+    The personal dashboard's charts, each a field of the cached
+    dashboard bundle for the requested range (this month by default),
+    so the page and its charts share one analytics query.
+    """
+
+    charts = (
+        "cashflow",
+        "pie-income",
+        "pie-expense",
+        "category-income",
+        "category-expense",
+    )
+
+    def get_budget(self) -> Budget | None:
+        budget = self.request.user.budget
+        default = TransactionStatsService.current_month_context(budget.id)
+        date_from, date_to = parse_range(self.request)
+        self.analytics_ctx = AnalyticsContext(
+            target_budget_id=budget.id,
+            date_from=date_from or default.date_from,
+            date_to=date_to or default.date_to,
         )
+        return budget
 
-        pie_tag_expense = TransactionStatsService.get_category_stats(
-            ctx=context_obj,
-            transaction_type=Transaction.Types.EXPENSE,
+    def get_chart_data(self, chart: str, budget: Budget) -> Any:
+        bundle = TransactionStatsService.get_dashboard_bundle(
+            ctx=self.analytics_ctx,
+            pie_top_n=TransactionStatsService.PIE_TOP_N,
         )
+        return getattr(bundle, chart.replace("-", "_"))
 
-        context.update({
-            "kpi": kpi,
-            "cashflow": cashflow,
-            "pie_income": pie_income,
-            "pie_expense": pie_expense,
-            "pie_tag_incomes": pie_tag_incomes,
-            "pie_tag_expense": pie_tag_expense,
-        })
 
-        return context
+class EventChartView(ChartDataView):
+    charts = ("progress", "savings", "expense", "accumulate")
+    # charts that only exist for one event type; the dated ones also
+    # need both start_date and end_date
+    chart_event_types = {
+        "savings": Event.EventType.SAVINGS,
+        "expense": Event.EventType.EXPENSES,
+        "accumulate": Event.EventType.ACCUMULATIVE,
+    }
+    dated_charts = ("expense", "accumulate")
 
+    def get_budget(self) -> Budget | None:
+        self.event = get_object_or_404(Event, pk=self.kwargs["pk"])
+        chart = self.kwargs["chart"]
+        event_type = self.chart_event_types.get(chart)
+        if event_type is not None and self.event.event_type != event_type:
+            raise Http404("Chart does not match the event type.")
+        if chart in self.dated_charts and not (
+                self.event.start_date and self.event.end_date
+        ):
+            raise Http404("The event has no date range.")
+        return self.event.budget
 
-class PersonalDashStatsView(TemplateView):
-    template_name = "dashboard/components/stats_block.html"
+    def get_etag_values(self) -> list[Any]:
+        return super().get_etag_values() + [
+            self.event,
+            self.event.start_date,
+            self.event.end_date,
+            self.event.planned_amount,
+        ]
 
-    def get_context_data(self, **kwargs) -> dict[str, Any]:
-        context = super().get_context_data(**kwargs)
+    def get_chart_data(self, chart: str, budget: Budget) -> Any:
+        event = self.event
+        if chart == "progress":
+            return EventAnalyticsService.get_event_accumulative_stats(
+                event,
+                budget,
+            )
+        if chart == "savings":
+            return EventAnalyticsService.get_event_savings_stats(
+                budget=budget
+            )
+        if chart == "expense":
+            return EventAnalyticsService.get_event_expense_stats(
+                start=event.start_date,
+                end=event.end_date,
+                budget=budget,
+                total_expense=event.planned_amount,
+            )
+        return EventAnalyticsService.accumulate_stats(
+            start=event.start_date,
+            end=event.end_date,
+            budget=budget,
+            planed_goal=event.planned_amount,
+        )
 
-        user = self.request.user
-        date_from = self.request.GET["from"]
-        date_to = self.request.GET["to"]
 
-        context_obj = AnalyticsContext(
-            target_budget_id=user.budget.id,
-            date_from=datetime.strptime(date_from, "%Y-%m-%d"),
-            date_to=datetime.strptime(date_to, "%Y-%m-%d"),
-        )
+class GroupChartView(ChartDataView):
+    charts = ("bar",)
+
+    def get_budget(self) -> Budget | None:
+        self.group = get_object_or_404(Group, pk=self.kwargs["pk"])
+        return self.group.budget
 
-        context["kpi"] = TransactionStatsService.get_kpi(
-            ctx=context_obj
+    def get_chart_data(self, chart: str, budget: Budget) -> Any:
+        date_from, date_to = parse_range(
+            self.request,
+            "chart_from",
+            "chart_to",
         )
-        context["cashflow"] = TransactionStatsService.get_cashflow(
-            ctx=context_obj
+        return GroupStatsService.get_bar_chart_data(
+            pk=self.group.id,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=self.request.GET.get("granularity"),
         )
-
-        return context
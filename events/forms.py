@@ -1,7 +1,8 @@
 from django import forms
+from django.contrib.auth import get_user_model
 from django.forms import ModelForm
 
-from accounts.services.receive_connection import UserConnectionsService
+from accounts.services.connection_graph import ConnectionGraph
 from .models import Event
 
 
@@ -59,17 +60,13 @@ class EventPrivateCreateForm(forms.ModelForm):
         self.group = kwargs.pop("group", None)
         super().__init__(*args, **kwargs)
 
-        connections = UserConnectionsService.get_user_connections(
-            user.id,
-            "accepted"
+        self.fields["participants"].choices = list(
+            get_user_model().objects
+            .filter(id__in=ConnectionGraph.neighbours(user.id))
+            .order_by("username")
+            .values_list("id", "username")
         )
 
-        self.fields["participants"].choices = [
-            (
-                c.other_user(user).id,
-                c.other_user(user).username) for c in connections
-        ]
-
     def clean(self) -> None:
         cleaned_data = super().clean()
 
@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils.dateparse import parse_date
+
+from events.services.lifecycle_service import LifecycleService
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves events (Planned -> Ongoing -> Completed) and temporary "
+        "groups (-> Expired) along by date; run from cron or with --loop"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, one pass every --interval seconds",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=300,
+            help="Seconds between passes with --loop",
+        )
+        parser.add_argument(
+            "--date",
+            help="Treat this ISO date as today instead of the real one",
+        )
+
+    def handle(self, *args, **options):
+        today = None
+        if options["date"]:
+            try:
+                today = parse_date(options["date"])
+            except ValueError:
+                today = None
+            if today is None:
+                raise CommandError(f"Invalid date: {options['date']}")
+
+        if not options["loop"]:
+            self.run_once(today)
+            return
+
+        try:
+            while True:
+                self.run_once(today)
+                close_old_connections()
+                time.sleep(max(1, options["interval"]))
+        except KeyboardInterrupt:
+            self.stdout.write("Stopped")
+
+    def run_once(self, today) -> None:
+        results = LifecycleService.run(today)
+
+        for name, updated, elapsed in results:
+            self.stdout.write(
+                f"{name}: {updated} row(s) in {elapsed * 1000:.1f} ms"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Lifecycle pass updated {sum(r[1] for r in results)} row(s) "
+            f"in {sum(r[2] for r in results) * 1000:.1f} ms"
+        ))
@@ -61,6 +61,17 @@ class Event(models.Model):
 
     class Meta:
         db_table = "events"
+        indexes = [
+            # driven by the lifecycle scheduler (run_lifecycle)
+            models.Index(
+                fields=["status", "start_date"],
+                name="event_status_start",
+            ),
+            models.Index(
+                fields=["status", "end_date"],
+                name="event_status_end",
+            ),
+        ]
 
     def __str__(self):
         return f"Event: {self.name} - {self.status}"
@@ -1,12 +1,14 @@
 from typing import Any
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Case, When, F, IntegerField
 
-from accounts.models import UserConnection
+from accounts.services.connection_graph import ConnectionGraph
 from dashboard.services.event_stats import EventAnalyticsService
+from dashboard.services.widget_runner import WidgetRunner
 from finances.forms import TransferCreateForm
 from finances.models import Category
+from finances.services.category_registry import CategoryRegistry
+from finances.services.contribution_service import ContributionService
 from events.models import EventMembership, Event
 
 
@@ -40,27 +42,11 @@ class EventDetailContextService:
                 or (not event.creator and user_role == "Admin")
         )
 
-        member_ids = members_qs.values_list("user_id", flat=True)
-
-        accepted_connections = UserConnection.objects.filter(
-            status=UserConnection.Status.ACCEPTED
-        ).filter(
-            Q(from_user=user) | Q(to_user=user)
-        )
-
-        connected_user_ids = accepted_connections.annotate(
-            other_id=Case(
-                When(from_user=user, then=F("to_user_id")),
-                default=F("from_user_id"),
-                output_field=IntegerField(),
-            )
-        ).values_list("other_id", flat=True)
+        member_ids = {member.user_id for member in members_qs}
 
         potential_invites = get_user_model().objects.filter(
-            id__in=connected_user_ids
-        ).exclude(
-            id__in=member_ids
-        )
+            id__in=ConnectionGraph.neighbours(user.id) - member_ids
+        ).order_by("username")
 
         try:
             context["current_budget"] = budget.get_budget_data()
@@ -72,14 +58,13 @@ class EventDetailContextService:
             context["current_budget"] = None
             context["transaction_history"] = []
 
-        categories = Category.objects.all()
+        categories = CategoryRegistry.all()
 
         if event.event_type == event.EventType.ACCUMULATIVE:
-            categories = categories.filter(category_type=Category.Types.INCOME)
+            categories = CategoryRegistry.by_type(Category.Types.INCOME)
 
         if event.event_type == event.EventType.EXPENSES:
-            categories = categories.filter(
-                category_type=Category.Types.EXPENSE)
+            categories = CategoryRegistry.by_type(Category.Types.EXPENSE)
 
         form = TransferCreateForm()
         all_choices = form.fields["transaction_type"].choices
@@ -93,41 +78,21 @@ class EventDetailContextService:
                 c for c in all_choices if c[0] == "INCOME"
             ]
 
-        if event.event_type == Event.EventType.SAVINGS:
-            context["savings_chart_data_json"] = (
-                EventAnalyticsService.get_event_savings_stats(budget=budget)
-            )
-
-        elif event.event_type == Event.EventType.EXPENSES:
-            context["expenses_chart_data"] = (
-                EventAnalyticsService.get_event_expense_stats(
-                    start=event.start_date,
-                    end=event.end_date,
-                    budget=budget,
-                    total_expense=event.planned_amount,
-                )
-            )
-
-        elif event.event_type == Event.EventType.ACCUMULATIVE:
-            context["accum_chart_data"] = (
-                EventAnalyticsService.accumulate_stats(
-                    start=event.start_date,
-                    end=event.end_date,
-                    budget=budget,
-                    planed_goal=event.planned_amount,
+        context.update(WidgetRunner.run({
+            "analytics": lambda: (
+                EventAnalyticsService.get_event_accumulative_stats(
+                    event,
+                    budget
                 )
-            )
-
-        context[
-            "analytics"
-        ] = EventAnalyticsService.get_event_accumulative_stats(
-            event,
-            budget
-        )
-
-        context["social_analytics"] = EventAnalyticsService.get_social_stats(
-            event, budget
-        )
+            ),
+            "social_analytics": lambda: (
+                EventAnalyticsService.get_social_stats(event, budget)
+            ),
+            "my_share": lambda: (
+                ContributionService.share_of(budget, user.id)
+                if budget else None
+            ),
+        }))
 
         if event.accessibility == Event.Accessibility.PRIVATE:
             connects = []
@@ -0,0 +1,71 @@
+import time
+from datetime import date
+
+from django.db.models import Q
+from django.utils import timezone
+
+from events.models import Event
+from groups.models import Group
+
+
+class LifecycleService:
+    """
+    Advances events and temporary groups through their lifecycle by
+    date. Every transition is one set-based UPDATE filtered on the
+    (status, date) indexes, so a run costs a handful of statements no
+    matter how many rows move. Runs are idempotent; bulk updates skip
+    save() and signals, which none of these fields rely on.
+    """
+
+    # completing first lets a planned event whose dates have already
+    # passed go straight to Completed
+    TRANSITIONS = ("complete_events", "start_events", "expire_groups")
+
+    @classmethod
+    def complete_events(cls, today: date) -> int:
+        return Event.objects.filter(
+            status__in=(
+                Event.EventStatus.PLANNED,
+                Event.EventStatus.ONGOING,
+            ),
+            end_date__lt=today,
+        ).update(
+            status=Event.EventStatus.COMPLETED,
+            timestamp_update=timezone.now(),
+        )
+
+    @classmethod
+    def start_events(cls, today: date) -> int:
+        return Event.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=today),
+            status=Event.EventStatus.PLANNED,
+            start_date__lte=today,
+        ).update(
+            status=Event.EventStatus.ONGOING,
+            timestamp_update=timezone.now(),
+        )
+
+    @classmethod
+    def expire_groups(cls, today: date) -> int:
+        return Group.objects.filter(
+            state=Group.States.TEMPORARY,
+            end_date__lt=today,
+        ).update(
+            state=Group.States.EXPIRED,
+            timestamp_updated=timezone.now(),
+        )
+
+    @classmethod
+    def run(cls, today: date | None = None) -> list[tuple[str, int, float]]:
+        """
+        Apply every transition for the given day (default: today) and
+        return (transition, rows updated, seconds taken) for each.
+        """
+        today = today or timezone.localdate()
+
+        results = []
+        for name in cls.TRANSITIONS:
+            started = time.perf_counter()
+            updated = getattr(cls, name)(today)
+            results.append((name, updated, time.perf_counter() - started))
+        return results
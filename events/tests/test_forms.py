@@ -1,3 +1,4 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -10,23 +11,18 @@ class TestEventPrivateCreateForm(TestCase):
         self.user = MagicMock()
         self.user.id = 1
 
-    @patch("events.forms.UserConnectionsService.get_user_connections")
-    def test_init_participants_choices(self, mock_get_connections):
-        mock_connection = MagicMock()
-        other_user = MagicMock()
-        other_user.id = 99
-        other_user.username = "friend_user"
-        mock_connection.other_user.return_value = other_user
-
-        mock_get_connections.return_value = [mock_connection]
+    @patch("events.forms.ConnectionGraph.neighbours")
+    def test_init_participants_choices(self, mock_neighbours):
+        friend = get_user_model().objects.create_user(username="friend_user")
+        mock_neighbours.return_value = {friend.id}
 
         form = EventPrivateCreateForm(user=self.user)
 
-        expected_choices = [(99, "friend_user")]
+        expected_choices = [(friend.id, "friend_user")]
         self.assertEqual(form.fields["participants"].choices, expected_choices)
+        mock_neighbours.assert_called_once_with(self.user.id)
 
-    @patch("events.forms.UserConnectionsService.get_user_connections",
-           return_value=[])
+    @patch("events.forms.ConnectionGraph.neighbours", return_value=set())
     def test_clean_dates_invalid(self, _):
         data = {
             "name": "Test Event",
@@ -47,8 +43,7 @@ class TestEventPrivateCreateForm(TestCase):
             form.non_field_errors()
         )
 
-    @patch("events.forms.UserConnectionsService.get_user_connections",
-           return_value=[])
+    @patch("events.forms.ConnectionGraph.neighbours", return_value=set())
     def test_clean_planned_amount_negative(self, _):
         data = {
             "name": "Test Event",
@@ -69,8 +64,7 @@ class TestEventPrivateCreateForm(TestCase):
             form.non_field_errors()
         )
 
-    @patch("events.forms.UserConnectionsService.get_user_connections",
-           return_value=[])
+    @patch("events.forms.ConnectionGraph.neighbours", return_value=set())
     def test_clean_valid_data(self, _):
         data = {
             "name": "Valid Event",
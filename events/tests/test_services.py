@@ -1,9 +1,13 @@
+from datetime import date, timedelta
+
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from events.models import Event, EventMembership
 from addition_info.choise_models import Role, Status
 from events.services.event_invitation import EventInvitationService
+from events.services.lifecycle_service import LifecycleService
+from groups.models import Group
 
 User = get_user_model()
 
@@ -141,3 +145,74 @@ class TestEventInvitationService(TestCase):
 
         self.assertFalse(
             Event.objects.filter(id=event_without_creator.id).exists())
+
+
+class LifecycleServiceTest(TestCase):
+    def setUp(self):
+        self.today = date(2026, 5, 10)
+        self.day = timedelta(days=1)
+
+    def make_event(self, start, end, status=Event.EventStatus.PLANNED):
+        return Event.objects.create(
+            name="Event",
+            start_date=start,
+            end_date=end,
+            status=status,
+        )
+
+    def test_run_advances_events_and_groups(self):
+        upcoming = self.make_event(self.today + self.day, None)
+        started = self.make_event(self.today, self.today + self.day)
+        open_ended = self.make_event(self.today - self.day, None)
+        finished = self.make_event(
+            self.today - 3 * self.day,
+            self.today - self.day,
+            Event.EventStatus.ONGOING,
+        )
+        missed = self.make_event(self.today - 3 * self.day,
+                                 self.today - self.day)
+        cancelled = self.make_event(
+            self.today - 3 * self.day,
+            self.today - self.day,
+            Event.EventStatus.CANCELLED,
+        )
+        ended_group = Group.objects.create(
+            name="Trip",
+            state=Group.States.TEMPORARY,
+            end_date=self.today - self.day,
+        )
+        running_group = Group.objects.create(
+            name="Flat",
+            state=Group.States.TEMPORARY,
+            end_date=self.today,
+        )
+
+        with self.assertNumQueries(3):
+            results = LifecycleService.run(self.today)
+
+        self.assertEqual(
+            [(name, updated) for name, updated, _ in results],
+            [("complete_events", 2), ("start_events", 2),
+             ("expire_groups", 1)]
+        )
+        expected = {
+            upcoming: Event.EventStatus.PLANNED,
+            started: Event.EventStatus.ONGOING,
+            open_ended: Event.EventStatus.ONGOING,
+            finished: Event.EventStatus.COMPLETED,
+            missed: Event.EventStatus.COMPLETED,
+            cancelled: Event.EventStatus.CANCELLED,
+        }
+        for event, status in expected.items():
+            event.refresh_from_db()
+            self.assertEqual(event.status, status)
+
+        ended_group.refresh_from_db()
+        running_group.refresh_from_db()
+        self.assertEqual(ended_group.state, Group.States.EXPIRED)
+        self.assertEqual(running_group.state, Group.States.TEMPORARY)
+
+        self.assertEqual(
+            sum(updated for _, updated, _ in LifecycleService.run(self.today)),
+            0
+        )
@@ -70,22 +70,13 @@ class EventViewsTestCase(TestCase):
         )
 
     @patch("events.views.EventInvitationService.create_event_invitation")
-    @patch("events.views.UserConnectionsService.get_user_connections")
+    @patch("events.forms.ConnectionGraph.neighbours")
     def test_event_create_post(
             self,
-            mock_get_connections,
+            mock_neighbours,
             mock_create_invitation
     ):
-        class FakeConnection:
-            def __init__(self, other):
-                self._other = other
-
-            def other_user(self, user):
-                return self._other
-
-        mock_get_connections.return_value = [
-            FakeConnection(self.other_user)
-        ]
+        mock_neighbours.return_value = {self.other_user.id}
 
         data = {
             "name": "New Private Event",
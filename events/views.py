@@ -1,6 +1,5 @@
 from typing import Any
 
-from accounts.services.receive_connection import UserConnectionsService  # noqa
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
@@ -22,6 +21,7 @@ from events.services.event_datail_service import EventDetailContextService
 from events.services.event_invitation import EventInvitationService
 from finances.forms import BudgetEditForm
 from finances.models import Budget
+from finances.services.budget_loader import BudgetLoader
 
 
 class EventHeroView(LoginRequiredMixin, TemplateView):
@@ -49,6 +49,14 @@ class EventHeroView(LoginRequiredMixin, TemplateView):
             memberships__status=Status.ACCEPTED,
         )
 
+        for key in ("private_events", "public_events", "group_events"):
+            context[key] = list(context[key])
+        BudgetLoader.prefetch_budgets(
+            context["private_events"]
+            + context["public_events"]
+            + context["group_events"]
+        )
+
         return context
 
 
@@ -132,3 +132,20 @@ class SetExpenseBudgetForm(forms.Form):
         required=False,
         empty_label="Select Category (Optional)"
     )
+
+
+class TransactionImportForm(forms.Form):
+    statement = forms.FileField(
+        label="Statement file",
+        widget=forms.ClearableFileInput(
+            attrs={
+                "class": "form-control",
+                "accept": ".csv,.ofx,.qfx",
+            }
+        ),
+    )
+    file_format = forms.ChoiceField(
+        choices=[("csv", "CSV"), ("ofx", "OFX")],
+        initial="csv",
+        widget=forms.Select(attrs={"class": "form-select"}),
+    )
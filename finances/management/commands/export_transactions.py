@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from finances.services.export_service import TransactionExportService
+from finances.services.history_service import TransactionHistoryService
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports the transaction history of many users to one file per "
+        "user, streaming rows so memory stays constant"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="Username to export (can be repeated)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Export every user",
+        )
+        parser.add_argument(
+            "--format",
+            choices=TransactionExportService.FORMATS,
+            default="csv",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=".",
+            help="Directory for the export files",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=TransactionExportService.CHUNK_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        if not options["usernames"] and not options["all"]:
+            raise CommandError("Pass --user at least once or --all")
+
+        users = get_user_model().objects.order_by("pk")
+        if not options["all"]:
+            users = users.filter(username__in=options["usernames"])
+            missing = set(options["usernames"]) - set(
+                users.values_list("username", flat=True)
+            )
+            if missing:
+                raise CommandError(
+                    f"User not found: {', '.join(sorted(missing))}"
+                )
+
+        output_dir = Path(options["output_dir"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        exported = 0
+        for user_id, username in users.values_list("pk", "username"):
+            queryset = TransactionHistoryService.get_user_transactions(
+                user_id=user_id
+            )
+            path = output_dir / f"{username}-transactions.{options['format']}"
+
+            with path.open("w", encoding="utf-8", newline="") as output:
+                output.writelines(
+                    TransactionExportService.stream(
+                        queryset,
+                        options["format"],
+                        chunk_size=options["chunk_size"],
+                    )
+                )
+
+            exported += 1
+            self.stdout.write(f"{username}: {path}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Exported history of {exported} users")
+        )
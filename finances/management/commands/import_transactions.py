@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from finances.services.import_service import TransactionImportService
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports a CSV or OFX bank statement into a user's budget "
+        "with batched inserts and a single budget recalculation"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the statement file")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="Username of the payer whose budget receives the rows",
+        )
+        parser.add_argument(
+            "--format",
+            choices=TransactionImportService.FORMATS,
+            help="File format, detected from the extension by default",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=TransactionImportService.DEFAULT_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"File not found: {path}")
+
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format == "qfx":
+            file_format = "ofx"
+        if file_format not in TransactionImportService.FORMATS:
+            raise CommandError(
+                f"Cannot detect format of {path.name}, use --format"
+            )
+
+        try:
+            user = get_user_model().objects.get(username=options["user"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"User not found: {options['user']}")
+
+        with path.open(encoding="utf-8-sig", newline="") as lines:
+            report = TransactionImportService.import_rows(
+                lines=lines,
+                file_format=file_format,
+                payer=user,
+                batch_size=options["batch_size"],
+            )
+
+        for error in report.errors:
+            self.stdout.write(self.style.WARNING(error))
+        self.stdout.write(self.style.SUCCESS(report.summary()))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from finances.services.contribution_service import ContributionService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the per-payer budget contributions used by the event "
+        "leaderboards from the raw transactions"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--budget",
+            type=int,
+            action="append",
+            dest="budget_ids",
+            help="Limit to the given budget id (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        written = ContributionService.rebuild(options["budget_ids"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {written} contribution rows")
+        )
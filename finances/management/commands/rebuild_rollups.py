@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from finances.services.rollup_service import DailyRollupService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the daily budget rollups used by the dashboards "
+        "from the raw transactions"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--budget",
+            type=int,
+            action="append",
+            dest="budget_ids",
+            help="Limit to the given budget id (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        written = DailyRollupService.rebuild(options["budget_ids"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {written} daily rollup rows")
+        )
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand
+
+from finances.models import Budget
+
+
+class Command(BaseCommand):
+    help = (
+        "Verifies incrementally maintained budget totals against a full "
+        "re-aggregation and repairs the ones that drifted"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drifted budgets, do not repair them",
+        )
+        parser.add_argument(
+            "--budget",
+            type=int,
+            action="append",
+            dest="budget_ids",
+            help="Limit to the given budget id (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        budgets = Budget.objects.order_by("pk")
+        if options["budget_ids"]:
+            budgets = budgets.filter(pk__in=options["budget_ids"])
+
+        checked = drifted = 0
+        for budget in budgets.iterator():
+            checked += 1
+            stored = (
+                budget.total_income,
+                budget.total_expenses,
+                budget.current_amount,
+            )
+
+            budget.recalc(save=False)
+            actual = (
+                budget.total_income,
+                budget.total_expenses,
+                budget.current_amount,
+            )
+
+            if stored == actual:
+                continue
+
+            drifted += 1
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Budget #{budget.pk}: stored {stored} != actual {actual}"
+                )
+            )
+            if not options["check"]:
+                budget.recalc()
+
+        action = "found" if options["check"] else "repaired"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} budgets, {action} {drifted} drifted"
+            )
+        )
@@ -0,0 +1,180 @@
+# Generated by Django 6.0 on 2026-10-18 06:02
+
+from django.db import migrations
+
+# The DDL is frozen here rather than imported from
+# finances.services.search_service so that later edits to the service
+# cannot change what this migration does.
+
+POSTGRES_INSTALL = [
+    "ALTER TABLE transactions ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS tx_search_vector_gin "
+    "ON transactions USING GIN (search_vector)",
+    """
+    CREATE OR REPLACE FUNCTION transactions_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector(
+            'simple',
+            coalesce(NEW.note, '') || ' ' || coalesce(
+                (SELECT name FROM categories WHERE id = NEW.category_id),
+                ''
+            )
+        );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS transactions_search_vector_trg ON transactions",
+    """
+    CREATE TRIGGER transactions_search_vector_trg
+    BEFORE INSERT OR UPDATE OF note, category_id ON transactions
+    FOR EACH ROW EXECUTE FUNCTION transactions_search_vector_update()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION categories_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        UPDATE transactions
+        SET search_vector = to_tsvector(
+            'simple', coalesce(note, '') || ' ' || coalesce(NEW.name, '')
+        )
+        WHERE category_id = NEW.id;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS categories_search_vector_trg ON categories",
+    """
+    CREATE TRIGGER categories_search_vector_trg
+    AFTER UPDATE OF name ON categories
+    FOR EACH ROW EXECUTE FUNCTION categories_search_vector_update()
+    """,
+    """
+    UPDATE transactions AS t
+    SET search_vector = to_tsvector(
+        'simple', coalesce(t.note, '') || ' ' || coalesce(c.name, '')
+    )
+    FROM transactions AS s
+    LEFT JOIN categories AS c ON c.id = s.category_id
+    WHERE s.id = t.id AND t.search_vector IS NULL
+    """,
+]
+
+POSTGRES_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS categories_search_vector_trg ON categories",
+    "DROP FUNCTION IF EXISTS categories_search_vector_update()",
+    "DROP TRIGGER IF EXISTS transactions_search_vector_trg ON transactions",
+    "DROP FUNCTION IF EXISTS transactions_search_vector_update()",
+    "DROP INDEX IF EXISTS tx_search_vector_gin",
+    "ALTER TABLE transactions DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_INSTALL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts
+    USING fts5(note, category_name, tokenize = 'unicode61')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS transactions_fts_ai
+    AFTER INSERT ON transactions BEGIN
+        INSERT INTO transactions_fts(rowid, note, category_name)
+        VALUES (
+            new.id,
+            new.note,
+            coalesce(
+                (SELECT name FROM categories WHERE id = new.category_id),
+                ''
+            )
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS transactions_fts_ad
+    AFTER DELETE ON transactions BEGIN
+        DELETE FROM transactions_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS transactions_fts_au
+    AFTER UPDATE OF note, category_id ON transactions BEGIN
+        DELETE FROM transactions_fts WHERE rowid = old.id;
+        INSERT INTO transactions_fts(rowid, note, category_name)
+        VALUES (
+            new.id,
+            new.note,
+            coalesce(
+                (SELECT name FROM categories WHERE id = new.category_id),
+                ''
+            )
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS transactions_fts_category_au
+    AFTER UPDATE OF name ON categories BEGIN
+        DELETE FROM transactions_fts WHERE rowid IN (
+            SELECT id FROM transactions WHERE category_id = new.id
+        );
+        INSERT INTO transactions_fts(rowid, note, category_name)
+        SELECT id, note, new.name
+        FROM transactions WHERE category_id = new.id;
+    END
+    """,
+    "DELETE FROM transactions_fts",
+    """
+    INSERT INTO transactions_fts(rowid, note, category_name)
+    SELECT t.id, t.note, coalesce(c.name, '')
+    FROM transactions AS t
+    LEFT JOIN categories AS c ON c.id = t.category_id
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS transactions_fts_category_au",
+    "DROP TRIGGER IF EXISTS transactions_fts_au",
+    "DROP TRIGGER IF EXISTS transactions_fts_ad",
+    "DROP TRIGGER IF EXISTS transactions_fts_ai",
+    "DROP TABLE IF EXISTS transactions_fts",
+]
+
+
+def sqlite_has_fts5(connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def install_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        statements = POSTGRES_INSTALL
+    elif connection.vendor == "sqlite" and sqlite_has_fts5(connection):
+        statements = SQLITE_INSTALL
+    else:
+        # searches fall back to icontains lookups
+        return
+
+    for sql in statements:
+        schema_editor.execute(sql, params=None)
+
+
+def uninstall_search_index(apps, schema_editor):
+    statements = {
+        "postgresql": POSTGRES_UNINSTALL,
+        "sqlite": SQLITE_UNINSTALL,
+    }.get(schema_editor.connection.vendor, [])
+
+    for sql in statements:
+        schema_editor.execute(sql, params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finances", "0006_transaction_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
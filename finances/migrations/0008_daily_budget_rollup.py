@@ -0,0 +1,97 @@
+# Generated by Django 6.0 on 2026-10-18 07:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    Transaction = apps.get_model("finances", "Transaction")
+    DailyBudgetRollup = apps.get_model("finances", "DailyBudgetRollup")
+
+    aggregated = (
+        Transaction.objects.order_by()
+        .annotate(day=TruncDate("date"))
+        .values("target_id", "day", "transaction_type", "category_id")
+        .annotate(rows=Count("id"), amount=Sum("amount"))
+    )
+    DailyBudgetRollup.objects.bulk_create(
+        (
+            DailyBudgetRollup(
+                budget_id=row["target_id"],
+                day=row["day"],
+                transaction_type=row["transaction_type"],
+                category_id=row["category_id"],
+                count=row["rows"],
+                total=row["amount"],
+            )
+            for row in aggregated.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finances", "0007_transaction_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyBudgetRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[("Income", "Income"), ("Expense", "Expense")],
+                        max_length=20,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "total",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "budget",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="finances.budget",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="daily_rollups",
+                        to="finances.category",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "budget_daily_rollups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("budget", "day", "transaction_type", "category"),
+                        name="unique_daily_rollup",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 6.0 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_contributions(apps, schema_editor):
+    Transaction = apps.get_model("finances", "Transaction")
+    BudgetContribution = apps.get_model("finances", "BudgetContribution")
+
+    aggregated = (
+        Transaction.objects.order_by()
+        .filter(transaction_type="Income")
+        .values("target_id", "payer_id")
+        .annotate(rows=Count("id"), amount=Sum("amount"))
+    )
+    BudgetContribution.objects.bulk_create(
+        (
+            BudgetContribution(
+                budget_id=row["target_id"],
+                payer_id=row["payer_id"],
+                contributions=row["rows"],
+                total_contributed=row["amount"],
+            )
+            for row in aggregated.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finances", "0008_daily_budget_rollup"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BudgetContribution",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "total_contributed",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("contributions", models.PositiveIntegerField(default=0)),
+                (
+                    "budget",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contributions",
+                        to="finances.budget",
+                    ),
+                ),
+                (
+                    "payer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="budget_contributions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "budget_contributions",
+                "indexes": [
+                    models.Index(
+                        fields=["budget", "-total_contributed"],
+                        name="contribution_budget_total",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("budget", "payer"), name="unique_budget_contribution"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            backfill_contributions,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-18 14:10
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_uncategorized_rollups(apps, schema_editor):
+    """
+    Deleted categories left duplicate NULL-category rows behind. Fold
+    each group into its first row before the constraint is added.
+    """
+    DailyBudgetRollup = apps.get_model("finances", "DailyBudgetRollup")
+
+    duplicates = (
+        DailyBudgetRollup.objects.filter(category__isnull=True)
+        .values("budget_id", "day", "transaction_type")
+        .annotate(
+            rows=Count("id"),
+            keep_id=Min("id"),
+            merged_count=Sum("count"),
+            merged_total=Sum("total"),
+        )
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for group in duplicates.iterator():
+        rows = DailyBudgetRollup.objects.filter(
+            budget_id=group["budget_id"],
+            day=group["day"],
+            transaction_type=group["transaction_type"],
+            category__isnull=True,
+        )
+        rows.exclude(pk=group["keep_id"]).delete()
+        rows.filter(pk=group["keep_id"]).update(
+            count=group["merged_count"],
+            total=group["merged_total"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finances", "0009_budget_contribution"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_uncategorized_rollups,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="dailybudgetrollup",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("category__isnull", True)),
+                fields=("budget", "day", "transaction_type"),
+                name="unique_daily_rollup_uncategorized",
+            ),
+        ),
+    ]
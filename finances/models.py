@@ -151,12 +151,14 @@ class Transaction(models.Model):
     target = models.ForeignKey(
         Budget,
         on_delete=models.CASCADE,
-        related_name="transactions"
+        related_name="transactions",
+        db_index=False,
     )
     payer = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
-        related_name="transactions"
+        related_name="transactions",
+        db_index=False,
     )
     category = models.ForeignKey(
         Category,
@@ -170,6 +172,18 @@ class Transaction(models.Model):
     class Meta:
         db_table = "transactions"
         ordering = ("-date", "-timestamp_create")
+        # The composite indexes lead with the FK columns, so they also
+        # serve every plain target/payer lookup and replace FK indexes.
+        indexes = [
+            models.Index(
+                fields=["target", "date", "transaction_type", "amount"],
+                name="tx_target_date_type_amount",
+            ),
+            models.Index(
+                fields=["payer", "-date", "-timestamp_create"],
+                name="tx_payer_date_created",
+            ),
+        ]
 
     def __str__(self):
         return (f"{self.get_transaction_type_display()} {self.amount} "
@@ -186,9 +200,16 @@ class Transaction(models.Model):
                 f"at {self.date}")
 
     def clean(self) -> None:
-        if self.category and self.transaction_type:
+        from finances.services.category_registry import CategoryRegistry
+
+        category = (
+            self.category
+            if Transaction.category.is_cached(self)
+            else CategoryRegistry.get(self.category_id)
+        )
+        if category and self.transaction_type:
             if (
-                    self.category.category_type == Category.Types.INCOME
+                    category.category_type == Category.Types.INCOME
                     and self.transaction_type != self.Types.INCOME
             ):
                 raise ValidationError(
@@ -197,7 +218,7 @@ class Transaction(models.Model):
                                     "with transaction type.(INCOME)"}
                 )
             if (
-                    self.category.category_type == Category.Types.EXPENSE
+                    category.category_type == Category.Types.EXPENSE
                     and self.transaction_type != self.Types.EXPENSE
             ):
                 raise ValidationError(
@@ -209,3 +230,96 @@ class Transaction(models.Model):
     def save(self, *args, **kwargs) -> None:
         self.full_clean()
         super().save(*args, **kwargs)
+
+
+class DailyBudgetRollup(models.Model):
+    """
+    Per-day transaction count and sum of a budget, split by type and
+    category. Maintained on every transaction write, so analytics read
+    one row per day and category instead of scanning transactions.
+    """
+
+    budget = models.ForeignKey(
+        Budget,
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+    )
+    day = models.DateField()
+    transaction_type = models.CharField(
+        max_length=20,
+        choices=Transaction.Types.choices,
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="daily_rollups",
+    )
+    count = models.PositiveIntegerField(default=0)
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = "budget_daily_rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["budget", "day", "transaction_type", "category"],
+                name="unique_daily_rollup",
+            ),
+            # NULLs are distinct in the constraint above
+            models.UniqueConstraint(
+                fields=["budget", "day", "transaction_type"],
+                condition=models.Q(category__isnull=True),
+                name="unique_daily_rollup_uncategorized",
+            ),
+        ]
+
+    def __str__(self):
+        return (f"{self.budget_id} {self.day} {self.transaction_type}: "
+                f"{self.count} / {self.total}")
+
+
+class BudgetContribution(models.Model):
+    """
+    Running income total of one payer into one budget. Maintained on
+    every transaction write, so leaderboards and "my share" widgets
+    read a few rows of the (budget, -total_contributed) index instead
+    of aggregating the budget's transactions.
+    """
+
+    budget = models.ForeignKey(
+        Budget,
+        on_delete=models.CASCADE,
+        related_name="contributions",
+        db_index=False,
+    )
+    payer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="budget_contributions",
+    )
+    total_contributed = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+    )
+    contributions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "budget_contributions"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["budget", "payer"],
+                name="unique_budget_contribution",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["budget", "-total_contributed"],
+                name="contribution_budget_total",
+            ),
+        ]
+
+    def __str__(self):
+        return (f"{self.payer_id} -> {self.budget_id}: "
+                f"{self.total_contributed}")
@@ -0,0 +1,74 @@
+from collections import defaultdict
+from typing import Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model, OuterRef, QuerySet, Subquery
+
+from finances.models import Budget
+
+
+class BudgetLoader:
+    """
+    Batch access to owner budgets.
+    `User.budget`, `Event.budget` and `Group.budget` are cached
+    properties that each run their own query; listing pages use
+    prefetch_budgets() to fill them for all owners up front, or
+    annotate_budget() to read budget columns in the owner query itself.
+    """
+
+    CACHE_ATTR = "budget"
+
+    @classmethod
+    def prefetch_budgets(cls, owners: Iterable[Model]) -> list[Model]:
+        """
+        Load the budgets of a (possibly mixed) list of owners with one
+        query per content type and prime their cached `budget`
+        property. Owners without a budget are primed with None.
+        Returns the owners as a list, so querysets are evaluated once.
+        """
+        owners = list(owners)
+
+        pending = defaultdict(list)
+        for owner in owners:
+            if cls.CACHE_ATTR not in owner.__dict__:
+                pending[type(owner)].append(owner)
+
+        for model, instances in pending.items():
+            content_type = ContentType.objects.get_for_model(model)
+            budgets = {
+                budget.object_id: budget
+                for budget in Budget.objects.filter(
+                    content_type=content_type,
+                    object_id__in={owner.pk for owner in instances},
+                )
+            }
+            for owner in instances:
+                owner.__dict__[cls.CACHE_ATTR] = budgets.get(owner.pk)
+
+        return owners
+
+    @classmethod
+    def annotate_budget(
+            cls,
+            queryset: QuerySet,
+            fields: Iterable[str] = (
+                "current_amount",
+                "total_income",
+                "total_expenses",
+            ),
+            prefix: str = "budget_",
+    ) -> QuerySet:
+        """
+        Annotate owner rows with budget columns through correlated
+        subqueries, e.g. `budget_current_amount`.
+        """
+        content_type = ContentType.objects.get_for_model(queryset.model)
+        budgets = Budget.objects.filter(
+            content_type=content_type,
+            object_id=OuterRef("pk"),
+        )
+
+        return queryset.annotate(**{
+            f"{prefix}{field}": Subquery(budgets.values(field)[:1])
+            for field in fields
+        })
@@ -0,0 +1,52 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class BudgetVersionService:
+    """
+    Opaque per-budget version tokens kept in Django's cache.
+    A token changes whenever a transaction of the budget (or the
+    budget itself) is written, so anything derived from a budget can
+    be cached under its current token. Tokens are time based, so a
+    token recreated after eviction never repeats an old one.
+    """
+
+    KEY = "finances:budget:{pk}:version"
+
+    @classmethod
+    def _new_version(cls) -> str:
+        return format(time.time_ns(), "x")
+
+    @classmethod
+    def get(cls, budget_id: int) -> str:
+        key = cls.KEY.format(pk=budget_id)
+        version = cache.get(key)
+        if version is None:
+            version = cls._new_version()
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+        return version
+
+    @classmethod
+    def get_many(cls, budget_ids) -> dict[int, str]:
+        return {pk: cls.get(pk) for pk in budget_ids}
+
+    @classmethod
+    def bump(cls, *budget_ids: int) -> None:
+        version = cls._new_version()
+        cache.set_many(
+            {cls.KEY.format(pk=pk): version for pk in budget_ids if pk},
+            None,
+        )
+
+    @classmethod
+    def bump_on_write(cls, *budget_ids: int) -> None:
+        """
+        Bump now and again on commit, so results computed from the
+        pre-commit state by other requests are not kept under the
+        new token.
+        """
+        cls.bump(*budget_ids)
+        transaction.on_commit(lambda: cls.bump(*budget_ids))
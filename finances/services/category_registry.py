@@ -0,0 +1,154 @@
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import router
+
+from finances.models import Category
+
+
+class CategoryRegistry:
+    """
+    Process-wide, read-only snapshot of the categories table.
+    The snapshot is tagged with a version token kept in Django's cache.
+    Category post_save/post_delete signals replace the token, and every
+    worker reloads its snapshot the next time it sees a new token,
+    from the shared cache when another worker already stored it there,
+    otherwise from the database.
+    The token is read lazily: request_started (see finances.signals)
+    only marks the snapshot for a recheck, and the first lookup in a
+    request that uses the registry reads the token; outside of requests
+    it is read every RECHECK_SECONDS. Requests that never look up a
+    category cost nothing. With the default DatabaseCache that read is
+    one query on the cache table per request that uses the registry;
+    production should set REDIS_URL so it is a Redis round trip.
+    """
+
+    VERSION_KEY = "finances:categories:version"
+    ROWS_KEY = "finances:categories:rows:{version}"
+    FIELDS = (
+        "id",
+        "name",
+        "category_type",
+        "color_hex",
+        "is_active",
+        "order_index",
+    )
+    RECHECK_SECONDS = 5
+
+    _lock = threading.Lock()
+    _version: str | None = None
+    _checked_at: float | None = None
+    _categories: list[Category] = []
+    _by_id: dict[int, Category] = {}
+    _by_name: dict[str, Category] = {}
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cache.set(cls.VERSION_KEY, uuid.uuid4().hex, None)
+        cls.recheck()
+
+    @classmethod
+    def recheck(cls) -> None:
+        """Compare the snapshot with the shared token on next access."""
+        cls._checked_at = None
+
+    @classmethod
+    def _current_version(cls) -> str:
+        version = cache.get(cls.VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(cls.VERSION_KEY, version, None):
+                version = cache.get(cls.VERSION_KEY, version)
+        return version
+
+    @classmethod
+    def _load(cls) -> None:
+        checked_at = cls._checked_at
+        if (
+                checked_at is not None
+                and time.monotonic() - checked_at < cls.RECHECK_SECONDS
+        ):
+            return
+
+        version = cls._current_version()
+        if version == cls._version:
+            cls._checked_at = time.monotonic()
+            return
+
+        with cls._lock:
+            if version == cls._version:
+                return
+
+            rows_key = cls.ROWS_KEY.format(version=version)
+            rows = cache.get(rows_key)
+            if rows is None:
+                rows = list(Category.objects.values_list(*cls.FIELDS))
+                cache.set(rows_key, rows, None)
+
+            alias = router.db_for_read(Category)
+            categories = [
+                Category.from_db(alias, cls.FIELDS, row) for row in rows
+            ]
+            cls._by_id = {category.pk: category for category in categories}
+            cls._by_name = {
+                category.name: category for category in categories
+            }
+            cls._categories = categories
+            cls._version = version
+            cls._checked_at = time.monotonic()
+
+    @classmethod
+    def all(cls, active_only: bool = False) -> list[Category]:
+        cls._load()
+        return [
+            category for category in cls._categories
+            if category.is_active or not active_only
+        ]
+
+    @classmethod
+    def by_type(
+            cls,
+            category_type: str,
+            active_only: bool = False
+    ) -> list[Category]:
+        return [
+            category for category in cls.all(active_only)
+            if category.category_type == category_type
+        ]
+
+    @classmethod
+    def get(cls, pk: int | None) -> Category | None:
+        if pk is None:
+            return None
+
+        cls._load()
+        category = cls._by_id.get(pk)
+        if category is None:
+            # created in a transaction other workers cannot see yet
+            category = Category.objects.filter(pk=pk).first()
+        return category
+
+    @classmethod
+    def by_name(cls, name: str) -> Category | None:
+        cls._load()
+        return cls._by_name.get(name)
+
+    @classmethod
+    def get_or_create(
+            cls,
+            name: str,
+            category_type: str,
+            **defaults
+    ) -> Category:
+        category = cls.by_name(name)
+        if category is not None and category.category_type == category_type:
+            return category
+
+        category, _ = Category.objects.get_or_create(
+            name=name,
+            category_type=category_type,
+            defaults=defaults,
+        )
+        return category
@@ -0,0 +1,202 @@
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from finances.models import Budget, BudgetContribution, Transaction
+
+
+class ContributionService:
+    """
+    Maintains BudgetContribution rows, the per-payer income totals of a
+    budget, and serves the widgets built on them. Single writes adjust
+    one (budget, payer) row in place; bulk writes are rebuilt per budget
+    by deferred_recalc().
+    """
+
+    LEADERBOARD_FIELDS = (
+        "payer__username",
+        "payer__first_name",
+        "payer__last_name",
+        "total_contributed",
+    )
+    REBUILD_BATCH_SIZE = 1000
+
+    @classmethod
+    def apply(
+            cls,
+            budget_id: int,
+            payer_id: int,
+            amount: Decimal,
+            sign: int = 1,
+    ) -> None:
+        rows = BudgetContribution.objects.filter(
+            budget_id=budget_id,
+            payer_id=payer_id,
+        )
+        changes = {
+            "contributions": F("contributions") + sign,
+            "total_contributed": (
+                F("total_contributed") + Decimal(amount) * sign
+            ),
+        }
+
+        if sign < 0:
+            rows.update(**changes)
+            rows.filter(contributions__lte=0).delete()
+            return
+
+        if rows.update(**changes):
+            return
+
+        try:
+            with transaction.atomic():
+                BudgetContribution.objects.create(
+                    budget_id=budget_id,
+                    payer_id=payer_id,
+                    contributions=1,
+                    total_contributed=amount,
+                )
+        except IntegrityError:
+            # created concurrently by another writer
+            rows.update(**changes)
+
+    @classmethod
+    def _share(
+            cls,
+            target_id: int,
+            transaction_type: str,
+            amount: Decimal,
+            payer_id: int,
+    ) -> tuple | None:
+        if not target_id or transaction_type != Transaction.Types.INCOME:
+            return None
+        return target_id, payer_id, Decimal(amount)
+
+    @classmethod
+    def on_saved(cls, instance: Transaction) -> None:
+        """
+        Move the amount from the previous (budget, payer) to the
+        current one. Like DailyRollupService it reads the state stored
+        by BudgetLedgerService, so it runs before the ledger.
+        """
+        current = cls._share(
+            instance.target_id,
+            instance.transaction_type,
+            instance.amount,
+            instance.payer_id,
+        )
+
+        previous = getattr(instance, "_ledger_previous", None)
+        if previous:
+            target_id, transaction_type, amount = previous[:3]
+            previous = cls._share(
+                target_id, transaction_type, amount, previous[5]
+            )
+            if previous == current:
+                return
+            if previous:
+                cls.apply(*previous, sign=-1)
+
+        if current:
+            cls.apply(*current)
+
+    @classmethod
+    def on_deleted(cls, instance: Transaction) -> None:
+        share = cls._share(
+            instance.target_id,
+            instance.transaction_type,
+            instance.amount,
+            instance.payer_id,
+        )
+        if share:
+            cls.apply(*share, sign=-1)
+
+    @classmethod
+    def rebuild(cls, budget_ids: Iterable[int] | None = None) -> int:
+        """
+        Recompute contributions from income transactions, for the given
+        budgets or all of them. Returns the number of rows written.
+        """
+        rows = BudgetContribution.objects.all()
+        transactions = Transaction.objects.filter(
+            transaction_type=Transaction.Types.INCOME,
+        ).order_by()
+        if budget_ids is not None:
+            budget_ids = set(budget_ids)
+            rows = rows.filter(budget_id__in=budget_ids)
+            transactions = transactions.filter(target_id__in=budget_ids)
+
+        aggregated = (
+            transactions
+            .values("target_id", "payer_id")
+            .annotate(rows=Count("id"), amount=Sum("amount"))
+            .order_by()
+        )
+
+        written = 0
+        with transaction.atomic():
+            rows.delete()
+            batch = []
+            for row in aggregated.iterator(chunk_size=cls.REBUILD_BATCH_SIZE):
+                batch.append(
+                    BudgetContribution(
+                        budget_id=row["target_id"],
+                        payer_id=row["payer_id"],
+                        contributions=row["rows"],
+                        total_contributed=row["amount"],
+                    )
+                )
+                if len(batch) >= cls.REBUILD_BATCH_SIZE:
+                    BudgetContribution.objects.bulk_create(batch)
+                    written += len(batch)
+                    batch = []
+            BudgetContribution.objects.bulk_create(batch)
+            written += len(batch)
+
+        return written
+
+    @classmethod
+    def leaderboard(cls, budget: Budget, limit: int = 5) -> list[dict]:
+        return list(
+            BudgetContribution.objects
+            .filter(budget=budget)
+            .order_by("-total_contributed")
+            .values(*cls.LEADERBOARD_FIELDS)[:limit]
+        )
+
+    @classmethod
+    def member_progress(cls, budget: Budget) -> list[dict]:
+        """Every contributor with their share of the planned amount."""
+        planned = budget.planned_amount or Decimal("0")
+        return [
+            {
+                **row,
+                "percent": (
+                    round(row["total_contributed"] / planned * 100, 1)
+                    if planned else None
+                ),
+            }
+            for row in (
+                BudgetContribution.objects
+                .filter(budget=budget)
+                .order_by("-total_contributed")
+                .values("payer_id", *cls.LEADERBOARD_FIELDS)
+            )
+        ]
+
+    @classmethod
+    def share_of(cls, budget: Budget, user_id: int) -> dict:
+        """The user's contribution and its part of the budget income."""
+        total = (
+            BudgetContribution.objects
+            .filter(budget=budget, payer_id=user_id)
+            .values_list("total_contributed", flat=True)
+            .first()
+        ) or Decimal("0")
+        income = budget.total_income or Decimal("0")
+        return {
+            "total_contributed": total,
+            "percent": round(total / income * 100, 1) if income else 0,
+        }
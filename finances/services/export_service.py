@@ -0,0 +1,106 @@
+import csv
+import json
+from typing import Iterator
+
+from django.db.models import QuerySet
+
+from finances.services.keyset_pagination import KeysetPaginator
+
+
+class _Echo:
+    """File-like object whose write() returns the value instead of
+    buffering it, so csv.writer can produce one line at a time."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class TransactionExportService:
+    """
+    Streams transaction history as CSV or JSON Lines.
+    Rows are read as plain tuples through values_list() with a
+    server-side cursor (.iterator), so memory stays flat no matter
+    how many rows the export contains.
+    """
+
+    FORMATS = ("csv", "jsonl")
+    CONTENT_TYPES = {
+        "csv": "text/csv",
+        "jsonl": "application/x-ndjson",
+    }
+    CHUNK_SIZE = 2000
+
+    COLUMNS = (
+        ("id", "id"),
+        ("date", "date"),
+        ("type", "transaction_type"),
+        ("amount", "amount"),
+        ("category", "category__name"),
+        ("payer", "payer__username"),
+        ("note", "note"),
+    )
+
+    @classmethod
+    def header(cls) -> list[str]:
+        return [name for name, _ in cls.COLUMNS]
+
+    @classmethod
+    def iter_rows(
+            cls,
+            queryset: QuerySet,
+            chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[tuple]:
+        return (
+            queryset
+            .order_by(*KeysetPaginator.ordering)
+            .values_list(*(lookup for _, lookup in cls.COLUMNS))
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @classmethod
+    def _format_row(cls, row: tuple) -> list:
+        tx_id, date, t_type, amount, category, payer, note = row
+        return [
+            tx_id,
+            date.isoformat(),
+            t_type,
+            str(amount),
+            category or "",
+            payer,
+            note,
+        ]
+
+    @classmethod
+    def stream_csv(
+            cls,
+            queryset: QuerySet,
+            chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[str]:
+        writer = csv.writer(_Echo())
+        yield writer.writerow(cls.header())
+        for row in cls.iter_rows(queryset, chunk_size):
+            yield writer.writerow(cls._format_row(row))
+
+    @classmethod
+    def stream_jsonl(
+            cls,
+            queryset: QuerySet,
+            chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[str]:
+        header = cls.header()
+        for row in cls.iter_rows(queryset, chunk_size):
+            record = dict(zip(header, cls._format_row(row)))
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    @classmethod
+    def stream(
+            cls,
+            queryset: QuerySet,
+            file_format: str,
+            chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[str]:
+        if file_format == "csv":
+            return cls.stream_csv(queryset, chunk_size)
+        if file_format == "jsonl":
+            return cls.stream_jsonl(queryset, chunk_size)
+        raise ValueError(f"Unsupported export format: {file_format}")
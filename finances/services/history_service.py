@@ -1,9 +1,12 @@
+from typing import Mapping
+
 from django.contrib.auth import get_user_model
 from django.db.models import QuerySet
 from django.shortcuts import get_object_or_404
 
 from events.models import Event
 from finances.models import Transaction
+from finances.services.search_service import TransactionSearchService
 from groups.models import Group
 
 
@@ -25,3 +28,34 @@ class TransactionHistoryService:
         group = get_object_or_404(Group, pk=group_id)
 
         return Transaction.objects.filter(target=group.budget)
+
+    @classmethod
+    def get_target_transactions(cls, target: str, pk: int) -> QuerySet:
+        if target == "user":
+            return cls.get_user_transactions(user_id=pk)
+        if target == "event":
+            return cls.get_event_transactions(event_id=pk)
+        if target == "group":
+            return cls.get_group_transactions(group_id=pk)
+        return Transaction.objects.none()
+
+    @classmethod
+    def apply_filters(
+            cls,
+            queryset: QuerySet,
+            params: Mapping[str, str]
+    ) -> QuerySet:
+        """Apply the history filters (search, type, date_from)."""
+        search = params.get("search")
+        if search:
+            queryset = TransactionSearchService.search(queryset, search)
+
+        t_type = params.get("type")
+        if t_type in [Transaction.Types.INCOME, Transaction.Types.EXPENSE]:
+            queryset = queryset.filter(transaction_type=t_type)
+
+        date_from = params.get("date_from")
+        if date_from:
+            queryset = queryset.filter(date__gte=date_from)
+
+        return queryset
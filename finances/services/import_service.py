@@ -0,0 +1,271 @@
+import csv
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, time as dt_time
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from finances.models import Budget, Category, Transaction
+from finances.services.category_registry import CategoryRegistry
+from finances.services.ledger_service import deferred_recalc
+
+User = get_user_model()
+
+
+@dataclass
+class ImportReport:
+    rows_read: int = 0
+    rows_imported: int = 0
+    errors: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(
+        default_factory=lambda: {
+            "parse": 0.0,
+            "validate": 0.0,
+            "write": 0.0,
+            "recalc": 0.0,
+        }
+    )
+
+    @property
+    def rows_skipped(self) -> int:
+        return self.rows_read - self.rows_imported
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.timings.values())
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_read / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        stages = ", ".join(
+            f"{stage} {seconds:.3f}s"
+            for stage, seconds in self.timings.items()
+        )
+        return (
+            f"Imported {self.rows_imported}/{self.rows_read} rows "
+            f"({self.rows_skipped} skipped) in {self.elapsed:.3f}s, "
+            f"{self.rows_per_sec:.0f} rows/s [{stages}]"
+        )
+
+
+class TransactionImportService:
+    """
+    Streaming bank statement importer.
+    Rows are parsed lazily, validated in chunks against a preloaded
+    Category map, written with bulk_create and every affected budget
+    is recalculated once at the end.
+    """
+
+    FORMATS = ("csv", "ofx")
+    DEFAULT_BATCH_SIZE = 1000
+    MAX_REPORTED_ERRORS = 50
+
+    # key of the placeholder row yielded for a line the csv module
+    # could not parse, reported like any other invalid row
+    PARSE_ERROR = "__parse_error__"
+
+    OFX_BLOCK = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.S | re.I)
+    OFX_FIELD = re.compile(r"<(\w+)>([^<\r\n]*)")
+
+    @classmethod
+    def parse_csv(cls, lines: Iterable[str]) -> Iterator[dict[str, str]]:
+        """
+        Expects a header row with `date` and `amount` columns and optional
+        `type`, `category` and `note`. Without `type`, negative amounts are
+        treated as expenses.
+        """
+        reader = csv.DictReader(lines)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield {cls.PARSE_ERROR: f"malformed CSV line ({e})"}
+                continue
+            yield {
+                (key or "").strip().lower(): (value or "").strip()
+                for key, value in row.items()
+            }
+
+    @classmethod
+    def parse_ofx(cls, lines: Iterable[str]) -> Iterator[dict[str, str]]:
+        buffer = ""
+        for line in lines:
+            buffer += line
+            if "</STMTTRN>" not in buffer.upper():
+                continue
+
+            end = 0
+            for match in cls.OFX_BLOCK.finditer(buffer):
+                fields = {
+                    name.upper(): value.strip()
+                    for name, value in cls.OFX_FIELD.findall(match.group(1))
+                }
+                yield {
+                    "date": fields.get("DTPOSTED", ""),
+                    "amount": fields.get("TRNAMT", ""),
+                    "note": fields.get("MEMO") or fields.get("NAME", ""),
+                }
+                end = match.end()
+            buffer = buffer[end:]
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], file_format: str) -> Iterator[dict]:
+        if file_format == "csv":
+            return cls.parse_csv(lines)
+        if file_format == "ofx":
+            return cls.parse_ofx(lines)
+        raise ValueError(f"Unsupported import format: {file_format}")
+
+    @classmethod
+    def load_category_map(cls) -> dict[str, Category]:
+        return {
+            category.name.lower(): category
+            for category in CategoryRegistry.all()
+        }
+
+    @classmethod
+    def _parse_date(cls, value: str) -> datetime:
+        value = value.strip()
+        parsed = None
+
+        if re.fullmatch(r"\d{8}(\d{6})?(\.\d+)?(\[.*\])?", value):
+            digits = value[:14] if len(value) >= 14 else value[:8]
+            fmt = "%Y%m%d%H%M%S" if len(digits) == 14 else "%Y%m%d"
+            parsed = datetime.strptime(digits, fmt)
+        else:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                day = parse_date(value)
+                if day is not None:
+                    parsed = datetime.combine(day, dt_time.min)
+
+        if parsed is None:
+            raise ValueError(f"invalid date {value!r}")
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    @classmethod
+    def build_transaction(
+            cls,
+            row: dict[str, str],
+            budget: Budget,
+            payer: User,
+            categories: dict[str, Category],
+    ) -> Transaction:
+        if cls.PARSE_ERROR in row:
+            raise ValueError(row[cls.PARSE_ERROR])
+
+        try:
+            amount = Decimal(row.get("amount", "").replace(",", "."))
+        except InvalidOperation:
+            amount = None
+        if amount is None or not amount.is_finite():
+            raise ValueError(f"invalid amount {row.get('amount')!r}")
+
+        transaction_type = row.get("type", "").capitalize()
+        if not transaction_type:
+            transaction_type = (
+                Transaction.Types.EXPENSE if amount < 0
+                else Transaction.Types.INCOME
+            )
+        if transaction_type not in Transaction.Types.values:
+            raise ValueError(f"invalid type {row.get('type')!r}")
+
+        # bounded before quantize(), which fails past the context precision
+        field = Transaction._meta.get_field("amount")
+        limit = Decimal(10) ** (field.max_digits - field.decimal_places)
+        amount = abs(amount)
+        if amount < limit:
+            amount = amount.quantize(Decimal(10) ** -field.decimal_places)
+        if amount >= limit:
+            raise ValueError(f"amount {row.get('amount')!r} is too large")
+        if amount < Decimal("0.01"):
+            raise ValueError("amount must be at least 0.01")
+
+        category = None
+        category_name = row.get("category", "")
+        if category_name:
+            category = categories.get(category_name.lower())
+            if category is None:
+                raise ValueError(f"unknown category {category_name!r}")
+            if category.category_type != transaction_type:
+                raise ValueError(
+                    f"category {category.name!r} conflicts with "
+                    f"transaction type {transaction_type}"
+                )
+
+        return Transaction(
+            amount=amount,
+            transaction_type=transaction_type,
+            date=cls._parse_date(row.get("date", "")),
+            target=budget,
+            payer=payer,
+            category=category,
+            note=row.get("note", ""),
+        )
+
+    @classmethod
+    def import_rows(
+            cls,
+            lines: Iterable[str],
+            file_format: str,
+            payer: User,
+            budget: Budget | None = None,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ImportReport:
+        report = ImportReport()
+        budget = budget or payer.budget
+        rows = cls.parse(lines, file_format)
+
+        started = time.perf_counter()
+        categories = cls.load_category_map()
+        report.timings["validate"] += time.perf_counter() - started
+
+        with deferred_recalc() as touched:
+            while True:
+                started = time.perf_counter()
+                chunk = list(islice(rows, batch_size))
+                report.timings["parse"] += time.perf_counter() - started
+                if not chunk:
+                    break
+
+                started = time.perf_counter()
+                valid = []
+                for row in chunk:
+                    report.rows_read += 1
+                    try:
+                        valid.append(
+                            cls.build_transaction(
+                                row, budget, payer, categories
+                            )
+                        )
+                    except (ValueError, ArithmeticError) as e:
+                        if len(report.errors) < cls.MAX_REPORTED_ERRORS:
+                            report.errors.append(
+                                f"Row {report.rows_read}: {e}"
+                            )
+                report.timings["validate"] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                Transaction.objects.bulk_create(valid, batch_size=batch_size)
+                report.rows_imported += len(valid)
+                report.timings["write"] += time.perf_counter() - started
+
+            if report.rows_imported:
+                touched.add(budget.id)
+            started = time.perf_counter()
+
+        report.timings["recalc"] += time.perf_counter() - started
+        return report
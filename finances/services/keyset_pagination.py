@@ -0,0 +1,100 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+
+@dataclass
+class KeysetPage:
+    object_list: list[Any]
+    has_next: bool
+    next_cursor: str | None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over the transaction history ordering
+    (-date, -timestamp_create, -id). Every page is an index range read
+    that starts right after the last row of the previous page, so deep
+    pages cost the same as the first one and no COUNT(*) is needed.
+    """
+
+    ordering = ("-date", "-timestamp_create", "-id")
+    count_modes = ("exact", "estimate", "none")
+
+    def __init__(self, queryset: QuerySet, per_page: int):
+        self.queryset = queryset.order_by(*self.ordering)
+        self.per_page = per_page
+
+    @staticmethod
+    def encode_cursor(obj) -> str:
+        payload = json.dumps([
+            obj.date.isoformat(),
+            obj.timestamp_create.isoformat(),
+            obj.pk,
+        ])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, datetime, int]:
+        try:
+            date, created, pk = json.loads(
+                base64.urlsafe_b64decode(cursor.encode())
+            )
+            return (
+                datetime.fromisoformat(date),
+                datetime.fromisoformat(created),
+                int(pk),
+            )
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError("Invalid pagination cursor")
+
+    def after(self, queryset: QuerySet, cursor: str) -> QuerySet:
+        """Rows that come after the cursor in the paginator ordering."""
+        date, created, pk = self.decode_cursor(cursor)
+        return queryset.filter(
+            Q(date__lt=date)
+            | Q(date=date, timestamp_create__lt=created)
+            | Q(date=date, timestamp_create=created, pk__lt=pk)
+        )
+
+    def get_page(self, cursor: str | None = None) -> KeysetPage:
+        queryset = self.queryset
+
+        if cursor:
+            queryset = self.after(queryset, cursor)
+
+        rows = list(queryset[:self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        return KeysetPage(
+            object_list=rows,
+            has_next=has_next,
+            next_cursor=self.encode_cursor(rows[-1]) if has_next else None,
+        )
+
+    def count(self, mode: str = "exact") -> int | None:
+        """
+        Total rows of the filtered queryset. "estimate" reads the
+        planner's row estimate on PostgreSQL and is skipped elsewhere,
+        "none" skips counting altogether.
+        """
+        if mode == "exact":
+            return self.queryset.order_by().count()
+
+        if mode == "estimate" and connection.vendor == "postgresql":
+            plan = json.loads(self.queryset.order_by().explain(format="json"))
+            if isinstance(plan, list):
+                plan = plan[0]
+            return int(plan["Plan"]["Plan Rows"])
+
+        return None
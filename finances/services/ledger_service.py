@@ -0,0 +1,208 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from finances.models import Budget, Transaction
+from finances.services.budget_version import BudgetVersionService
+from finances.services.contribution_service import ContributionService
+from finances.services.rollup_service import DailyRollupService
+
+
+class _DeferredScope(threading.local):
+    """
+    Per-thread state of the active deferred_recalc() scope.
+    `dirty` budgets get a full recalc, `deltas` hold the net
+    (income, expense) change of budgets written row by row.
+    """
+    dirty: set[int] | None = None
+    deltas: dict[int, list[Decimal]] | None = None
+
+
+_deferred = _DeferredScope()
+
+
+class BudgetLedgerService:
+    """
+    Keeps Budget totals in sync with their transactions.
+    Every write applies only its own signed delta with a single
+    atomic UPDATE, so the cost does not grow with budget history.
+    Budget.recalc() stays the verification and repair path.
+    """
+
+    @classmethod
+    def is_incremental(cls) -> bool:
+        return getattr(
+            settings, "BUDGET_LEDGER_MODE", "incremental"
+        ) == "incremental"
+
+    @classmethod
+    def is_deferred(cls) -> bool:
+        return _deferred.dirty is not None
+
+    @classmethod
+    def mark_dirty(cls, *budget_ids: int) -> bool:
+        """
+        Schedule a full recalc of the budgets at the end of the active
+        deferred_recalc() scope. Returns False when no scope is active.
+        """
+        if _deferred.dirty is None:
+            return False
+
+        _deferred.dirty.update(pk for pk in budget_ids if pk)
+        return True
+
+    @classmethod
+    def recalc_budgets(cls, budget_ids: Iterable[int]) -> None:
+        for budget in Budget.objects.filter(pk__in=set(budget_ids)):
+            budget.recalc()
+
+    @classmethod
+    def apply_delta(
+            cls,
+            budget_id: int,
+            transaction_type: str,
+            amount: Decimal,
+            sign: int = 1,
+    ) -> None:
+        delta = Decimal(amount) * sign
+
+        if transaction_type == Transaction.Types.INCOME:
+            income, expense = delta, Decimal("0")
+        elif transaction_type == Transaction.Types.EXPENSE:
+            income, expense = Decimal("0"), delta
+        else:
+            return
+
+        if _deferred.deltas is not None:
+            pending = _deferred.deltas[budget_id]
+            pending[0] += income
+            pending[1] += expense
+            return
+
+        cls._update_totals(budget_id, income, expense)
+
+    @classmethod
+    def _update_totals(
+            cls,
+            budget_id: int,
+            income: Decimal,
+            expense: Decimal
+    ) -> None:
+        Budget.objects.filter(pk=budget_id).update(
+            total_income=F("total_income") + income,
+            total_expenses=F("total_expenses") + expense,
+            current_amount=(
+                F("start_amount")
+                + F("total_income") + income
+                - F("total_expenses") - expense
+            ),
+            timestamp_update=timezone.now(),
+        )
+
+    @classmethod
+    def _flush(cls, dirty: set[int], deltas: dict) -> None:
+        cls.recalc_budgets(dirty)
+        if dirty:
+            DailyRollupService.rebuild(dirty)
+            ContributionService.rebuild(dirty)
+            BudgetVersionService.bump_on_write(*dirty)
+
+        for budget_id, (income, expense) in deltas.items():
+            if budget_id in dirty or (not income and not expense):
+                continue
+            cls._update_totals(budget_id, income, expense)
+
+    TRACKED_FIELDS = (
+        "target_id",
+        "transaction_type",
+        "amount",
+        "date",
+        "category_id",
+        "payer_id",
+    )
+
+    @classmethod
+    def current_state(cls, instance: Transaction) -> tuple:
+        return (
+            instance.target_id,
+            instance.transaction_type,
+            Decimal(instance.amount),
+            instance.date,
+            instance.category_id,
+            instance.payer_id,
+        )
+
+    @classmethod
+    def remember_previous(cls, instance: Transaction) -> None:
+        """Store the persisted state of an updated row before save."""
+        instance._ledger_previous = None
+
+        if instance._state.adding or instance.pk is None:
+            return
+
+        instance._ledger_previous = (
+            Transaction.objects
+            .filter(pk=instance.pk)
+            .values_list(*cls.TRACKED_FIELDS)
+            .first()
+        )
+
+    @classmethod
+    def on_saved(cls, instance: Transaction) -> None:
+        previous = getattr(instance, "_ledger_previous", None)
+        current = cls.current_state(instance)
+        instance._ledger_previous = current
+
+        if previous and previous[:3] == current[:3]:
+            return
+
+        if previous:
+            cls.apply_delta(*previous[:3], sign=-1)
+
+        cls.apply_delta(*current[:3])
+
+    @classmethod
+    def on_deleted(cls, instance: Transaction) -> None:
+        cls.apply_delta(
+            instance.target_id,
+            instance.transaction_type,
+            instance.amount,
+            sign=-1,
+        )
+
+
+@contextmanager
+def deferred_recalc() -> Iterator[set[int]]:
+    """
+    Batch budget maintenance for multi-write operations. Deltas of rows
+    written inside the scope are folded per budget and budgets added to
+    the yielded set (e.g. after bulk_create) are recalculated, each
+    exactly once when the outermost scope exits, inside the same
+    database transaction. Works as a context manager and as a decorator.
+
+        with deferred_recalc() as touched:
+            Transaction.objects.bulk_create(rows)
+            touched.add(budget.id)
+    """
+    if BudgetLedgerService.is_deferred():
+        with transaction.atomic():
+            yield _deferred.dirty
+        return
+
+    _deferred.dirty = set()
+    _deferred.deltas = defaultdict(lambda: [Decimal("0"), Decimal("0")])
+    try:
+        with transaction.atomic():
+            yield _deferred.dirty
+            dirty, deltas = _deferred.dirty, _deferred.deltas
+            _deferred.dirty = _deferred.deltas = None
+            BudgetLedgerService._flush(dirty, deltas)
+    finally:
+        _deferred.dirty = _deferred.deltas = None
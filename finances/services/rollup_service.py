@@ -0,0 +1,193 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from finances.models import Category, DailyBudgetRollup, Transaction
+
+
+class DailyRollupService:
+    """
+    Maintains DailyBudgetRollup rows. Single writes adjust one
+    (budget, day, type, category) row in place; bulk writes mark their
+    budgets dirty in deferred_recalc() and get rebuilt from scratch.
+    """
+
+    REBUILD_BATCH_SIZE = 1000
+
+    @classmethod
+    def day_of(cls, value: date | datetime) -> date:
+        """Local calendar day of a transaction date, as TruncDate sees it."""
+        if not isinstance(value, datetime):
+            return value
+        if timezone.is_aware(value):
+            return timezone.localdate(value)
+        return value.date()
+
+    @classmethod
+    def apply(
+            cls,
+            budget_id: int,
+            day: date,
+            transaction_type: str,
+            category_id: int | None,
+            amount: Decimal,
+            sign: int = 1,
+    ) -> None:
+        rows = DailyBudgetRollup.objects.filter(
+            budget_id=budget_id,
+            day=day,
+            transaction_type=transaction_type,
+            category_id=category_id,
+        )
+        changes = {
+            "count": F("count") + sign,
+            "total": F("total") + Decimal(amount) * sign,
+        }
+
+        if sign < 0:
+            rows.update(**changes)
+            rows.filter(count__lte=0).delete()
+            return
+
+        if rows.update(**changes):
+            return
+
+        try:
+            with transaction.atomic():
+                DailyBudgetRollup.objects.create(
+                    budget_id=budget_id,
+                    day=day,
+                    transaction_type=transaction_type,
+                    category_id=category_id,
+                    count=1,
+                    total=amount,
+                )
+        except IntegrityError:
+            # created concurrently by another writer
+            rows.update(**changes)
+
+    @classmethod
+    def _bucket(
+            cls,
+            target_id: int,
+            transaction_type: str,
+            amount: Decimal,
+            date_value: date | datetime,
+            category_id: int | None,
+    ) -> tuple:
+        return (
+            target_id,
+            cls.day_of(date_value),
+            transaction_type,
+            category_id,
+            Decimal(amount),
+        )
+
+    @classmethod
+    def on_saved(cls, instance: Transaction) -> None:
+        """
+        Move the row from its previous bucket to the current one.
+        Reads `_ledger_previous` stored by BudgetLedgerService, so it has
+        to run before the ledger replaces it with the current state.
+        """
+        current = cls._bucket(
+            instance.target_id,
+            instance.transaction_type,
+            instance.amount,
+            instance.date,
+            instance.category_id,
+        )
+
+        previous = getattr(instance, "_ledger_previous", None)
+        if previous:
+            previous = cls._bucket(*previous[:5])
+            if previous == current:
+                return
+            cls.apply(*previous, sign=-1)
+
+        cls.apply(*current)
+
+    @classmethod
+    def on_deleted(cls, instance: Transaction) -> None:
+        cls.apply(
+            instance.target_id,
+            cls.day_of(instance.date),
+            instance.transaction_type,
+            instance.category_id,
+            instance.amount,
+            sign=-1,
+        )
+
+    @classmethod
+    def on_category_deleting(cls, category: Category) -> None:
+        """
+        Drop the category's rows before SET_NULL turns them into a
+        second set of uncategorized rows for the same days, remembering
+        their budgets for on_category_deleted().
+        """
+        rows = DailyBudgetRollup.objects.filter(category=category)
+        category._rollup_budget_ids = set(
+            rows.values_list("budget_id", flat=True).distinct()
+        )
+        rows.delete()
+
+    @classmethod
+    def on_category_deleted(cls, category: Category) -> set[int]:
+        """
+        Rebuild the budgets that had rows of the deleted category, now
+        that their transactions are uncategorized. Returns their ids.
+        """
+        budget_ids = getattr(category, "_rollup_budget_ids", set())
+        if budget_ids:
+            cls.rebuild(budget_ids)
+        return budget_ids
+
+    @classmethod
+    def rebuild(cls, budget_ids: Iterable[int] | None = None) -> int:
+        """
+        Recompute rollups from transactions, for the given budgets or
+        all of them. Returns the number of rollup rows written.
+        """
+        rollups = DailyBudgetRollup.objects.all()
+        transactions = Transaction.objects.order_by()
+        if budget_ids is not None:
+            budget_ids = set(budget_ids)
+            rollups = rollups.filter(budget_id__in=budget_ids)
+            transactions = transactions.filter(target_id__in=budget_ids)
+
+        aggregated = (
+            transactions
+            .annotate(day=TruncDate("date"))
+            .values("target_id", "day", "transaction_type", "category_id")
+            .annotate(rows=Count("id"), amount=Sum("amount"))
+            .order_by()
+        )
+
+        written = 0
+        with transaction.atomic():
+            rollups.delete()
+            batch = []
+            for row in aggregated.iterator(chunk_size=cls.REBUILD_BATCH_SIZE):
+                batch.append(
+                    DailyBudgetRollup(
+                        budget_id=row["target_id"],
+                        day=row["day"],
+                        transaction_type=row["transaction_type"],
+                        category_id=row["category_id"],
+                        count=row["rows"],
+                        total=row["amount"],
+                    )
+                )
+                if len(batch) >= cls.REBUILD_BATCH_SIZE:
+                    DailyBudgetRollup.objects.bulk_create(batch)
+                    written += len(batch)
+                    batch = []
+            DailyBudgetRollup.objects.bulk_create(batch)
+            written += len(batch)
+
+        return written
@@ -0,0 +1,271 @@
+import re
+
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+from finances.models import Transaction
+
+
+class TransactionSearchService:
+    """
+    Full-text search over transaction notes and category names.
+
+    PostgreSQL keeps a `transactions.search_vector` tsvector column with
+    a GIN index, SQLite keeps an FTS5 shadow table keyed by transaction
+    id. Both are maintained by database triggers, so bulk_create and
+    category renames stay in sync too. Other backends fall back to
+    icontains lookups.
+    """
+
+    FTS_TABLE = "transactions_fts"
+
+    POSTGRES_INSTALL = [
+        "ALTER TABLE transactions "
+        "ADD COLUMN IF NOT EXISTS search_vector tsvector",
+        "CREATE INDEX IF NOT EXISTS tx_search_vector_gin "
+        "ON transactions USING GIN (search_vector)",
+        """
+        CREATE OR REPLACE FUNCTION transactions_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector(
+                'simple',
+                coalesce(NEW.note, '') || ' ' || coalesce(
+                    (SELECT name FROM categories WHERE id = NEW.category_id),
+                    ''
+                )
+            );
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS transactions_search_vector_trg "
+        "ON transactions",
+        """
+        CREATE TRIGGER transactions_search_vector_trg
+        BEFORE INSERT OR UPDATE OF note, category_id ON transactions
+        FOR EACH ROW EXECUTE FUNCTION transactions_search_vector_update()
+        """,
+        """
+        CREATE OR REPLACE FUNCTION categories_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE transactions
+            SET search_vector = to_tsvector(
+                'simple', coalesce(note, '') || ' ' || coalesce(NEW.name, '')
+            )
+            WHERE category_id = NEW.id;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS categories_search_vector_trg ON categories",
+        """
+        CREATE TRIGGER categories_search_vector_trg
+        AFTER UPDATE OF name ON categories
+        FOR EACH ROW EXECUTE FUNCTION categories_search_vector_update()
+        """,
+        """
+        UPDATE transactions AS t
+        SET search_vector = to_tsvector(
+            'simple', coalesce(t.note, '') || ' ' || coalesce(c.name, '')
+        )
+        FROM transactions AS s
+        LEFT JOIN categories AS c ON c.id = s.category_id
+        WHERE s.id = t.id AND t.search_vector IS NULL
+        """,
+    ]
+
+    POSTGRES_UNINSTALL = [
+        "DROP TRIGGER IF EXISTS categories_search_vector_trg ON categories",
+        "DROP FUNCTION IF EXISTS categories_search_vector_update()",
+        "DROP TRIGGER IF EXISTS transactions_search_vector_trg "
+        "ON transactions",
+        "DROP FUNCTION IF EXISTS transactions_search_vector_update()",
+        "DROP INDEX IF EXISTS tx_search_vector_gin",
+        "ALTER TABLE transactions DROP COLUMN IF EXISTS search_vector",
+    ]
+
+    SQLITE_INSTALL = [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+        USING fts5(note, category_name, tokenize = 'unicode61')
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai
+        AFTER INSERT ON transactions BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, note, category_name)
+            VALUES (
+                new.id,
+                new.note,
+                coalesce(
+                    (SELECT name FROM categories WHERE id = new.category_id),
+                    ''
+                )
+            );
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad
+        AFTER DELETE ON transactions BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF note, category_id ON transactions BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+            INSERT INTO {FTS_TABLE}(rowid, note, category_name)
+            VALUES (
+                new.id,
+                new.note,
+                coalesce(
+                    (SELECT name FROM categories WHERE id = new.category_id),
+                    ''
+                )
+            );
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_category_au
+        AFTER UPDATE OF name ON categories BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid IN (
+                SELECT id FROM transactions WHERE category_id = new.id
+            );
+            INSERT INTO {FTS_TABLE}(rowid, note, category_name)
+            SELECT id, note, new.name
+            FROM transactions WHERE category_id = new.id;
+        END
+        """,
+        f"DELETE FROM {FTS_TABLE}",
+        f"""
+        INSERT INTO {FTS_TABLE}(rowid, note, category_name)
+        SELECT t.id, t.note, coalesce(c.name, '')
+        FROM transactions AS t
+        LEFT JOIN categories AS c ON c.id = t.category_id
+        """,
+    ]
+
+    SQLITE_UNINSTALL = [
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_category_au",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+        f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+        f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    ]
+
+    _installed: dict[str, bool] = {}
+
+    @classmethod
+    def install(cls, connection) -> bool:
+        """Create (or restore) the index and its triggers, then backfill."""
+        statements = {
+            "postgresql": cls.POSTGRES_INSTALL,
+            "sqlite": cls.SQLITE_INSTALL,
+        }.get(connection.vendor)
+
+        if statements is None:
+            installed = False
+        else:
+            try:
+                # a savepoint, so a failure leaves an enclosing
+                # PostgreSQL transaction usable
+                with transaction.atomic(using=connection.alias):
+                    with connection.cursor() as cursor:
+                        for sql in statements:
+                            cursor.execute(sql)
+                installed = True
+            except DatabaseError:
+                # e.g. SQLite compiled without FTS5
+                installed = False
+
+        cls._installed[connection.alias] = installed
+        return installed
+
+    @classmethod
+    def uninstall(cls, connection) -> None:
+        statements = {
+            "postgresql": cls.POSTGRES_UNINSTALL,
+            "sqlite": cls.SQLITE_UNINSTALL,
+        }.get(connection.vendor, [])
+
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+        cls._installed[connection.alias] = False
+
+    @classmethod
+    def is_installed(cls, connection) -> bool:
+        if connection.alias in cls._installed:
+            return cls._installed[connection.alias]
+
+        if connection.vendor == "postgresql":
+            sql = (
+                "SELECT 1 FROM pg_trigger "
+                "WHERE tgname = 'transactions_search_vector_trg'"
+            )
+        elif connection.vendor == "sqlite":
+            sql = (
+                "SELECT 1 FROM sqlite_master "
+                f"WHERE type = 'trigger' AND name = '{cls.FTS_TABLE}_ai'"
+            )
+        else:
+            cls._installed[connection.alias] = False
+            return False
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            installed = cursor.fetchone() is not None
+
+        cls._installed[connection.alias] = installed
+        return installed
+
+    @classmethod
+    def ensure_installed(cls, connection) -> None:
+        """
+        Reinstall the triggers when they went missing, e.g. after SQLite
+        rebuilt the transactions table during an ALTER migration.
+        """
+        cls._installed.pop(connection.alias, None)
+        if not cls.is_installed(connection):
+            cls.install(connection)
+
+    @classmethod
+    def tokenize(cls, term: str) -> list[str]:
+        return re.findall(r"\w+", term.lower())
+
+    @classmethod
+    def search(
+            cls,
+            queryset: QuerySet[Transaction],
+            term: str
+    ) -> QuerySet[Transaction]:
+        """Prefix-match every word of `term` in note or category name."""
+        tokens = cls.tokenize(term)
+        if not tokens:
+            return queryset
+
+        connection = connections[queryset.db]
+        if not cls.is_installed(connection):
+            for token in tokens:
+                queryset = queryset.filter(
+                    Q(note__icontains=token)
+                    | Q(category__name__icontains=token)
+                )
+            return queryset
+
+        if connection.vendor == "postgresql":
+            matches = RawSQL(
+                "SELECT id FROM transactions "
+                "WHERE search_vector @@ to_tsquery('simple', %s)",
+                [" & ".join(f"{token}:*" for token in tokens)],
+            )
+        else:
+            matches = RawSQL(
+                f"SELECT rowid FROM {cls.FTS_TABLE} "
+                f"WHERE {cls.FTS_TABLE} MATCH %s",
+                [" ".join(f'"{token}"*' for token in tokens)],
+            )
+
+        return queryset.filter(pk__in=matches)
@@ -1,5 +1,4 @@
 from django.contrib.auth import get_user_model
-from django.db import transaction
 from decimal import Decimal
 
 from django.shortcuts import get_object_or_404
@@ -7,6 +6,8 @@ from django.utils import timezone
 
 from events.models import Event
 from finances.models import Transaction, Category, Budget
+from finances.services.category_registry import CategoryRegistry
+from finances.services.ledger_service import deferred_recalc
 from groups.models import Group
 
 User = get_user_model()
@@ -33,7 +34,7 @@ class TransfersService:
         return owner.budget
 
     @classmethod
-    @transaction.atomic
+    @deferred_recalc()
     def transfer_between_budgets(
             cls,
             amount: Decimal,
@@ -63,11 +64,8 @@ class TransfersService:
             note=note,
         )
 
-        from_budget.recalc()
-        to_budget.recalc()
-
     @classmethod
-    @transaction.atomic
+    @deferred_recalc()
     def top_up_budget(
             cls,
             user: User,
@@ -77,7 +75,7 @@ class TransfersService:
             date=timezone.now().date()
     ) -> Transaction:
         if category is None:
-            category, _ = Category.objects.get_or_create(
+            category = CategoryRegistry.get_or_create(
                 name="Top Up",
                 category_type=Category.Types.INCOME,
                 color_hex="#00ff00",
@@ -91,11 +89,10 @@ class TransfersService:
             category=category,
             note=note,
         )
-        user.budget.recalc()
         return transaction
 
     @classmethod
-    @transaction.atomic
+    @deferred_recalc()
     def set_expense(
             cls,
             user: User,
@@ -105,7 +102,7 @@ class TransfersService:
             date=timezone.now().date()
     ) -> Transaction:
         if category is None:
-            category, _ = Category.objects.get_or_create(
+            category = CategoryRegistry.get_or_create(
                 name="Other expense",
                 category_type=Category.Types.EXPENSE,
                 color_hex="#ff0000",
@@ -119,5 +116,4 @@ class TransfersService:
             category=category,
             note=note,
         )
-        user.budget.recalc()
         return transaction
@@ -1,13 +1,28 @@
 from decimal import Decimal
 
-from django.db.models.signals import post_save, post_delete
+from django.db import connections, transaction
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.core.signals import request_started
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth import get_user_model
 
 from events.models import Event
 from groups.models import Group
-from .models import Budget, Transaction
+from .models import Budget, Category, Transaction
+from .services.budget_version import BudgetVersionService
+from .services.category_registry import CategoryRegistry
+from .services.contribution_service import ContributionService
+from .services.ledger_service import BudgetLedgerService
+from .services.rollup_service import DailyRollupService
+from .services.search_service import TransactionSearchService
 
 User = get_user_model()
 
@@ -68,7 +83,88 @@ def create_budget_for_event(
         )
 
 
-@receiver([post_save, post_delete], sender=Transaction)
-def update_budget_on_change(sender, instance: Transaction, **kwargs) -> None:
-    if instance.target:
-        instance.target.recalc()
\ No newline at end of file
+@receiver(post_save, sender=Budget)
+def bump_budget_version(sender, instance: Budget, **kwargs) -> None:
+    BudgetVersionService.bump_on_write(instance.pk)
+
+
+@receiver(pre_save, sender=Transaction)
+def remember_transaction_state(
+        sender,
+        instance: Transaction,
+        **kwargs
+) -> None:
+    BudgetLedgerService.remember_previous(instance)
+
+
+@receiver(post_save, sender=Transaction)
+def update_budget_on_save(sender, instance: Transaction, **kwargs) -> None:
+    if not instance.target_id:
+        return
+
+    previous = getattr(instance, "_ledger_previous", None)
+    BudgetVersionService.bump_on_write(
+        instance.target_id,
+        *(previous[:1] if previous else ()),
+    )
+
+    DailyRollupService.on_saved(instance)
+    ContributionService.on_saved(instance)
+    if BudgetLedgerService.is_incremental():
+        BudgetLedgerService.on_saved(instance)
+    elif not BudgetLedgerService.mark_dirty(instance.target_id):
+        instance.target.recalc()
+
+
+@receiver(post_delete, sender=Transaction)
+def update_budget_on_delete(sender, instance: Transaction, **kwargs) -> None:
+    if not instance.target_id:
+        return
+
+    BudgetVersionService.bump_on_write(instance.target_id)
+    DailyRollupService.on_deleted(instance)
+    ContributionService.on_deleted(instance)
+    if BudgetLedgerService.is_incremental():
+        BudgetLedgerService.on_deleted(instance)
+    elif not BudgetLedgerService.mark_dirty(instance.target_id):
+        instance.target.recalc()
+
+
+@receiver(post_migrate)
+def restore_search_index(sender, using: str, **kwargs) -> None:
+    """
+    SQLite drops triggers when a migration rebuilds the transactions
+    table, so re-check the search index after every finances migrate.
+    """
+    if sender.name != "finances":
+        return
+
+    connection = connections[using]
+    applied = MigrationRecorder(connection).applied_migrations()
+    if ("finances", "0007_transaction_search_index") in applied:
+        TransactionSearchService.ensure_installed(connection)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_registry(sender, **kwargs) -> None:
+    CategoryRegistry.invalidate()
+    # drop a snapshot that was read before the write became visible
+    transaction.on_commit(CategoryRegistry.invalidate)
+
+
+@receiver(pre_delete, sender=Category)
+def forget_category_rollups(sender, instance: Category, **kwargs) -> None:
+    DailyRollupService.on_category_deleting(instance)
+
+
+@receiver(post_delete, sender=Category)
+def rebuild_category_rollups(sender, instance: Category, **kwargs) -> None:
+    budget_ids = DailyRollupService.on_category_deleted(instance)
+    if budget_ids:
+        BudgetVersionService.bump_on_write(*budget_ids)
+
+
+@receiver(request_started)
+def recheck_category_registry(sender, **kwargs) -> None:
+    CategoryRegistry.recheck()
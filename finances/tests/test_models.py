@@ -1,9 +1,19 @@
+from datetime import timedelta
 from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Sum
+from django.db.models.functions import TruncDay
 from django.test import TestCase
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.contrib.contenttypes.models import ContentType
+
+from dashboard.DTO import AnalyticsContext
+from dashboard.services.transactions_stats import TransactionStatsService
 from finances.models import Budget, Category, Transaction
+from finances.services.history_service import TransactionHistoryService
 
 User = get_user_model()
 
@@ -107,3 +117,88 @@ class FinancesModelTest(TestCase):
                 content_type=self.user_ct,
                 object_id=self.user.id
             )
+
+
+class TransactionQueryPlanTest(TestCase):
+    """
+    Guards the composite indexes: the hot transaction queries must be
+    answered by an index search, not a sequential scan of the table.
+    """
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f"user{i}", password="pass")
+            for i in range(5)
+        ]
+        self.category = Category.objects.create(
+            name="Salary",
+            category_type=Category.Types.INCOME
+        )
+        now = timezone.now()
+        Transaction.objects.bulk_create([
+            Transaction(
+                amount=Decimal("10.00"),
+                transaction_type=(
+                    Transaction.Types.INCOME if i % 3
+                    else Transaction.Types.EXPENSE
+                ),
+                date=now - timedelta(days=i % 90),
+                target=self.users[i % 5].budget,
+                payer=self.users[i % 5],
+                category=self.category if i % 3 else None,
+            )
+            for i in range(500)
+        ])
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+        self.ctx = AnalyticsContext(
+            target_budget_id=self.users[0].budget.id,
+            date_from=(now - timedelta(days=30)).date(),
+            date_to=now.date(),
+        )
+
+    def explain(self, queryset) -> str:
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def assert_index_search(self, queryset, index_name):
+        plan = self.explain(queryset)
+
+        if connection.vendor == "postgresql":
+            self.assertIn(index_name, plan)
+            self.assertNotIn("Seq Scan on transactions", plan)
+        else:
+            self.assertRegex(
+                plan,
+                rf"SEARCH transactions USING (COVERING )?INDEX {index_name}"
+            )
+
+    def test_range_queryset_uses_target_index(self):
+        self.assert_index_search(
+            TransactionStatsService.get_range_queryset(self.ctx)
+            .filter(transaction_type=Transaction.Types.INCOME)
+            .values("amount"),
+            "tx_target_date_type_amount",
+        )
+
+    def test_cashflow_uses_target_index(self):
+        self.assert_index_search(
+            TransactionStatsService.get_range_queryset(self.ctx)
+            .annotate(day=TruncDay("date"))
+            .values("day")
+            .annotate(total=Sum("amount")),
+            "tx_target_date_type_amount",
+        )
+
+    def test_user_history_uses_payer_index(self):
+        queryset = TransactionHistoryService.get_user_transactions(
+            self.users[0].id
+        )
+
+        self.assert_index_search(queryset, "tx_payer_date_created")
+        if connection.vendor == "sqlite":
+            self.assertNotIn("TEMP B-TREE", self.explain(queryset))
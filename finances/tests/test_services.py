@@ -1,13 +1,36 @@
+import csv
+import json
+from datetime import timedelta
 from decimal import Decimal
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.signals import request_started
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 
-from finances.models import Budget, Transaction, Category
+from finances.models import (
+    Budget,
+    BudgetContribution,
+    Category,
+    DailyBudgetRollup,
+    Transaction,
+)
+from finances.services.budget_loader import BudgetLoader
+from finances.services.category_registry import CategoryRegistry
+from finances.services.contribution_service import ContributionService
+from finances.services.export_service import TransactionExportService
 from finances.services.history_service import TransactionHistoryService
+from finances.services.import_service import TransactionImportService
+from finances.services.ledger_service import deferred_recalc
+from finances.services.rollup_service import DailyRollupService
+from finances.services.search_service import TransactionSearchService
 from finances.services.transfers_service import TransfersService
 from events.models import Event
+from groups.models import Group
 
 User = get_user_model()
 
@@ -103,3 +126,706 @@ class TransfersServiceTest(TestCase):
         history = TransactionHistoryService.get_event_transactions(event.id)
         self.assertEqual(history.count(), 1)
         self.assertEqual(history.first().target, event_budget)
+
+
+class BudgetLedgerServiceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="ledger",
+            password="pass"
+        )
+        self.budget = self.user.budget
+        self.budget.start_amount = Decimal("100.00")
+        self.budget.save()
+        self.budget.recalc()
+
+    def create_transaction(self, amount, transaction_type):
+        return Transaction.objects.create(
+            amount=Decimal(amount),
+            transaction_type=transaction_type,
+            target=self.budget,
+            payer=self.user,
+        )
+
+    def assert_matches_recalc(self):
+        self.budget.refresh_from_db()
+        stored = self.budget.get_budget_data()
+        self.budget.recalc(save=False)
+        self.assertEqual(stored, self.budget.get_budget_data())
+
+    def test_create_applies_delta(self):
+        self.create_transaction("50.00", Transaction.Types.INCOME)
+        self.create_transaction("20.00", Transaction.Types.EXPENSE)
+
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.total_income, Decimal("50.00"))
+        self.assertEqual(self.budget.total_expenses, Decimal("20.00"))
+        self.assertEqual(self.budget.current_amount, Decimal("130.00"))
+        self.assert_matches_recalc()
+
+    def test_update_replaces_previous_delta(self):
+        tx = self.create_transaction("50.00", Transaction.Types.INCOME)
+
+        tx.amount = Decimal("30.00")
+        tx.transaction_type = Transaction.Types.EXPENSE
+        tx.save()
+
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.total_income, Decimal("0.00"))
+        self.assertEqual(self.budget.total_expenses, Decimal("30.00"))
+        self.assertEqual(self.budget.current_amount, Decimal("70.00"))
+        self.assert_matches_recalc()
+
+    def test_delete_reverts_delta(self):
+        tx = self.create_transaction("50.00", Transaction.Types.INCOME)
+        tx.delete()
+
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.current_amount, Decimal("100.00"))
+        self.assert_matches_recalc()
+
+    def test_move_between_budgets(self):
+        other = User.objects.create_user(username="other", password="pass")
+        tx = self.create_transaction("40.00", Transaction.Types.INCOME)
+
+        tx.target = other.budget
+        tx.save()
+
+        self.budget.refresh_from_db()
+        other.budget.refresh_from_db()
+        self.assertEqual(self.budget.current_amount, Decimal("100.00"))
+        self.assertEqual(other.budget.current_amount, Decimal("40.00"))
+
+
+class DeferredRecalcTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="deferred",
+            password="pass"
+        )
+        self.budget = self.user.budget
+
+    def make_transaction(self, amount, transaction_type):
+        return Transaction(
+            amount=Decimal(amount),
+            transaction_type=transaction_type,
+            target=self.budget,
+            payer=self.user,
+        )
+
+    def test_deltas_are_applied_once_at_scope_exit(self):
+        with deferred_recalc():
+            self.make_transaction("10.00", Transaction.Types.INCOME).save()
+            self.make_transaction("4.00", Transaction.Types.EXPENSE).save()
+
+            self.budget.refresh_from_db()
+            self.assertEqual(self.budget.current_amount, Decimal("0.00"))
+
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.total_income, Decimal("10.00"))
+        self.assertEqual(self.budget.total_expenses, Decimal("4.00"))
+        self.assertEqual(self.budget.current_amount, Decimal("6.00"))
+
+    def test_touched_budgets_are_recalculated(self):
+        with deferred_recalc() as touched:
+            Transaction.objects.bulk_create([
+                self.make_transaction("7.00", Transaction.Types.INCOME),
+                self.make_transaction("3.00", Transaction.Types.INCOME),
+            ])
+            touched.add(self.budget.id)
+
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.total_income, Decimal("10.00"))
+
+    def test_nested_scope_flushes_with_outermost(self):
+        with deferred_recalc():
+            with deferred_recalc():
+                self.make_transaction("5.00", Transaction.Types.INCOME).save()
+
+            self.budget.refresh_from_db()
+            self.assertEqual(self.budget.total_income, Decimal("0.00"))
+
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.total_income, Decimal("5.00"))
+
+    def test_transfer_updates_each_budget_once(self):
+        other = User.objects.create_user(username="other", password="pass")
+        category = Category.objects.create(
+            name="Gift",
+            category_type=Category.Types.INCOME
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            TransfersService.transfer_between_budgets(
+                amount=Decimal("25.00"),
+                from_budget=self.budget,
+                to_budget=other.budget,
+                payer=self.user,
+                date=timezone.now(),
+                category=category,
+            )
+
+        budget_updates = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "budgets"')
+        ]
+        self.assertEqual(len(budget_updates), 2)
+        other.budget.refresh_from_db()
+        self.assertEqual(other.budget.total_income, Decimal("25.00"))
+
+
+class TransactionImportServiceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="importer",
+            password="pass"
+        )
+        self.salary = Category.objects.create(
+            name="Salary",
+            category_type=Category.Types.INCOME
+        )
+        Category.objects.create(
+            name="Food",
+            category_type=Category.Types.EXPENSE
+        )
+
+    def test_import_csv(self):
+        lines = [
+            "date,amount,type,category,note\n",
+            "2025-01-01,1000.00,Income,Salary,January\n",
+            "2025-01-02,-25.50,,food,Lunch\n",
+            "2025-01-03,10.00,Income,Food,Wrong category\n",
+            "not-a-date,10.00,Income,,Broken\n",
+        ]
+
+        report = TransactionImportService.import_rows(
+            lines=lines,
+            file_format="csv",
+            payer=self.user,
+            batch_size=2,
+        )
+
+        self.assertEqual(report.rows_read, 4)
+        self.assertEqual(report.rows_imported, 2)
+        self.assertEqual(len(report.errors), 2)
+
+        budget = self.user.budget
+        budget.refresh_from_db()
+        self.assertEqual(budget.total_income, Decimal("1000.00"))
+        self.assertEqual(budget.total_expenses, Decimal("25.50"))
+        self.assertEqual(
+            budget.transactions.get(note="January").category,
+            self.salary
+        )
+
+    def test_import_rejects_unrepresentable_amounts(self):
+        amounts = ["NaN", "sNaN", "Infinity", "-inf", "1e30",
+                   "123456789012345", "9999999999.999"]
+        lines = ["date,amount,note\n"] + [
+            f"2025-01-01,{amount},Bad\n" for amount in amounts
+        ] + ["2025-01-02,9999999999.99,Largest\n"]
+
+        report = TransactionImportService.import_rows(
+            lines=lines,
+            file_format="csv",
+            payer=self.user,
+        )
+
+        self.assertEqual(report.rows_read, len(amounts) + 1)
+        self.assertEqual(report.rows_imported, 1)
+        self.assertEqual(len(report.errors), len(amounts))
+        self.assertFalse(Transaction.objects.filter(note="Bad").exists())
+
+    def test_import_reports_malformed_csv_lines(self):
+        lines = [
+            "date,amount,note\n",
+            f"2025-01-01,10.00,{'x' * (csv.field_size_limit() + 1)}\n",
+            "2025-01-02,15.00,Valid\n",
+        ]
+
+        report = TransactionImportService.import_rows(
+            lines=lines,
+            file_format="csv",
+            payer=self.user,
+        )
+
+        self.assertEqual(report.rows_read, 2)
+        self.assertEqual(report.rows_imported, 1)
+        self.assertIn("malformed CSV", report.errors[0])
+
+    def test_import_ofx(self):
+        lines = [
+            "<OFX><BANKTRANLIST>\n",
+            "<STMTTRN><TRNTYPE>DEBIT\n",
+            "<DTPOSTED>20250105120000[0:GMT]\n",
+            "<TRNAMT>-12.30<NAME>Coffee shop\n",
+            "</STMTTRN>\n",
+            "<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20250106",
+            "<TRNAMT>40.00<MEMO>Refund</STMTTRN>\n",
+            "</BANKTRANLIST></OFX>\n",
+        ]
+
+        report = TransactionImportService.import_rows(
+            lines=lines,
+            file_format="ofx",
+            payer=self.user,
+        )
+
+        self.assertEqual(report.rows_imported, 2)
+        expense = Transaction.objects.get(note="Coffee shop")
+        self.assertEqual(expense.transaction_type, Transaction.Types.EXPENSE)
+        self.assertEqual(expense.amount, Decimal("12.30"))
+        self.assertEqual(expense.date.day, 5)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            TransactionImportService.import_rows(
+                lines=[],
+                file_format="xls",
+                payer=self.user
+            )
+
+
+class TransactionSearchServiceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="searcher",
+            password="pass"
+        )
+        self.food = Category.objects.create(
+            name="Groceries",
+            category_type=Category.Types.EXPENSE
+        )
+        self.lunch = self.create_transaction("Business lunch", None)
+        self.market = self.create_transaction("Weekly market", self.food)
+
+    def create_transaction(self, note, category):
+        return Transaction.objects.create(
+            amount=Decimal("10.00"),
+            transaction_type=Transaction.Types.EXPENSE,
+            target=self.user.budget,
+            payer=self.user,
+            category=category,
+            note=note,
+        )
+
+    def search(self, term):
+        return set(
+            TransactionSearchService.search(
+                Transaction.objects.all(),
+                term
+            ).values_list("id", flat=True)
+        )
+
+    def test_prefix_match_on_note_and_category(self):
+        self.assertEqual(self.search("lun"), {self.lunch.id})
+        self.assertEqual(self.search("groc"), {self.market.id})
+        self.assertEqual(self.search("weekly groc"), {self.market.id})
+        self.assertEqual(self.search("nothing"), set())
+
+    def test_index_follows_updates_and_deletes(self):
+        self.lunch.note = "Team dinner"
+        self.lunch.save()
+        self.assertEqual(self.search("lunch"), set())
+        self.assertEqual(self.search("dinner"), {self.lunch.id})
+
+        self.food.name = "Supermarket"
+        self.food.save()
+        self.assertEqual(self.search("supermar"), {self.market.id})
+
+        self.market.delete()
+        self.assertEqual(self.search("supermar"), set())
+
+    def test_bulk_created_rows_are_indexed(self):
+        Transaction.objects.bulk_create([
+            Transaction(
+                amount=Decimal("1.00"),
+                target=self.user.budget,
+                payer=self.user,
+                note="Imported statement row",
+            )
+        ])
+        self.assertEqual(len(self.search("statem")), 1)
+
+
+class TransactionExportServiceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="exporter",
+            password="pass"
+        )
+        food = Category.objects.create(
+            name="Food",
+            category_type=Category.Types.EXPENSE
+        )
+        Transaction.objects.create(
+            amount=Decimal("12.50"),
+            transaction_type=Transaction.Types.EXPENSE,
+            target=self.user.budget,
+            payer=self.user,
+            category=food,
+            note='Lunch, "quoted"',
+        )
+        Transaction.objects.create(
+            amount=Decimal("100.00"),
+            transaction_type=Transaction.Types.INCOME,
+            target=self.user.budget,
+            payer=self.user,
+        )
+        self.queryset = TransactionHistoryService.get_user_transactions(
+            user_id=self.user.id
+        )
+
+    def test_stream_csv(self):
+        lines = list(
+            TransactionExportService.stream(self.queryset, "csv", 1)
+        )
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("id,date,type,amount"))
+        self.assertIn('"Lunch, ""quoted"""', "".join(lines))
+
+    def test_stream_jsonl_with_filters(self):
+        queryset = TransactionHistoryService.apply_filters(
+            self.queryset,
+            {"type": Transaction.Types.EXPENSE}
+        )
+        lines = list(TransactionExportService.stream(queryset, "jsonl"))
+        self.assertEqual(len(lines), 1)
+
+        record = json.loads(lines[0])
+        self.assertEqual(record["amount"], "12.50")
+        self.assertEqual(record["category"], "Food")
+        self.assertEqual(record["payer"], "exporter")
+
+
+class BudgetLoaderTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="loader",
+            password="pass"
+        )
+        self.events = [
+            Event.objects.create(name=f"Event {i}", planned_amount=100)
+            for i in range(3)
+        ]
+        self.groups = [
+            Group.objects.create(name=f"Group {i}", creator=self.user)
+            for i in range(2)
+        ]
+        for model in (User, Event, Group):
+            ContentType.objects.get_for_model(model)
+
+    def test_prefetch_mixed_owners(self):
+        owners = [
+            User.objects.get(pk=self.user.pk),
+            *Event.objects.all(),
+            *Group.objects.all(),
+        ]
+
+        with self.assertNumQueries(3):
+            BudgetLoader.prefetch_budgets(owners)
+
+        with self.assertNumQueries(0):
+            budgets = [owner.budget for owner in owners]
+
+        self.assertEqual(
+            [budget.object_id for budget in budgets],
+            [owner.pk for owner in owners]
+        )
+
+        with self.assertNumQueries(0):
+            BudgetLoader.prefetch_budgets(owners)
+
+    def test_prefetch_owner_without_budget(self):
+        event = Event.objects.get(pk=self.events[0].pk)
+        Budget.objects.filter(
+            content_type=ContentType.objects.get_for_model(Event),
+            object_id=event.pk,
+        ).delete()
+
+        BudgetLoader.prefetch_budgets([event])
+        with self.assertNumQueries(0):
+            self.assertIsNone(event.budget)
+
+    def test_annotate_budget(self):
+        budget = self.events[0].budget
+        budget.start_amount = Decimal("250.00")
+        budget.save()
+        budget.recalc()
+
+        with self.assertNumQueries(1):
+            amounts = dict(
+                BudgetLoader.annotate_budget(Event.objects.all())
+                .values_list("pk", "budget_current_amount")
+            )
+
+        self.assertEqual(amounts[self.events[0].pk], Decimal("250.00"))
+        self.assertEqual(amounts[self.events[1].pk], Decimal("0"))
+
+
+class CategoryRegistryTest(TestCase):
+    def setUp(self):
+        self.salary = Category.objects.create(
+            name="Salary",
+            category_type=Category.Types.INCOME
+        )
+        self.food = Category.objects.create(
+            name="Food",
+            category_type=Category.Types.EXPENSE
+        )
+        self.archived = Category.objects.create(
+            name="Archived",
+            category_type=Category.Types.EXPENSE,
+            is_active=False,
+        )
+
+    def test_lookups_are_served_from_snapshot(self):
+        CategoryRegistry.all()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(CategoryRegistry.get(self.food.id), self.food)
+            self.assertEqual(CategoryRegistry.by_name("Salary"), self.salary)
+            self.assertEqual(
+                CategoryRegistry.by_type(Category.Types.EXPENSE),
+                [self.archived, self.food]
+            )
+            self.assertEqual(
+                CategoryRegistry.by_type(
+                    Category.Types.EXPENSE,
+                    active_only=True
+                ),
+                [self.food]
+            )
+
+    def test_writes_invalidate_snapshot(self):
+        CategoryRegistry.all()
+
+        self.food.name = "Groceries"
+        self.food.save()
+        self.assertEqual(CategoryRegistry.by_name("Groceries"), self.food)
+        self.assertIsNone(CategoryRegistry.by_name("Food"))
+
+        self.salary.delete()
+        self.assertNotIn(
+            "Salary",
+            [category.name for category in CategoryRegistry.all()]
+        )
+
+    def test_new_request_sees_other_workers_writes(self):
+        CategoryRegistry.all()
+        # a rename committed by another process: only the shared token
+        # changes, this process' signals never fire
+        Category.objects.filter(pk=self.food.pk).update(name="Groceries")
+        cache.set(CategoryRegistry.VERSION_KEY, "other-worker", None)
+        self.assertEqual(CategoryRegistry.by_name("Food"), self.food)
+
+        request_started.send(sender=self.__class__)
+
+        self.assertEqual(CategoryRegistry.by_name("Groceries"), self.food)
+        self.assertIsNone(CategoryRegistry.by_name("Food"))
+
+    def test_token_is_read_only_by_requests_using_the_registry(self):
+        CategoryRegistry.all()
+
+        # the token lives in the cache table, so reading it is a query
+        with self.assertNumQueries(0):
+            request_started.send(sender=self.__class__)
+
+        with self.assertNumQueries(1):
+            CategoryRegistry.by_name("Food")
+            CategoryRegistry.get(self.salary.id)
+
+    def test_transaction_clean_uses_registry(self):
+        user = User.objects.create_user(username="registry", password="x")
+        transaction = Transaction.objects.create(
+            amount=Decimal("5.00"),
+            transaction_type=Transaction.Types.EXPENSE,
+            target=user.budget,
+            payer=user,
+            category=self.food,
+        )
+        transaction = Transaction.objects.get(pk=transaction.pk)
+        CategoryRegistry.all()
+
+        transaction.transaction_type = Transaction.Types.INCOME
+        with self.assertNumQueries(0):
+            with self.assertRaises(ValidationError):
+                transaction.clean()
+
+
+class DailyRollupServiceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="rollups",
+            password="pass"
+        )
+        self.budget = self.user.budget
+        self.food = Category.objects.create(
+            name="Food",
+            category_type=Category.Types.EXPENSE
+        )
+        self.rent = Category.objects.create(
+            name="Rent",
+            category_type=Category.Types.EXPENSE
+        )
+        self.now = timezone.now()
+
+    def create_expense(self, amount, category, date=None):
+        return Transaction.objects.create(
+            amount=Decimal(amount),
+            transaction_type=Transaction.Types.EXPENSE,
+            target=self.budget,
+            payer=self.user,
+            category=category,
+            date=date or self.now,
+        )
+
+    def rollups(self):
+        return set(
+            DailyBudgetRollup.objects
+            .filter(count__gt=0)
+            .values_list(
+                "day", "transaction_type", "category_id", "count", "total"
+            )
+        )
+
+    def assert_matches_rebuild(self):
+        incremental = self.rollups()
+        DailyRollupService.rebuild([self.budget.id])
+        self.assertEqual(incremental, self.rollups())
+
+    def test_writes_keep_rollups_in_sync(self):
+        first = self.create_expense("10.00", self.food)
+        self.create_expense("5.50", self.food)
+        second = self.create_expense("20.00", self.rent)
+
+        row = DailyBudgetRollup.objects.get(category=self.food)
+        self.assertEqual(row.count, 2)
+        self.assertEqual(row.total, Decimal("15.50"))
+        self.assert_matches_rebuild()
+
+        first.category = self.rent
+        first.amount = Decimal("12.00")
+        first.date = self.now - timedelta(days=3)
+        first.save()
+        self.assert_matches_rebuild()
+
+        second.delete()
+        self.assert_matches_rebuild()
+        self.assertEqual(DailyBudgetRollup.objects.count(), 2)
+
+    def test_category_delete_merges_uncategorized_rows(self):
+        self.create_expense("10.00", self.food)
+        self.create_expense("5.00", self.rent)
+        self.create_expense("2.50", None)
+
+        self.food.delete()
+        self.rent.delete()
+        self.create_expense("1.00", None)
+
+        row = DailyBudgetRollup.objects.get(budget=self.budget)
+        self.assertIsNone(row.category_id)
+        self.assertEqual(row.count, 4)
+        self.assertEqual(row.total, Decimal("18.50"))
+        self.assert_matches_rebuild()
+
+    def test_deferred_bulk_writes_are_rebuilt(self):
+        with deferred_recalc() as touched:
+            Transaction.objects.bulk_create([
+                Transaction(
+                    amount=Decimal("1.00"),
+                    transaction_type=Transaction.Types.EXPENSE,
+                    target=self.budget,
+                    payer=self.user,
+                    category=self.food,
+                    date=self.now - timedelta(days=i % 3),
+                )
+                for i in range(9)
+            ])
+            touched.add(self.budget.id)
+
+        self.assertEqual(
+            DailyBudgetRollup.objects.filter(budget=self.budget).count(),
+            3
+        )
+        self.assertEqual(
+            sum(row[3] for row in self.rollups()),
+            9
+        )
+
+
+class ContributionServiceTest(TestCase):
+    def setUp(self):
+        self.alice = User.objects.create_user(
+            username="alice",
+            password="pass"
+        )
+        self.bob = User.objects.create_user(username="bob", password="pass")
+        self.event = Event.objects.create(name="Trip", planned_amount=200)
+        self.budget = self.event.budget
+
+    def add_income(self, amount, payer):
+        return Transaction.objects.create(
+            amount=Decimal(amount),
+            transaction_type=Transaction.Types.INCOME,
+            target=self.budget,
+            payer=payer,
+        )
+
+    def contributions(self):
+        return set(
+            BudgetContribution.objects.values_list(
+                "payer_id", "contributions", "total_contributed"
+            )
+        )
+
+    def assert_matches_rebuild(self):
+        incremental = self.contributions()
+        ContributionService.rebuild([self.budget.id])
+        self.assertEqual(incremental, self.contributions())
+
+    def test_writes_keep_contributions_in_sync(self):
+        first = self.add_income("30.00", self.alice)
+        self.add_income("20.00", self.alice)
+        self.add_income("40.00", self.bob)
+        self.assert_matches_rebuild()
+
+        first.payer = self.bob
+        first.save()
+        self.assert_matches_rebuild()
+
+        first.transaction_type = Transaction.Types.EXPENSE
+        first.save()
+        self.assert_matches_rebuild()
+
+        first.delete()
+        self.assert_matches_rebuild()
+        self.assertEqual(
+            self.contributions(),
+            {
+                (self.alice.id, 1, Decimal("20.00")),
+                (self.bob.id, 1, Decimal("40.00")),
+            }
+        )
+
+    def test_leaderboard_and_share(self):
+        self.add_income("30.00", self.alice)
+        self.add_income("70.00", self.bob)
+        self.budget.refresh_from_db()
+
+        with self.assertNumQueries(1):
+            leaderboard = ContributionService.leaderboard(self.budget)
+
+        self.assertEqual(
+            [row["payer__username"] for row in leaderboard],
+            ["bob", "alice"]
+        )
+        self.assertEqual(leaderboard[0]["total_contributed"], Decimal("70"))
+        self.assertEqual(
+            ContributionService.share_of(self.budget, self.alice.id),
+            {"total_contributed": Decimal("30"), "percent": Decimal("30.0")}
+        )
+        self.assertEqual(
+            ContributionService.member_progress(self.budget)[0]["percent"],
+            Decimal("35.0")
+        )
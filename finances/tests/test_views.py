@@ -1,4 +1,5 @@
 from decimal import Decimal
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
@@ -148,3 +149,90 @@ class FinancesViewsTest(TestCase):
         response = self.client.get(f"{url}?transaction_type=Expense")
         self.assertContains(response, self.expense_cat.name)
         self.assertNotContains(response, self.income_cat.name)
+
+    def test_transaction_import_view(self):
+        statement = SimpleUploadedFile(
+            "statement.csv",
+            b"date,amount,category,note\n2025-01-01,200.00,Salary,Bonus\n",
+            content_type="text/csv",
+        )
+
+        response = self.client.post(
+            reverse("transaction-import"),
+            {"statement": statement, "file_format": "csv"},
+        )
+
+        self.assertRedirects(
+            response,
+            reverse(
+                "transfer-history",
+                kwargs={"target": "user", "pk": self.user.id}
+            ),
+        )
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.current_amount, Decimal("1200.00"))
+
+    def test_transaction_list_keyset_pages(self):
+        Transaction.objects.bulk_create([
+            Transaction(
+                amount=Decimal("1.00"),
+                target=self.budget,
+                payer=self.user,
+                note=f"row-{i}",
+            )
+            for i in range(45)
+        ])
+        url = reverse(
+            "transfer-history",
+            kwargs={"target": "user", "pk": self.user.id}
+        )
+
+        seen = []
+        response = self.client.get(url, {"count": "exact"})
+        self.assertEqual(response.context["total_count"], 45)
+        while True:
+            seen.extend(t.id for t in response.context["transaction_list"])
+            query = response.context.get("next_page_query")
+            if not query:
+                break
+            response = self.client.get(
+                f"{url}?{query}",
+                HTTP_HX_REQUEST="true"
+            )
+            self.assertIsNone(response.context["total_count"])
+
+        self.assertEqual(len(seen), 45)
+        self.assertEqual(len(set(seen)), 45)
+
+    def test_transaction_list_invalid_cursor(self):
+        url = reverse(
+            "transfer-history",
+            kwargs={"target": "user", "pk": self.user.id}
+        )
+        response = self.client.get(url, {"cursor": "broken"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_transaction_export_view(self):
+        Transaction.objects.create(
+            amount=Decimal("20.00"),
+            transaction_type=Transaction.Types.EXPENSE,
+            target=self.budget,
+            payer=self.user,
+            category=self.expense_cat,
+            note="Dinner",
+        )
+        url = reverse(
+            "transfer-history-export",
+            kwargs={"target": "user", "pk": self.user.id}
+        )
+
+        response = self.client.get(url, {"search": "dinner"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment", response["Content-Disposition"])
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("Dinner", lines[1])
+
+        response = self.client.get(url, {"format": "xml"})
+        self.assertEqual(response.status_code, 404)
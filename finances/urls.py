@@ -6,9 +6,11 @@ from finances.views import (
     TransferCreateView,
     TopUpBudgetView,
     TransactionListView,
+    TransactionExportView,
     CategoryOptionsView,
     SetExpenseBudgetView,
     TransactionDeleteView,
+    TransactionImportView,
 )
 
 urlpatterns = [
@@ -37,6 +39,11 @@ urlpatterns = [
         TransactionListView.as_view(),
         name="transfer-history",
     ),
+    path(
+        "<str:target>/history/<int:pk>/export/",
+        TransactionExportView.as_view(),
+        name="transfer-history-export",
+    ),
     path(
         "ajax/categories/",
         CategoryOptionsView.as_view(),
@@ -46,5 +53,10 @@ urlpatterns = [
         "delete-transaction/<int:pk>/",
         TransactionDeleteView.as_view(),
         name="transaction_delete",
-    )
+    ),
+    path(
+        "transactions/import/",
+        TransactionImportView.as_view(),
+        name="transaction-import",
+    ),
 ]
@@ -1,10 +1,17 @@
+import io
 from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q, QuerySet
-from django.http import HttpResponseRedirect, HttpRequest, HttpResponse
+from django.db.models import QuerySet
+from django.http import (
+    Http404,
+    HttpResponseRedirect,
+    HttpRequest,
+    HttpResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils import timezone
@@ -14,16 +21,22 @@ from django.views.generic import (
     UpdateView,
     ListView,
     DeleteView,
+    FormView,
 )
 
-from finances.models import Budget, Transaction, Category
+from finances.models import Budget, Transaction
 from finances.forms import (
     UpdateBudgetForm,
     TransferCreateForm,
     TopUpBudgetForm,
-    SetExpenseBudgetForm
+    SetExpenseBudgetForm,
+    TransactionImportForm,
 )
+from finances.services.category_registry import CategoryRegistry
+from finances.services.export_service import TransactionExportService
 from finances.services.history_service import TransactionHistoryService
+from finances.services.import_service import TransactionImportService
+from finances.services.keyset_pagination import KeysetPaginator
 from finances.services.transfers_service import TransfersService
 
 User = get_user_model()
@@ -134,47 +147,55 @@ class TransactionListView(LoginRequiredMixin, ListView):
     context_object_name = "transaction_list"
 
     paginate_by = 20
+    count_mode = "none"
 
     def get_queryset(self) -> QuerySet[Transaction]:
-        target = self.kwargs.get("target")
-        pk = self.kwargs.get("pk")
-
-        if target == "user":
-            queryset = TransactionHistoryService.get_user_transactions(
-                user_id=pk
-            )
-        elif target == "event":
-            queryset = TransactionHistoryService.get_event_transactions(
-                event_id=pk
-            )
-        elif target == "group":
-            queryset = TransactionHistoryService.get_group_transactions(
-                group_id=pk
-            )
-        else:
-            return Transaction.objects.none()
-
-        search = self.request.GET.get("search")
-        if search:
-            queryset = queryset.filter(
-                Q(note__icontains=search)
-                | Q(category__name__icontains=search)
-            ).distinct()
-
-        t_type = self.request.GET.get("type")
-        if t_type in [Transaction.Types.INCOME, Transaction.Types.EXPENSE]:
-            queryset = queryset.filter(transaction_type=t_type)
+        queryset = TransactionHistoryService.get_target_transactions(
+            target=self.kwargs.get("target"),
+            pk=self.kwargs.get("pk"),
+        )
+        return TransactionHistoryService.apply_filters(
+            queryset,
+            self.request.GET
+        )
 
-        date_from = self.request.GET.get("date_from")
-        if date_from:
-            queryset = queryset.filter(date__gte=date_from)
+    def paginate_queryset(
+            self,
+            queryset: QuerySet[Transaction],
+            page_size: int
+    ) -> tuple:
+        paginator = KeysetPaginator(
+            queryset.select_related("category", "payer"),
+            page_size,
+        )
+        try:
+            page = paginator.get_page(self.request.GET.get("cursor"))
+        except ValueError:
+            raise Http404("Invalid pagination cursor")
 
-        return queryset
+        return paginator, page, page.object_list, page.has_next
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["target"] = self.kwargs.get("target")
         context["pk"] = self.kwargs.get("pk")
+
+        page = context["page_obj"]
+        if page.has_next:
+            params = self.request.GET.copy()
+            params["cursor"] = page.next_cursor
+            params.pop("count", None)
+            context["next_page_query"] = params.urlencode()
+
+        context["total_count"] = None
+        count_mode = self.request.GET.get("count", self.count_mode)
+        if (
+                "cursor" not in self.request.GET
+                and count_mode in KeysetPaginator.count_modes
+        ):
+            context["total_count"] = context["paginator"].count(count_mode)
+            context["count_is_estimate"] = count_mode == "estimate"
+
         return context
 
     def get_template_names(self) -> list[str]:
@@ -183,18 +204,46 @@ class TransactionListView(LoginRequiredMixin, ListView):
         return [self.template_name]
 
 
+class TransactionExportView(LoginRequiredMixin, View):
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        file_format = request.GET.get("format", "csv")
+        if file_format not in TransactionExportService.FORMATS:
+            raise Http404("Unsupported export format")
+
+        queryset = TransactionHistoryService.apply_filters(
+            TransactionHistoryService.get_target_transactions(
+                target=kwargs.get("target"),
+                pk=kwargs.get("pk"),
+            ),
+            request.GET,
+        )
+
+        response = StreamingHttpResponse(
+            TransactionExportService.stream(queryset, file_format),
+            content_type=TransactionExportService.CONTENT_TYPES[file_format],
+        )
+        filename = (
+            f"{kwargs.get('target')}-{kwargs.get('pk')}-transactions"
+            f".{file_format}"
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{filename}"'
+        )
+        return response
+
+
 class CategoryOptionsView(LoginRequiredMixin, View):
     def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         category_type = (kwargs.get("transaction_type")
                          or request.GET.get("transaction_type"))
 
-        categories = Category.objects.filter(is_active=True)
-
         if category_type:
-            categories = categories.filter(
-                category_type=category_type
-            ).order_by(
-                "order_index", "name")
+            categories = CategoryRegistry.by_type(
+                category_type,
+                active_only=True
+            )
+        else:
+            categories = CategoryRegistry.all(active_only=True)
 
         return render(
             request,
@@ -211,3 +260,33 @@ class TransactionDeleteView(LoginRequiredMixin, DeleteView):
             "transfer-history",
             kwargs={"target": "user", "pk": self.request.user.pk}
         )
+
+
+class TransactionImportView(LoginRequiredMixin, FormView):
+    form_class = TransactionImportForm
+    template_name = "transactions/transaction_import.html"
+
+    def form_valid(self, form) -> HttpResponse:
+        uploaded = form.cleaned_data["statement"]
+        lines = io.TextIOWrapper(
+            uploaded.file,
+            encoding="utf-8-sig",
+            errors="replace",
+            newline="",
+        )
+
+        report = TransactionImportService.import_rows(
+            lines=lines,
+            file_format=form.cleaned_data["file_format"],
+            payer=self.request.user,
+        )
+
+        messages.success(self.request, report.summary())
+        for error in report.errors:
+            messages.warning(self.request, error)
+
+        return redirect(
+            "transfer-history",
+            target="user",
+            pk=self.request.user.pk,
+        )
@@ -1,7 +1,8 @@
 from django import forms
+from django.contrib.auth import get_user_model
 from django.forms import ModelForm
 
-from accounts.services.receive_connection import UserConnectionsService
+from accounts.services.connection_graph import ConnectionGraph
 from events.models import Event
 from groups.models import Group
 
@@ -43,16 +44,13 @@ class GroupCreateForm(ModelForm):
         user = kwargs.pop("user")
         super().__init__(*args, **kwargs)
 
-        connections = UserConnectionsService.get_user_connections(
-            user.id,
-            "accepted"
+        self.fields["participants"].choices = list(
+            get_user_model().objects
+            .filter(id__in=ConnectionGraph.neighbours(user.id))
+            .order_by("username")
+            .values_list("id", "username")
         )
 
-        self.fields["participants"].choices = [
-            (c.other_user(user).id, c.other_user(user).username) for c in
-            connections
-        ]
-
 
 class GroupEditForm(ModelForm):
     class Meta:
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-18 11:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("groups", "0004_alter_groupmembership_group_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="group",
+            name="state",
+            field=models.CharField(
+                choices=[
+                    ("Permanent", "Permanent"),
+                    ("Temporary", "Temporary"),
+                    ("Expired", "Expired"),
+                ],
+                default="Permanent",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="group",
+            index=models.Index(fields=["state", "end_date"], name="group_state_end"),
+        ),
+    ]
@@ -15,6 +15,7 @@ class Group(models.Model):
     class States(models.TextChoices):
         PERMANENT = "Permanent"
         TEMPORARY = "Temporary"
+        EXPIRED = "Expired"
 
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -37,6 +38,12 @@ class Group(models.Model):
 
     class Meta:
         db_table = "a_groups"
+        indexes = [
+            models.Index(
+                fields=["state", "end_date"],
+                name="group_state_end",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.state})"
@@ -1,6 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from events.models import Event
 from groups.forms import GroupCreateForm, GroupEventCreateForm
@@ -17,23 +17,17 @@ class GroupFormsTest(TestCase):
             password="1Qazcde3"
         )
 
-    @patch(
-        "accounts.services.receive_connection"
-        ".UserConnectionsService.get_user_connections")
+    @patch("groups.forms.ConnectionGraph.neighbours")
     def test_group_create_form_participants_initialization(
             self,
-            mock_connections
+            mock_neighbours
     ):
-        mock_friend = MagicMock()
-        mock_friend.id = 99
-        mock_friend.username = "friend_user"
-        mock_conn = MagicMock()
-        mock_conn.other_user.return_value = mock_friend
-        mock_connections.return_value = [mock_conn]
+        friend = User.objects.create_user(username="friend_user")
+        mock_neighbours.return_value = {friend.id}
         form = GroupCreateForm(user=self.user)
         choices = form.fields["participants"].choices
         self.assertEqual(len(choices), 1)
-        self.assertEqual(choices[0], (99, "friend_user"))
+        self.assertEqual(choices[0], (friend.id, "friend_user"))
 
     def test_group_create_form_permanent_invalid_dates(self):
         form_data = {
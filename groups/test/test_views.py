@@ -50,11 +50,8 @@ class GroupsViewsTest(TestCase):
     @patch(
         "groups.services.group_invitation"
         ".GroupInvitationService.create_group_invitation")
-    @patch(
-        "accounts.services.receive_connection"
-        ".UserConnectionsService.get_user_connections")
-    def test_group_create_post(self, mock_connections, mock_invite_service):
-        mock_connections.return_value = []
+    @patch("groups.forms.ConnectionGraph.neighbours", return_value=set())
+    def test_group_create_post(self, mock_neighbours, mock_invite_service):
         url = reverse("groups:create")
         data = {
             "name": "Brand New Group",
@@ -155,3 +152,14 @@ class GroupsViewsTest(TestCase):
             ).exists()
         )
         self.assertRedirects(response, reverse("groups:home"))
+
+    def test_consolidated_budget_view(self):
+        response = self.client.get(
+            reverse("groups:consolidated", kwargs={"pk": self.group.id})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["consolidated"].breakdown[0].name,
+            "My Group"
+        )
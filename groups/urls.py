@@ -4,6 +4,7 @@ from groups.views import (
     GroupsHomeView,
     GroupCreateView,
     GroupDetailView,
+    GroupConsolidatedBudgetView,
     GroupDeleteView,
     GroupInviteMemberView,
     GroupAcceptInviteView,
@@ -19,6 +20,11 @@ urlpatterns = [
     path("", GroupsHomeView.as_view(), name="home"),
     path("create-group/", GroupCreateView.as_view(), name="create"),
     path("detail/<int:pk>/", GroupDetailView.as_view(), name="detail"),
+    path(
+        "detail/<int:pk>/consolidated/",
+        GroupConsolidatedBudgetView.as_view(),
+        name="consolidated",
+    ),
     path("update/<int:pk>/", GroupEditView.as_view(), name="update"),
     path("delete/<int:pk>/", GroupDeleteView.as_view(), name="delete"),
     path(
@@ -1,5 +1,6 @@
 from typing import Any
 
+from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import ValidationError
 from django.db import transaction
@@ -15,12 +16,13 @@ from django.views.generic import (
     DeleteView,
 )
 
-from accounts.services.receive_connection import UserConnectionsService
+from accounts.services.connection_graph import ConnectionGraph
 from addition_info.choise_models import Status, Role
 from dashboard.services.group_stats import GroupStatsService
 from events.models import Event
 from finances.custom_mixins import SuccessUrlFromNextMixin
 from finances.forms import TransferCreateForm, BudgetEditForm
+from finances.services.budget_loader import BudgetLoader
 from groups.forms import GroupCreateForm, GroupEditForm, GroupEventCreateForm
 from groups.models import Group, GroupMembership
 from groups.services.group_event_service import GroupEventService
@@ -37,7 +39,7 @@ class GroupsHomeView(LoginRequiredMixin, TemplateView):
             Q(creator=user)
             | Q(memberships__user=user, memberships__status=Status.ACCEPTED)
         ).distinct()
-        context["groups"] = groups
+        context["groups"] = BudgetLoader.prefetch_budgets(groups)
 
         context["invites"] = GroupMembership.objects.filter(
             user_id=user.id,
@@ -89,7 +91,7 @@ class GroupDetailView(LoginRequiredMixin, SuccessUrlFromNextMixin, DetailView):
             group=group
         ).select_related("user")
 
-        member_ids = set(members_qs.values_list("user_id", flat=True))
+        member_ids = {member.user_id for member in members_qs}
 
         user_membership = next((
             member
@@ -99,14 +101,9 @@ class GroupDetailView(LoginRequiredMixin, SuccessUrlFromNextMixin, DetailView):
         )
         user_role = user_membership.role if user_membership else None
 
-        potential_invites = [
-            connect.other_user(user)
-            for connect in UserConnectionsService.get_user_connections(
-                user.id,
-                "accepted"
-            )
-            if connect.other_user(user).id not in member_ids
-        ]
+        potential_invites = get_user_model().objects.filter(
+            id__in=ConnectionGraph.neighbours(user.id) - member_ids
+        ).order_by("username")
 
         try:
             budget = group.budget
@@ -120,9 +117,6 @@ class GroupDetailView(LoginRequiredMixin, SuccessUrlFromNextMixin, DetailView):
             context["transaction_history"] = []
 
         delete_permission = "Creator" if group.creator_id else "Admin"
-        bar_cart_data = GroupStatsService.get_bar_chart_data(
-            pk=group.id
-        )
 
         context.update({
             "related_events": GroupEventService.get_events_for_group(
@@ -135,12 +129,28 @@ class GroupDetailView(LoginRequiredMixin, SuccessUrlFromNextMixin, DetailView):
             "user_role": user_role,
             "connects": potential_invites,
             "members": members_qs,
-            "chart_data": bar_cart_data,
         })
 
         return context
 
 
+class GroupConsolidatedBudgetView(LoginRequiredMixin, DetailView):
+    """
+    Budget of the group and its linked events, loaded into the group
+    page on demand.
+    """
+
+    model = Group
+    template_name = "groups/components/consolidated_budget.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["consolidated"] = GroupStatsService.get_consolidated(
+            self.object
+        )
+        return context
+
+
 class GroupEditView(LoginRequiredMixin, View):
     template_name = "groups/group_update.html"
 